@@ -0,0 +1,128 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
+
+import "@openzeppelin/contracts/math/SafeMath.sol";
+import "@openzeppelin/contracts/utils/Address.sol";
+
+interface IHarvestable {
+    function harvestTrigger(uint256 callCostinEth) external view returns (bool);
+
+    function harvest() external;
+}
+
+// Harvests many of our strategies in one transaction, so our keepers pay the base transaction cost once instead of once
+// per clone. Each strategy is checked with harvestTrigger() and harvested only if it's due, and a strategy that reverts
+// is skipped without undoing the others. Every call gets its own gas limit, so one strategy running out of gas can't
+// take the rest of the batch with it. This contract has to be each strategy's keeper.
+contract BatchHarvester {
+    using SafeMath for uint256;
+    using Address for address;
+
+    struct Result {
+        address strategy;
+        bool triggered;
+        bool harvested;
+        uint256 gasUsed;
+    }
+
+    uint256 internal constant TRIGGER_GAS = 250_000; // harvestTrigger with harvestOnProfit reads our gauge and oracles
+    uint256 internal constant RESERVE_GAS = 50_000; // enough to record a harvest and finish our loop
+
+    address public owner;
+    mapping(address => bool) public keepers;
+
+    event StrategyHarvested(address indexed strategy, uint256 gasUsed);
+    event HarvestFailed(address indexed strategy, uint256 gasUsed, bytes reason);
+    event OutOfGas(address indexed strategy, uint256 gasLeft);
+
+    constructor() public {
+        owner = msg.sender;
+        keepers[msg.sender] = true;
+    }
+
+    modifier onlyKeepers() {
+        require(keepers[msg.sender], "!keeper");
+        _;
+    }
+
+    ///@notice Check and harvest each strategy, returning what happened to each and the gas each harvest used. Each
+    /// harvest gets at most _harvestGasLimit. We stop at the first strategy we don't have that much gas left for.
+    function harvestDue(
+        address[] calldata _strategies,
+        uint256 _callCostinEth,
+        uint256 _harvestGasLimit
+    ) external onlyKeepers returns (Result[] memory _results) {
+        _results = new Result[](_strategies.length);
+        for (uint256 i = 0; i < _strategies.length; i++) {
+            address _strategy = _strategies[i];
+            _results[i].strategy = _strategy;
+
+            // an address without code has nothing to harvest
+            if (!_strategy.isContract()) {
+                continue;
+            }
+            // a call only gets 63/64 of our gas, so make sure that's still its full limit. anything after this strategy
+            // would be short too, so we're done.
+            if (gasleft() < _withCallGas(TRIGGER_GAS)) {
+                emit OutOfGas(_strategy, gasleft());
+                break;
+            }
+            _results[i].triggered = _harvestTrigger(_strategy, _callCostinEth);
+            if (!_results[i].triggered) {
+                continue;
+            }
+
+            if (gasleft() < _withCallGas(_harvestGasLimit)) {
+                emit OutOfGas(_strategy, gasleft());
+                break;
+            }
+            uint256 _gasStart = gasleft();
+            try IHarvestable(_strategy).harvest{gas: _harvestGasLimit}() {
+                _results[i].harvested = true;
+                _results[i].gasUsed = _gasStart - gasleft();
+                emit StrategyHarvested(_strategy, _results[i].gasUsed);
+            } catch (bytes memory _reason) {
+                _results[i].gasUsed = _gasStart - gasleft();
+                emit HarvestFailed(_strategy, _results[i].gasUsed, _reason);
+            }
+        }
+    }
+
+    // try/catch can't catch a return it can't decode, so a contract without harvestTrigger whose fallback returns
+    // nothing would revert our whole batch. call it ourselves and only take a 32 byte true.
+    function _harvestTrigger(address _strategy, uint256 _callCostinEth)
+        internal
+        view
+        returns (bool)
+    {
+        (bool _success, bytes memory _data) =
+            _strategy.staticcall{gas: TRIGGER_GAS}(
+                abi.encodeWithSelector(
+                    IHarvestable.harvestTrigger.selector,
+                    _callCostinEth
+                )
+            );
+        return
+            _success &&
+            _data.length == 32 &&
+            abi.decode(_data, (uint256)) == 1;
+    }
+
+    // what we need left to give a call _gas and still finish our loop
+    function _withCallGas(uint256 _gas) internal pure returns (uint256) {
+        return _gas.mul(64).div(63).add(RESERVE_GAS);
+    }
+
+    /* ========== SETTERS ========== */
+
+    function setKeeper(address _keeper, bool _allowed) external {
+        require(msg.sender == owner, "!owner");
+        keepers[_keeper] = _allowed;
+    }
+
+    function setOwner(address _owner) external {
+        require(msg.sender == owner, "!owner");
+        owner = _owner;
+    }
+}
@@ -17,6 +17,12 @@ import {
 
 interface IBaseFee {
     function isCurrentBaseFeeAcceptable() external view returns (bool);
+
+    function baseFeeProvider() external view returns (address);
+}
+
+interface IBaseFeeProvider {
+    function basefee_global() external view returns (uint256);
 }
 
 interface IUniV3 {
@@ -60,6 +66,7 @@ abstract contract StrategyCurveBase is BaseStrategy {
 
     uint256 public creditThreshold; // amount of credit in underlying tokens that will automatically trigger a harvest
     bool internal forceHarvestTriggerOnce; // only set this to true when we want to trigger our keepers to harvest for us
+    bool public harvestOnProfit; // harvest once our claimable profit is worth profitFactor times our keeper's gas
 
     string internal stratName;
 
@@ -152,7 +159,9 @@ abstract contract StrategyCurveBase is BaseStrategy {
         proxy = ICurveStrategyProxy(_proxy);
     }
 
-    // Set the amount of CRV to be locked in Yearn's veCRV voter from each harvest. Default is 10%.
+    // Set the amount of CRV to be locked in Yearn's veCRV voter from each harvest. Default is 10%. This only applies to
+    // CRV we claim in that harvest; CRV we held over because it wasn't worth selling, or that was sent to us, isn't
+    // taken from again.
     function setKeepCRV(uint256 _keepCRV) external onlyVaultManagers {
         require(_keepCRV <= 10_000);
         keepCRV = _keepCRV;
@@ -175,9 +184,19 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
     address public curve; ///@notice This is our curve pool specific to this vault
     ICurveFi internal constant zapContract =
         ICurveFi(0xA79828DF1850E8a3A3064576f380D90aECDD3359); // this is used for depositing to all 3Crv metapools
+    ICurveFi internal constant threePool =
+        ICurveFi(0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7); // or we can deposit to 3pool ourselves, then to our metapool
+    IERC20 internal constant threeCrv =
+        IERC20(0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490);
 
     ICurveFi internal constant crveth =
         ICurveFi(0x8301AE4fc9c624d1D396cbDAa1ed877821D7C511); // use curve's new CRV-ETH crypto pool to sell our CRV
+    ICurveFi internal constant tricrypto =
+        ICurveFi(0xD51a44d3FaE010294C616388b506AcdA1bfAAE46); // we only use tricrypto's price oracle for ETH in USD
+    address internal constant crvMinter =
+        0xd061D61a4d941c39E5453435B6345Dc261C2fcE0;
+    address internal constant gaugeController =
+        0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB;
 
     // we use these to deposit to our curve pool
     address public targetStable; ///@notice This is the stablecoin we are using to take profits and deposit into 3Crv.
@@ -190,11 +209,17 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
     IERC20 internal constant dai =
         IERC20(0x6B175474E89094C44Da98b954EedeAC495271d0F);
     uint24 public uniStableFee; // this is equal to 0.05%, can change this later if a different path becomes more optimal
+    bool public depositThroughZap; // deposit with the zap, or go through 3pool and then our metapool ourselves
+
+    // we price our sales' gas with Yearn's base fee oracle, and only sell once they make us more than they cost
+    address internal constant baseFeeOracle =
+        0xb5e1CAcB567d98faaDB60a1fD4820720141f064F;
+    uint256 public crvSellGas; // CRV -> WETH on crveth
+    uint256 public wethSellGas; // WETH -> stable on UniV3, plus our deposit to Curve
 
     // rewards token info. we can have more than 1 reward token but this is rare, so we don't include this in the template
     IERC20 public rewardsToken;
     bool public hasRewards;
-    address[] internal rewardsPath;
 
     // check for cloning
     bool internal isOriginal = true;
@@ -312,6 +337,14 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
 
         // set our uniswap pool fees
         uniStableFee = 500;
+
+        // rough gas for each leg of our sale. measure our pool's with scripts/sell_gas.py and update these.
+        crvSellGas = 150_000;
+        wethSellGas = 350_000;
+
+        // the zap works for every metapool, so start with it. check tests/test_gas_benchmarks.py or
+        // scripts/deposit_path.py to see if going direct is cheaper for our pool.
+        depositThroughZap = true;
     }
 
     /* ========== MUTATIVE FUNCTIONS ========== */
@@ -325,55 +358,57 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
             uint256 _debtPayment
         )
     {
+        // read our settings from storage once, since we use most of them more than once
+        ICurveStrategyProxy _proxy = proxy;
+        address _gauge = gauge;
+        address _targetStable = targetStable;
+
         // if we have anything in the gauge, then harvest CRV from the gauge
-        uint256 _stakedBal = stakedBalance();
-        uint256 _crvBalance = crv.balanceOf(address(this));
+        uint256 _stakedBal = _proxy.balanceOf(_gauge);
+        uint256 _crvBalance;
         if (_stakedBal > 0) {
-            proxy.harvest(gauge);
+            // any CRV we didn't sell last time has already had keepCRV taken out
+            uint256 _unsoldCrv = crv.balanceOf(address(this));
+            _proxy.harvest(_gauge);
             _crvBalance = crv.balanceOf(address(this));
-            // if we claimed any CRV, then sell it
-            if (_crvBalance > 0) {
-                // keep some of our CRV to increase our boost
-                uint256 _sendToVoter =
-                    _crvBalance.mul(keepCRV).div(FEE_DENOMINATOR);
-                if (_sendToVoter > 0) {
-                    crv.safeTransfer(voter, _sendToVoter);
-                }
+            // keep some of the CRV we just claimed to increase our boost
+            uint256 _sendToVoter =
+                _crvBalance.sub(_unsoldCrv).mul(keepCRV).div(FEE_DENOMINATOR);
+            if (_sendToVoter > 0) {
+                crv.safeTransfer(voter, _sendToVoter);
                 _crvBalance -= _sendToVoter;
             }
+        } else {
+            _crvBalance = crv.balanceOf(address(this));
         }
 
         if (hasRewards) {
-            proxy.claimRewards(gauge, address(rewardsToken));
-            uint256 _rewardsBalance = rewardsToken.balanceOf(address(this));
+            IERC20 _rewardsToken = rewardsToken;
+            _proxy.claimRewards(_gauge, address(_rewardsToken));
+            uint256 _rewardsBalance = _rewardsToken.balanceOf(address(this));
             if (_rewardsBalance > 0) {
-                _sellRewards(_rewardsBalance);
+                _sellRewards(_rewardsToken, _rewardsBalance);
             }
         }
 
         // do this even if we don't have any CRV, in case we have WETH
-        _sell(_crvBalance);
+        _sell(_crvBalance, _targetStable);
 
-        // check for balances of tokens to deposit
-        uint256 _daiBalance = dai.balanceOf(address(this));
-        uint256 _usdcBalance = usdc.balanceOf(address(this));
-        uint256 _usdtBalance = usdt.balanceOf(address(this));
+        // we only ever sell into our targetStable, so that's the only balance we need to check. we never deposit any
+        // other stable sent here, governance has to sweep it instead.
+        uint256 _stableBalance = IERC20(_targetStable).balanceOf(address(this));
 
         // deposit our balance to Curve if we have any
-        if (_daiBalance > 0 || _usdcBalance > 0 || _usdtBalance > 0) {
-            zapContract.add_liquidity(
-                curve,
-                [0, _daiBalance, _usdcBalance, _usdtBalance],
-                0
-            );
+        if (_stableBalance > 0) {
+            _deposit(_targetStable, _stableBalance);
         }
 
         // debtOustanding will only be > 0 in the event of revoking or if we need to rebalance from a withdrawal or lowering the debtRatio
         if (_debtOutstanding > 0) {
             if (_stakedBal > 0) {
                 // don't bother withdrawing if we don't have staked funds
-                proxy.withdraw(
-                    gauge,
+                _proxy.withdraw(
+                    _gauge,
                     address(want),
                     Math.min(_stakedBal, _debtOutstanding)
                 );
@@ -410,24 +445,62 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
             proxy.withdraw(gauge, address(want), _stakedBal);
         }
         crv.safeTransfer(_newStrategy, crv.balanceOf(address(this)));
+        // we may also be holding WETH that wasn't worth selling yet
+        uint256 _wethBalance = weth.balanceOf(address(this));
+        if (_wethBalance > 0) {
+            weth.safeTransfer(_newStrategy, _wethBalance);
+        }
     }
 
-    // Sells our harvested CRV into the selected output, then WETH -> stables together with any WETH from rewards on UniV3
-    function _sell(uint256 _crvAmount) internal {
-        if (_crvAmount > 1e17) {
-            // don't want to swap dust or we might revert
+    // Deposits our targetStable to our metapool, either through the zap or to 3pool and then our metapool directly
+    function _deposit(address _targetStable, uint256 _stableBalance) internal {
+        // 3pool's coins are [dai, usdc, usdt]
+        uint256 _index;
+        if (_targetStable == address(usdc)) {
+            _index = 1;
+        } else if (_targetStable == address(usdt)) {
+            _index = 2;
+        }
+
+        if (depositThroughZap) {
+            // the zap's coins are [our metapool's coin, dai, usdc, usdt]
+            uint256[4] memory _zapAmounts;
+            _zapAmounts[_index + 1] = _stableBalance;
+            zapContract.add_liquidity(curve, _zapAmounts, 0);
+        } else {
+            uint256[3] memory _amounts;
+            _amounts[_index] = _stableBalance;
+            threePool.add_liquidity(_amounts, 0);
+            ICurveFi(curve).add_liquidity(
+                [uint256(0), threeCrv.balanceOf(address(this))],
+                0
+            );
+        }
+    }
+
+    // Sells our harvested CRV into the selected output, then WETH -> stables together with any WETH from rewards on UniV3.
+    // We only sell when what we get is worth more than the gas it costs at the current base fee, using crveth's price
+    // oracle to value our CRV. Anything we don't sell waits for our next harvest.
+    function _sell(uint256 _crvAmount, address _targetStable) internal {
+        uint256 _baseFee = _currentBaseFee();
+
+        // don't want to swap dust or we might revert
+        if (
+            _crvAmount > 1e17 &&
+            _crvAmount.mul(crveth.price_oracle()).div(1e18) >
+            _baseFee.mul(crvSellGas)
+        ) {
             crveth.exchange(1, 0, _crvAmount, 0, false);
         }
 
         uint256 _wethBalance = weth.balanceOf(address(this));
-        if (_wethBalance > 1e15) {
-            // don't want to swap dust or we might revert
+        if (_wethBalance > Math.max(1e15, _baseFee.mul(wethSellGas))) {
             IUniV3(uniswapv3).exactInput(
                 IUniV3.ExactInputParams(
                     abi.encodePacked(
                         address(weth),
                         uint24(uniStableFee),
-                        address(targetStable)
+                        _targetStable
                     ),
                     address(this),
                     block.timestamp,
@@ -439,11 +512,14 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
     }
 
     // Sells our harvested reward token into the selected output.
-    function _sellRewards(uint256 _amount) internal {
+    function _sellRewards(IERC20 _rewardsToken, uint256 _amount) internal {
+        address[] memory _path = new address[](2);
+        _path[0] = address(_rewardsToken);
+        _path[1] = address(weth);
         IUniswapV2Router02(sushiswap).swapExactTokensForTokens(
             _amount,
             uint256(0),
-            rewardsPath,
+            _path,
             address(this),
             block.timestamp
         );
@@ -478,8 +554,16 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
             return true;
         }
 
-        // harvest if we hit our minDelay, but only if our gas price is acceptable
-        if (block.timestamp.sub(params.lastReport) > minReportDelay) {
+        if (harvestOnProfit) {
+            // harvest once what we'd make is worth profitFactor times what it costs our keeper
+            if (
+                claimableProfitInWant() >
+                profitFactor.mul(ethToWant(callCostinEth))
+            ) {
+                return true;
+            }
+        } else if (block.timestamp.sub(params.lastReport) > minReportDelay) {
+            // harvest if we hit our minDelay, but only if our gas price is acceptable
             return true;
         }
 
@@ -492,19 +576,115 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
         return false;
     }
 
-    // convert our keeper's eth cost into want, we don't need this anymore since we don't use baseStrategy harvestTrigger
+    // convert our keeper's eth cost into want. tricrypto prices ETH in USD, and our pool's virtual price is USD per want.
     function ethToWant(uint256 _ethAmount)
         public
         view
         override
         returns (uint256)
-    {}
+    {
+        if (_ethAmount == 0) {
+            return 0;
+        }
+        uint256 _usdValue =
+            _ethAmount.mul(tricrypto.price_oracle(1)).div(1e18);
+        return _usdValue.mul(1e18).div(ICurveFi(curve).get_virtual_price());
+    }
+
+    ///@notice Rough value in want of our next harvest: the CRV and rewards we can claim (after keepCRV), plus any CRV or
+    /// WETH we didn't sell last time.
+    function claimableProfitInWant() public view returns (uint256) {
+        address _gauge = gauge;
+        uint256 _crvBalance =
+            _claimableCrv(_gauge)
+                .mul(FEE_DENOMINATOR.sub(keepCRV))
+                .div(FEE_DENOMINATOR)
+                .add(crv.balanceOf(address(this)));
+        uint256 _wethBalance =
+            weth.balanceOf(address(this)).add(
+                _crvBalance.mul(crveth.price_oracle()).div(1e18)
+            );
+
+        if (hasRewards) {
+            IERC20 _rewardsToken = rewardsToken;
+            uint256 _rewardsBalance =
+                IGauge(_gauge)
+                    .claimable_reward(voter, address(_rewardsToken))
+                    .add(_rewardsToken.balanceOf(address(this)));
+            if (_rewardsBalance > 0) {
+                address[] memory _path = new address[](2);
+                _path[0] = address(_rewardsToken);
+                _path[1] = address(weth);
+                // without a sushi pair our rewards are worth nothing to us yet, but that shouldn't break our trigger
+                try
+                    IUniswapV2Router02(sushiswap).getAmountsOut(
+                        _rewardsBalance,
+                        _path
+                    )
+                returns (uint256[] memory _amounts) {
+                    _wethBalance = _wethBalance.add(_amounts[1]);
+                } catch {}
+            }
+        }
+
+        return ethToWant(_wethBalance);
+    }
+
+    // CRV our voter can claim from our gauge. mainnet gauges checkpoint in claimable_tokens, so we can't call it from a
+    // view. instead we take what our voter had earned at its last checkpoint, and add its current rate since then like
+    // the gauge would. this is close, but it doesn't catch changes in our gauge's weight or rate since that checkpoint.
+    function _claimableCrv(address _gauge) internal view returns (uint256) {
+        IGauge _curveGauge = IGauge(_gauge);
+        uint256 _earned =
+            _curveGauge.integrate_fraction(voter).sub(
+                IMinter(crvMinter).minted(voter, _gauge)
+            );
+        uint256 _workingSupply = _curveGauge.working_supply();
+        if (_workingSupply == 0) {
+            return _earned;
+        }
+        // CRV per second for our whole gauge, then our share of it
+        uint256 _weight =
+            IGaugeController(gaugeController).gauge_relative_weight(_gauge);
+        uint256 _gaugeRate =
+            _curveGauge.inflation_rate().mul(_weight).div(1e18);
+        uint256 _ourRate =
+            _gaugeRate.mul(_curveGauge.working_balances(voter)).div(
+                _workingSupply
+            );
+        uint256 _sinceCheckpoint =
+            block.timestamp.sub(_curveGauge.integrate_checkpoint_of(voter));
+        return _earned.add(_ourRate.mul(_sinceCheckpoint));
+    }
 
     // check if the current baseFee is below our external target
     function isBaseFeeAcceptable() internal view returns (bool) {
-        return
-            IBaseFee(0xb5e1CAcB567d98faaDB60a1fD4820720141f064F)
-                .isCurrentBaseFeeAcceptable();
+        return IBaseFee(baseFeeOracle).isCurrentBaseFeeAcceptable();
+    }
+
+    // the current baseFee from our oracle's provider. if we can't read it (a broken provider, or a chain without our
+    // oracle), we return zero and always sell, instead of blocking our harvest.
+    function _currentBaseFee() internal view returns (uint256) {
+        // a call to an address without code reverts before try/catch can catch it
+        if (!Address.isContract(baseFeeOracle)) {
+            return 0;
+        }
+        try IBaseFee(baseFeeOracle).baseFeeProvider() returns (
+            address _provider
+        ) {
+            if (!Address.isContract(_provider)) {
+                return 0;
+            }
+            try IBaseFeeProvider(_provider).basefee_global() returns (
+                uint256 _baseFee
+            ) {
+                return _baseFee;
+            } catch {
+                return 0;
+            }
+        } catch {
+            return 0;
+        }
     }
 
     /* ========== SETTERS ========== */
@@ -524,6 +704,23 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
         }
     }
 
+    ///@notice Deposit through the zap, or to 3Pool and then our metapool directly. Use whichever costs less gas for our pool.
+    function setDepositThroughZap(bool _depositThroughZap)
+        external
+        onlyVaultManagers
+    {
+        if (!_depositThroughZap) {
+            // we can change targetStable at any time, so approve all of them. USDT can only be approved from zero.
+            dai.approve(address(threePool), type(uint256).max);
+            usdc.approve(address(threePool), type(uint256).max);
+            if (usdt.allowance(address(this), address(threePool)) == 0) {
+                usdt.safeApprove(address(threePool), type(uint256).max);
+            }
+            threeCrv.approve(curve, type(uint256).max);
+        }
+        depositThroughZap = _depositThroughZap;
+    }
+
     ///@notice Use to add, update or remove reward token
     function updateRewards(bool _hasRewards, address _rewardsToken)
         external
@@ -537,10 +734,9 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
             hasRewards = false;
             rewardsToken = IERC20(address(0));
         } else {
-            // approve, setup our path, and turn on rewards
+            // approve and turn on rewards, we build our sushi path when we sell
             rewardsToken = IERC20(_rewardsToken);
             rewardsToken.approve(sushiswap, type(uint256).max);
-            rewardsPath = [address(rewardsToken), address(weth)];
             hasRewards = true;
         }
     }
@@ -553,7 +749,25 @@ contract StrategyCurve3CrvRewardsClonable is StrategyCurveBase {
         creditThreshold = _creditThreshold;
     }
 
-    ///@notice Set the fee pool we'd like to swap through on UniV3 (1% = 10_000)
+    ///@notice Harvest once our claimable profit is worth profitFactor times our keeper's call cost, instead of at minReportDelay
+    function setHarvestOnProfit(bool _harvestOnProfit)
+        external
+        onlyVaultManagers
+    {
+        harvestOnProfit = _harvestOnProfit;
+    }
+
+    ///@notice Set the gas each leg of our sale costs, measured with scripts/sell_gas.py. We skip a leg until it's worth
+    /// more than its gas at the current base fee.
+    function setSellGas(uint256 _crvSellGas, uint256 _wethSellGas)
+        external
+        onlyVaultManagers
+    {
+        crvSellGas = _crvSellGas;
+        wethSellGas = _wethSellGas;
+    }
+
+        ///@notice Set the fee pool we'd like to swap through on UniV3 (1% = 10_000)
     function setUniFees(uint24 _stableFee) external onlyVaultManagers {
         uniStableFee = _stableFee;
     }
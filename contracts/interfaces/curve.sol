@@ -11,7 +11,18 @@ interface IGauge {
 
     function claim_rewards() external;
 
-    function claimable_tokens(address) external view returns (uint256);
+    // checkpoints our gauge first, so this is never a view on mainnet
+    function claimable_tokens(address) external returns (uint256);
+
+    function integrate_fraction(address) external view returns (uint256);
+
+    function integrate_checkpoint_of(address) external view returns (uint256);
+
+    function working_balances(address) external view returns (uint256);
+
+    function working_supply() external view returns (uint256);
+
+    function inflation_rate() external view returns (uint256);
 
     function claimable_reward(address _addressToCheck, address _rewardToken)
         external
@@ -105,6 +116,8 @@ interface ICurveFi {
 
     function price_oracle() external view returns (uint256);
 
+    function price_oracle(uint256 k) external view returns (uint256); // tricrypto
+
     function get_dy(
         int128 from,
         int128 to,
@@ -146,6 +159,15 @@ interface ICrvV3 is IERC20 {
     function minter() external view returns (address);
 }
 
+interface IGaugeController {
+    function gauge_relative_weight(address) external view returns (uint256);
+}
+
 interface IMinter {
     function mint(address) external;
+
+    function minted(address _for, address _gauge)
+        external
+        view
+        returns (uint256);
 }
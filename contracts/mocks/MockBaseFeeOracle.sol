@@ -0,0 +1,34 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+// Mock of Yearn's base fee oracle. Local chains don't give us a meaningful base fee, so we set one by hand.
+// We also stand in for the oracle's base fee provider, unless we're given a different one (like a broken one).
+contract MockBaseFeeOracle {
+    uint256 public maxAcceptableBaseFee;
+    uint256 public baseFee;
+    address internal provider;
+
+    function isCurrentBaseFeeAcceptable() external view returns (bool) {
+        return baseFee <= maxAcceptableBaseFee;
+    }
+
+    function baseFeeProvider() external view returns (address) {
+        return provider == address(0) ? address(this) : provider;
+    }
+
+    function basefee_global() external view returns (uint256) {
+        return baseFee;
+    }
+
+    function setMaxAcceptableBaseFee(uint256 _maxAcceptableBaseFee) external {
+        maxAcceptableBaseFee = _maxAcceptableBaseFee;
+    }
+
+    function setBaseFee(uint256 _baseFee) external {
+        baseFee = _baseFee;
+    }
+
+    function setBaseFeeProvider(address _provider) external {
+        provider = _provider;
+    }
+}
@@ -0,0 +1,62 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "@openzeppelin/contracts/math/SafeMath.sol";
+
+import "./MockERC20.sol";
+
+// Mock of Curve's 3pool. Every coin is worth $1, and we mint 3Crv at a virtual price of 1.
+contract MockCurve3Pool {
+    using SafeMath for uint256;
+
+    address public constant lp_token =
+        0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490;
+
+    /* ========== VIEWS ========== */
+
+    function coins(uint256 _index) public pure returns (address) {
+        return
+            [
+                0x6B175474E89094C44Da98b954EedeAC495271d0F,
+                0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48,
+                0xdAC17F958D2ee523a2206206994597C13D831ec7
+            ][_index];
+    }
+
+    function get_virtual_price() external pure returns (uint256) {
+        return 1e18;
+    }
+
+    function calc_token_amount(uint256[3] memory _amounts, bool)
+        public
+        view
+        returns (uint256 _value)
+    {
+        for (uint256 i = 0; i < 3; i++) {
+            if (_amounts[i] > 0) {
+                uint256 _decimals = MockERC20(coins(i)).decimals();
+                _value = _value.add(_amounts[i].mul(10**(18 - _decimals)));
+            }
+        }
+    }
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    function add_liquidity(
+        uint256[3] calldata _amounts,
+        uint256 _min_mint_amount
+    ) external {
+        uint256 _minted = calc_token_amount(_amounts, true);
+        require(_minted >= _min_mint_amount, "Slippage screwed you");
+        for (uint256 i = 0; i < 3; i++) {
+            if (_amounts[i] > 0) {
+                MockERC20(coins(i)).transferFrom(
+                    msg.sender,
+                    address(this),
+                    _amounts[i]
+                );
+            }
+        }
+        MockERC20(lp_token).mint(msg.sender, _minted);
+    }
+}
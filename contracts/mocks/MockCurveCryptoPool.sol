@@ -0,0 +1,68 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "@openzeppelin/contracts/math/SafeMath.sol";
+
+import "./MockERC20.sol";
+
+// Mock of Curve's CRV-ETH crypto pool. Swaps at a fixed price instead of running the crypto invariant.
+contract MockCurveCryptoPool {
+    using SafeMath for uint256;
+
+    address public constant weth = 0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2;
+    address public constant crv = 0xD533a949740bb3306d119CC777fa900bA034cd52;
+
+    uint256 public price; // price of CRV in WETH, 1e18 = 1 WETH per CRV
+
+    /* ========== VIEWS ========== */
+
+    function coins(uint256 _index) public pure returns (address) {
+        return _index == 0 ? weth : crv;
+    }
+
+    function price_oracle() external view returns (uint256) {
+        return price;
+    }
+
+    function get_dy(
+        uint256 i,
+        uint256 j,
+        uint256 dx
+    ) public view returns (uint256) {
+        require(i != j && i < 2 && j < 2); // only two coins here
+        if (i == 1) {
+            return dx.mul(price).div(1e18);
+        }
+        return dx.mul(1e18).div(price);
+    }
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    function exchange(
+        uint256 i,
+        uint256 j,
+        uint256 dx,
+        uint256 min_dy,
+        bool
+    ) public returns (uint256 dy) {
+        dy = get_dy(i, j, dx);
+        require(dy >= min_dy, "Slippage");
+        MockERC20(coins(i)).transferFrom(msg.sender, address(this), dx);
+        MockERC20(coins(j)).mint(msg.sender, dy);
+    }
+
+    function exchange(
+        uint256 i,
+        uint256 j,
+        uint256 dx,
+        uint256 min_dy
+    ) external returns (uint256) {
+        return exchange(i, j, dx, min_dy, false);
+    }
+
+    /* ========== SETTERS ========== */
+
+    function setPrice(uint256 _price) external {
+        price = _price;
+    }
+}
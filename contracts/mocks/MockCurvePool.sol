@@ -0,0 +1,56 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "./MockERC20.sol";
+
+// Mock 3Crv factory metapool. Like the real factory pools, the pool is also its own LP token.
+// All coins are treated as worth $1, and LP is priced off of a virtual price we can set directly.
+contract MockCurvePool is MockERC20 {
+    address[2] public coins; // [our metapool's stablecoin, 3Crv]
+    uint256 public virtualPrice = 1e18;
+
+    constructor(
+        string memory _name,
+        string memory _symbol,
+        address _coin,
+        address _baseLp
+    ) public {
+        initialize(_name, _symbol, 18);
+        coins = [_coin, _baseLp];
+    }
+
+    function get_virtual_price() external view returns (uint256) {
+        return virtualPrice;
+    }
+
+    function calc_token_amount(uint256[2] calldata _amounts, bool)
+        external
+        view
+        returns (uint256)
+    {
+        return _amounts[0].add(_amounts[1]).mul(1e18).div(virtualPrice);
+    }
+
+    function add_liquidity(
+        uint256[2] calldata _amounts,
+        uint256 _min_mint_amount
+    ) external returns (uint256 _minted) {
+        _minted = _amounts[0].add(_amounts[1]).mul(1e18).div(virtualPrice);
+        require(_minted >= _min_mint_amount, "Slippage screwed you");
+        for (uint256 i = 0; i < 2; i++) {
+            if (_amounts[i] > 0) {
+                MockERC20(coins[i]).transferFrom(
+                    msg.sender,
+                    address(this),
+                    _amounts[i]
+                );
+            }
+        }
+        _mint(msg.sender, _minted);
+    }
+
+    // use this to simulate our LP gaining or losing value
+    function setVirtualPrice(uint256 _virtualPrice) external {
+        virtualPrice = _virtualPrice;
+    }
+}
@@ -0,0 +1,15 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+// Mock of Curve's tricrypto pool. We only use its price oracle, which gives WBTC (k = 0) and WETH (k = 1) in USDT.
+contract MockCurveTricrypto {
+    uint256[2] internal prices; // 1e18 based
+
+    function price_oracle(uint256 k) external view returns (uint256) {
+        return prices[k];
+    }
+
+    function setPrice(uint256 k, uint256 _price) external {
+        prices[k] = _price;
+    }
+}
@@ -0,0 +1,67 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "@openzeppelin/contracts/math/SafeMath.sol";
+
+import "./MockCurvePool.sol";
+
+// Mock of Curve's 3Crv metapool zap. Every coin is worth $1, and we mint the pool's LP at its virtual price.
+contract MockCurveZap {
+    using SafeMath for uint256;
+
+    address internal constant dai = 0x6B175474E89094C44Da98b954EedeAC495271d0F;
+    address internal constant usdc = 0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48;
+    address internal constant usdt = 0xdAC17F958D2ee523a2206206994597C13D831ec7;
+
+    /* ========== VIEWS ========== */
+
+    // underlying coins are [metapool coin, dai, usdc, usdt]
+    function underlying_coins(address _pool, uint256 _index)
+        public
+        view
+        returns (address)
+    {
+        if (_index == 0) {
+            return MockCurvePool(_pool).coins(0);
+        }
+        return [dai, usdc, usdt][_index - 1];
+    }
+
+    function calc_token_amount(
+        address _pool,
+        uint256[4] memory _amounts,
+        bool
+    ) public view returns (uint256 _value) {
+        for (uint256 i = 0; i < 4; i++) {
+            if (_amounts[i] > 0) {
+                uint256 _decimals =
+                    MockERC20(underlying_coins(_pool, i)).decimals();
+                _value = _value.add(_amounts[i].mul(10**(18 - _decimals)));
+            }
+        }
+        _value = _value.mul(1e18).div(
+            MockCurvePool(_pool).get_virtual_price()
+        );
+    }
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    function add_liquidity(
+        address _pool,
+        uint256[4] calldata _amounts,
+        uint256 _min_mint_amount
+    ) external returns (uint256 _minted) {
+        _minted = calc_token_amount(_pool, _amounts, true);
+        require(_minted >= _min_mint_amount, "Slippage screwed you");
+        for (uint256 i = 0; i < 4; i++) {
+            if (_amounts[i] > 0) {
+                MockERC20(underlying_coins(_pool, i)).transferFrom(
+                    msg.sender,
+                    address(this),
+                    _amounts[i]
+                );
+            }
+        }
+        MockCurvePool(_pool).mint(msg.sender, _minted);
+    }
+}
@@ -0,0 +1,100 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "@openzeppelin/contracts/math/SafeMath.sol";
+
+// Bare-bones ERC20 for local testing. Anyone can mint, so our mock pools and routers can pay out whatever they owe.
+// Metadata is set in initialize() rather than a constructor so we can copy the runtime code to a hard-coded address.
+contract MockERC20 {
+    using SafeMath for uint256;
+
+    string public name;
+    string public symbol;
+    uint8 public decimals;
+    uint256 public totalSupply;
+
+    mapping(address => uint256) public balanceOf;
+    mapping(address => mapping(address => uint256)) public allowance;
+
+    bool internal initialized;
+
+    event Transfer(address indexed from, address indexed to, uint256 value);
+    event Approval(
+        address indexed owner,
+        address indexed spender,
+        uint256 value
+    );
+
+    function initialize(
+        string memory _name,
+        string memory _symbol,
+        uint8 _decimals
+    ) public {
+        require(!initialized); // already initialized.
+        initialized = true;
+        name = _name;
+        symbol = _symbol;
+        decimals = _decimals;
+    }
+
+    function transfer(address _to, uint256 _amount) external returns (bool) {
+        _transfer(msg.sender, _to, _amount);
+        return true;
+    }
+
+    function transferFrom(
+        address _from,
+        address _to,
+        uint256 _amount
+    ) external returns (bool) {
+        uint256 _allowance = allowance[_from][msg.sender];
+        if (_allowance != type(uint256).max) {
+            allowance[_from][msg.sender] = _allowance.sub(
+                _amount,
+                "!allowance"
+            );
+        }
+        _transfer(_from, _to, _amount);
+        return true;
+    }
+
+    // like Curve's LP tokens, we allow approvals to the zero address since our strategy approves its proxy before it is set
+    function approve(address _spender, uint256 _amount)
+        external
+        returns (bool)
+    {
+        allowance[msg.sender][_spender] = _amount;
+        emit Approval(msg.sender, _spender, _amount);
+        return true;
+    }
+
+    function mint(address _to, uint256 _amount) external {
+        _mint(_to, _amount);
+    }
+
+    function burn(address _from, uint256 _amount) external {
+        _burn(_from, _amount);
+    }
+
+    function _transfer(
+        address _from,
+        address _to,
+        uint256 _amount
+    ) internal virtual {
+        balanceOf[_from] = balanceOf[_from].sub(_amount, "!balance");
+        balanceOf[_to] = balanceOf[_to].add(_amount);
+        emit Transfer(_from, _to, _amount);
+    }
+
+    function _mint(address _to, uint256 _amount) internal virtual {
+        totalSupply = totalSupply.add(_amount);
+        balanceOf[_to] = balanceOf[_to].add(_amount);
+        emit Transfer(address(0), _to, _amount);
+    }
+
+    function _burn(address _from, uint256 _amount) internal virtual {
+        balanceOf[_from] = balanceOf[_from].sub(_amount, "!balance");
+        totalSupply = totalSupply.sub(_amount);
+        emit Transfer(_from, address(0), _amount);
+    }
+}
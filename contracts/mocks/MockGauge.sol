@@ -0,0 +1,203 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "./MockERC20.sol";
+
+// Mock tokenized Curve gauge (LiquidityGaugeV3-style). CRV and one optional reward token stream out at a fixed rate
+// per second, split pro-rata between depositors. CRV is minted to the claimer directly instead of through Curve's
+// Minter, but we track what each depositor has been minted for our MockMinter. Like mainnet gauges, claimable_tokens()
+// checkpoints, so it isn't a view, and everyone's working balance is just their balance.
+contract MockGauge is MockERC20 {
+    MockERC20 public lp_token;
+    MockERC20 public crv;
+    uint256 public crvRate; // CRV emitted per second across the whole gauge
+
+    MockERC20 public rewardToken;
+    uint256 public rewardRate; // reward tokens emitted per second across the whole gauge
+
+    uint256 public lastCheckpoint;
+    uint256 internal crvPerShare;
+    uint256 internal rewardPerShare;
+    mapping(address => uint256) internal crvPerSharePaid;
+    mapping(address => uint256) internal rewardPerSharePaid;
+    mapping(address => uint256) internal crvOwed;
+    mapping(address => uint256) internal rewardOwed;
+    mapping(address => uint256) public crvMinted;
+    mapping(address => uint256) public integrate_checkpoint_of;
+
+    constructor(
+        address _lpToken,
+        address _crv,
+        uint256 _crvRate
+    ) public {
+        initialize("Mock Curve Gauge Deposit", "mock-gauge", 18);
+        lp_token = MockERC20(_lpToken);
+        crv = MockERC20(_crv);
+        crvRate = _crvRate;
+        lastCheckpoint = block.timestamp;
+    }
+
+    /* ========== VIEWS ========== */
+
+    // all the CRV _addr has earned as of its last checkpoint, minted or not
+    function integrate_fraction(address _addr) external view returns (uint256) {
+        return crvMinted[_addr].add(crvOwed[_addr]);
+    }
+
+    function working_balances(address _addr) external view returns (uint256) {
+        return balanceOf[_addr];
+    }
+
+    function working_supply() external view returns (uint256) {
+        return totalSupply;
+    }
+
+    function inflation_rate() external view returns (uint256) {
+        return crvRate;
+    }
+
+    function claimable_reward(address _addr, address _token)
+        public
+        view
+        returns (uint256)
+    {
+        if (_token != address(rewardToken)) {
+            return 0;
+        }
+        (, uint256 _rewardPerShare) = _currentPerShare();
+        return _owed(_addr, _rewardPerShare, rewardPerSharePaid, rewardOwed);
+    }
+
+    // older gauges only took the address to check
+    function claimable_reward(address _addr) external view returns (uint256) {
+        return claimable_reward(_addr, address(rewardToken));
+    }
+
+    function reward_tokens(uint256 _index) external view returns (address) {
+        if (_index == 0) {
+            return address(rewardToken);
+        }
+        return address(0);
+    }
+
+    /* ========== MUTATIVE FUNCTIONS ========== */
+
+    function claimable_tokens(address _addr) external returns (uint256) {
+        _checkpoint(_addr);
+        return crvOwed[_addr];
+    }
+
+    function deposit(uint256 _value) external {
+        _checkpoint(msg.sender);
+        lp_token.transferFrom(msg.sender, address(this), _value);
+        _mint(msg.sender, _value);
+    }
+
+    function withdraw(uint256 _value) external {
+        _checkpoint(msg.sender);
+        _burn(msg.sender, _value);
+        lp_token.transfer(msg.sender, _value);
+    }
+
+    // stands in for Curve's Minter, sends all of our accrued CRV to the depositor
+    function claim_crv(address _addr) external returns (uint256 _amount) {
+        _checkpoint(_addr);
+        _amount = crvOwed[_addr];
+        if (_amount > 0) {
+            crvOwed[_addr] = 0;
+            crvMinted[_addr] = crvMinted[_addr].add(_amount);
+            crv.mint(_addr, _amount);
+        }
+    }
+
+    function claim_rewards(address _addr) public {
+        _checkpoint(_addr);
+        uint256 _amount = rewardOwed[_addr];
+        if (_amount > 0) {
+            rewardOwed[_addr] = 0;
+            rewardToken.mint(_addr, _amount);
+        }
+    }
+
+    function claim_rewards() external {
+        claim_rewards(msg.sender);
+    }
+
+    /* ========== SETTERS ========== */
+
+    function setCrvRate(uint256 _crvRate) external {
+        _checkpoint(address(0));
+        crvRate = _crvRate;
+    }
+
+    function setRewards(address _rewardToken, uint256 _rewardRate) external {
+        _checkpoint(address(0));
+        rewardToken = MockERC20(_rewardToken);
+        rewardRate = _rewardRate;
+    }
+
+    /* ========== INTERNAL ========== */
+
+    // gauge deposits are tokenized, so make sure both sides are up to date before balances move
+    function _transfer(
+        address _from,
+        address _to,
+        uint256 _amount
+    ) internal override {
+        _checkpoint(_from);
+        _checkpoint(_to);
+        super._transfer(_from, _to, _amount);
+    }
+
+    function _currentPerShare()
+        internal
+        view
+        returns (uint256 _crvPerShare, uint256 _rewardPerShare)
+    {
+        _crvPerShare = crvPerShare;
+        _rewardPerShare = rewardPerShare;
+        if (totalSupply > 0) {
+            uint256 _elapsed = block.timestamp.sub(lastCheckpoint);
+            _crvPerShare = _crvPerShare.add(
+                _elapsed.mul(crvRate).mul(1e18).div(totalSupply)
+            );
+            _rewardPerShare = _rewardPerShare.add(
+                _elapsed.mul(rewardRate).mul(1e18).div(totalSupply)
+            );
+        }
+    }
+
+    function _owed(
+        address _addr,
+        uint256 _perShare,
+        mapping(address => uint256) storage _paid,
+        mapping(address => uint256) storage _accrued
+    ) internal view returns (uint256) {
+        return
+            _accrued[_addr].add(
+                balanceOf[_addr].mul(_perShare.sub(_paid[_addr])).div(1e18)
+            );
+    }
+
+    function _checkpoint(address _addr) internal {
+        (crvPerShare, rewardPerShare) = _currentPerShare();
+        lastCheckpoint = block.timestamp;
+        if (_addr != address(0)) {
+            crvOwed[_addr] = _owed(
+                _addr,
+                crvPerShare,
+                crvPerSharePaid,
+                crvOwed
+            );
+            rewardOwed[_addr] = _owed(
+                _addr,
+                rewardPerShare,
+                rewardPerSharePaid,
+                rewardOwed
+            );
+            crvPerSharePaid[_addr] = crvPerShare;
+            rewardPerSharePaid[_addr] = rewardPerShare;
+            integrate_checkpoint_of[_addr] = block.timestamp;
+        }
+    }
+}
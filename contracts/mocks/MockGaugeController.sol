@@ -0,0 +1,11 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+// Mock of Curve's GaugeController. Each of our mock gauges sets its own CRV rate, so each gets all of its weight.
+contract MockGaugeController {
+    /* ========== VIEWS ========== */
+
+    function gauge_relative_weight(address) external pure returns (uint256) {
+        return 1e18;
+    }
+}
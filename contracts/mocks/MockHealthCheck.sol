@@ -0,0 +1,15 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+// Mock of Yearn's common health check. Every report passes, our tests check profits and losses themselves.
+contract MockHealthCheck {
+    function check(
+        uint256,
+        uint256,
+        uint256,
+        uint256,
+        uint256
+    ) external pure returns (bool) {
+        return true;
+    }
+}
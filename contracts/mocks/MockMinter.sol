@@ -0,0 +1,17 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "./MockGauge.sol";
+
+// Mock of Curve's Minter. Our MockGauge mints CRV itself, so we only report what it has minted to each depositor.
+contract MockMinter {
+    /* ========== VIEWS ========== */
+
+    function minted(address _for, address _gauge)
+        external
+        view
+        returns (uint256)
+    {
+        return MockGauge(_gauge).crvMinted(_for);
+    }
+}
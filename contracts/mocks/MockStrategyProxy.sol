@@ -0,0 +1,134 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+import "@openzeppelin/contracts/math/SafeMath.sol";
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+
+import "./MockGauge.sol";
+import "./MockVoter.sol";
+
+// Mock of Yearn's v4 StrategyProxy. Mirrors the real thing: strategies send want here, and we have the voter do the
+// actual gauge interactions so that gauge.balanceOf(voter) is what our strategies hold.
+contract MockStrategyProxy {
+    using SafeMath for uint256;
+
+    address public constant crv = 0xD533a949740bb3306d119CC777fa900bA034cd52;
+
+    MockVoter public proxy; // Yearn's naming, this is our voter
+    address public governance;
+    mapping(address => address) public strategies;
+
+    function initialize(address _voter, address _governance) external {
+        require(governance == address(0)); // already initialized.
+        proxy = MockVoter(_voter);
+        governance = _governance;
+    }
+
+    /* ========== VIEWS ========== */
+
+    function balanceOf(address _gauge) public view returns (uint256) {
+        return MockGauge(_gauge).balanceOf(address(proxy));
+    }
+
+    /* ========== STRATEGY FUNCTIONS ========== */
+
+    function deposit(address _gauge, address _token) external {
+        require(strategies[_gauge] == msg.sender, "!strategy");
+        uint256 _balance = IERC20(_token).balanceOf(address(this));
+        IERC20(_token).transfer(address(proxy), _balance);
+        _balance = IERC20(_token).balanceOf(address(proxy));
+
+        _safeExecute(
+            _token,
+            abi.encodeWithSignature(
+                "approve(address,uint256)",
+                _gauge,
+                _balance
+            )
+        );
+        _safeExecute(
+            _gauge,
+            abi.encodeWithSignature("deposit(uint256)", _balance)
+        );
+    }
+
+    function withdraw(
+        address _gauge,
+        address _token,
+        uint256 _amount
+    ) public returns (uint256) {
+        require(strategies[_gauge] == msg.sender, "!strategy");
+        uint256 _balance = IERC20(_token).balanceOf(address(proxy));
+        _safeExecute(
+            _gauge,
+            abi.encodeWithSignature("withdraw(uint256)", _amount)
+        );
+        _balance = IERC20(_token).balanceOf(address(proxy)).sub(_balance);
+        _safeExecute(
+            _token,
+            abi.encodeWithSignature(
+                "transfer(address,uint256)",
+                msg.sender,
+                _balance
+            )
+        );
+        return _balance;
+    }
+
+    function withdrawAll(address _gauge, address _token)
+        external
+        returns (uint256)
+    {
+        return withdraw(_gauge, _token, balanceOf(_gauge));
+    }
+
+    function harvest(address _gauge) external {
+        require(strategies[_gauge] == msg.sender, "!strategy");
+        uint256 _balance = IERC20(crv).balanceOf(address(proxy));
+        MockGauge(_gauge).claim_crv(address(proxy));
+        _balance = IERC20(crv).balanceOf(address(proxy)).sub(_balance);
+        _safeExecute(
+            crv,
+            abi.encodeWithSignature(
+                "transfer(address,uint256)",
+                msg.sender,
+                _balance
+            )
+        );
+    }
+
+    function claimRewards(address _gauge, address _token) external {
+        require(strategies[_gauge] == msg.sender, "!strategy");
+        MockGauge(_gauge).claim_rewards(address(proxy));
+        _safeExecute(
+            _token,
+            abi.encodeWithSignature(
+                "transfer(address,uint256)",
+                msg.sender,
+                IERC20(_token).balanceOf(address(proxy))
+            )
+        );
+    }
+
+    // nothing to lock locally, but keep the function so calls to it don't revert
+    function lock() external {}
+
+    /* ========== SETTERS ========== */
+
+    function approveStrategy(address _gauge, address _strategy) external {
+        require(msg.sender == governance, "!governance");
+        strategies[_gauge] = _strategy;
+    }
+
+    function revokeStrategy(address _gauge) external {
+        require(msg.sender == governance, "!governance");
+        strategies[_gauge] = address(0);
+    }
+
+    /* ========== INTERNAL ========== */
+
+    function _safeExecute(address _to, bytes memory _data) internal {
+        (bool _success, ) = proxy.execute(_to, 0, _data);
+        require(_success, "!execute");
+    }
+}
@@ -0,0 +1,149 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
+
+import "@openzeppelin/contracts/math/SafeMath.sol";
+
+import "./MockERC20.sol";
+
+// Shared fixed-rate swapping for our mock routers. Output tokens are minted, so routers never run out of liquidity.
+abstract contract MockSwapRouter {
+    using SafeMath for uint256;
+
+    uint256 internal constant FEE_DENOMINATOR = 1_000_000; // fees are in hundredths of a basis point, like UniV3
+
+    // amount of tokenOut (in its own decimals) we pay for 1e18 of tokenIn
+    mapping(address => mapping(address => uint256)) public rates;
+
+    function setRate(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _rate
+    ) external {
+        rates[_tokenIn][_tokenOut] = _rate;
+    }
+
+    function _quote(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _fee,
+        uint256 _amountIn
+    ) internal view returns (uint256) {
+        uint256 _rate = rates[_tokenIn][_tokenOut];
+        require(_rate > 0, "!pool");
+        return
+            _amountIn.mul(_rate).div(1e18).mul(FEE_DENOMINATOR.sub(_fee)).div(
+                FEE_DENOMINATOR
+            );
+    }
+}
+
+// Mock of Sushiswap's router, charges the usual 0.3% on each hop.
+contract MockSushiRouter is MockSwapRouter {
+    uint256 internal constant SUSHI_FEE = 3000;
+
+    function getAmountsOut(uint256 _amountIn, address[] memory _path)
+        public
+        view
+        returns (uint256[] memory _amounts)
+    {
+        _amounts = new uint256[](_path.length);
+        _amounts[0] = _amountIn;
+        for (uint256 i = 1; i < _path.length; i++) {
+            _amounts[i] = _quote(
+                _path[i - 1],
+                _path[i],
+                SUSHI_FEE,
+                _amounts[i - 1]
+            );
+        }
+    }
+
+    function swapExactTokensForTokens(
+        uint256 _amountIn,
+        uint256 _amountOutMin,
+        address[] calldata _path,
+        address _to,
+        uint256 _deadline
+    ) external returns (uint256[] memory _amounts) {
+        require(_deadline >= block.timestamp, "UniswapV2Router: EXPIRED");
+        _amounts = getAmountsOut(_amountIn, _path);
+        require(
+            _amounts[_amounts.length - 1] >= _amountOutMin,
+            "UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT"
+        );
+        MockERC20(_path[0]).transferFrom(msg.sender, address(this), _amountIn);
+        MockERC20(_path[_path.length - 1]).mint(
+            _to,
+            _amounts[_amounts.length - 1]
+        );
+    }
+}
+
+// Mock of Uniswap V3's SwapRouter. Reads the fee for each hop out of the packed path and charges it on top of our rate.
+contract MockUniV3Router is MockSwapRouter {
+    struct ExactInputParams {
+        bytes path;
+        address recipient;
+        uint256 deadline;
+        uint256 amountIn;
+        uint256 amountOutMinimum;
+    }
+
+    uint256 internal constant ADDR_SIZE = 20;
+    uint256 internal constant HOP_SIZE = 23; // address + uint24 fee
+
+    function quoteExactInput(bytes memory _path, uint256 _amountIn)
+        public
+        view
+        returns (uint256 _amountOut)
+    {
+        require(
+            _path.length >= ADDR_SIZE + HOP_SIZE &&
+                (_path.length - ADDR_SIZE) % HOP_SIZE == 0,
+            "!path"
+        );
+        _amountOut = _amountIn;
+        for (
+            uint256 _offset = 0;
+            _offset < _path.length - ADDR_SIZE;
+            _offset += HOP_SIZE
+        ) {
+            address _tokenIn;
+            uint24 _fee;
+            address _tokenOut;
+            assembly {
+                let _start := add(add(_path, 32), _offset)
+                _tokenIn := shr(96, mload(_start))
+                _fee := shr(232, mload(add(_start, 20)))
+                _tokenOut := shr(96, mload(add(_start, 23)))
+            }
+            _amountOut = _quote(_tokenIn, _tokenOut, _fee, _amountOut);
+        }
+    }
+
+    function exactInput(ExactInputParams calldata params)
+        external
+        payable
+        returns (uint256 amountOut)
+    {
+        require(params.deadline >= block.timestamp, "Transaction too old");
+        amountOut = quoteExactInput(params.path, params.amountIn);
+        require(amountOut >= params.amountOutMinimum, "Too little received");
+
+        address _tokenIn;
+        address _tokenOut;
+        bytes memory _path = params.path;
+        uint256 _last = _path.length - ADDR_SIZE;
+        assembly {
+            _tokenIn := shr(96, mload(add(_path, 32)))
+            _tokenOut := shr(96, mload(add(add(_path, 32), _last)))
+        }
+        MockERC20(_tokenIn).transferFrom(
+            msg.sender,
+            address(this),
+            params.amountIn
+        );
+        MockERC20(_tokenOut).mint(params.recipient, amountOut);
+    }
+}
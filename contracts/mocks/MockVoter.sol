@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.6.12;
+
+// Mock of Yearn's veCRV voter. It holds all of our gauge tokens, and only does what the StrategyProxy tells it to.
+contract MockVoter {
+    address public strategy; // Yearn calls the StrategyProxy the voter's strategy
+    address public governance;
+
+    function initialize(address _strategy, address _governance) external {
+        require(strategy == address(0)); // already initialized.
+        strategy = _strategy;
+        governance = _governance;
+    }
+
+    function execute(
+        address _to,
+        uint256 _value,
+        bytes calldata _data
+    ) external returns (bool, bytes memory) {
+        require(msg.sender == strategy || msg.sender == governance, "!auth");
+        (bool _success, bytes memory _result) = _to.call{value: _value}(_data);
+        return (_success, _result);
+    }
+}
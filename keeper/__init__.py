@@ -0,0 +1 @@
+# Off-chain keeper tools for our fleet of strategies. These talk to a node directly, without brownie.
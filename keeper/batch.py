@@ -0,0 +1,98 @@
+from eth_abi import decode_abi, encode_abi
+from eth_utils import function_signature_to_4byte_selector, keccak, to_checksum_address
+
+# Turns our fleet scanner's triggers into BatchHarvester transactions, and reads the gas each harvest used back out of
+# the receipt. Batches are packed by each strategy's last harvest gas (or a rough default), so they stay under our gas
+# limit without an estimate per batch. Each harvest in a batch gets up to 20% more than the most any of them used last
+# time.
+#
+#   block, triggers = await scanner.scan()
+#   for tx in harvest_transactions(harvester, triggers, call_cost, gas_used):
+#       receipt = sign_and_send(tx)
+#       gas_used.update(harvest_gas(receipt["logs"]))
+
+HARVEST_DUE = function_signature_to_4byte_selector(
+    "harvestDue(address[],uint256,uint256)"
+)
+STRATEGY_HARVESTED = keccak(text="StrategyHarvested(address,uint256)")
+HARVEST_FAILED = keccak(text="HarvestFailed(address,uint256,bytes)")
+HARVEST_GAS = 1_500_000  # a rough harvest, for strategies we haven't seen yet
+TRIGGER_GAS = 250_000  # BatchHarvester's cap on each harvestTrigger, enough for harvestOnProfit
+RESERVE_GAS = 50_000  # what BatchHarvester keeps back for its loop
+BATCH_OVERHEAD = TRIGGER_GAS + RESERVE_GAS  # per strategy
+MAX_BATCH_GAS = 12_000_000
+GAS_MARGIN = 1.2
+
+
+def due(triggers):
+    return [
+        strategy for strategy, trigger in triggers.items() if trigger.get("harvest")
+    ]
+
+
+# split the strategies that are due into batches that fit in max_gas
+def build_batches(triggers, gas_used=None, max_gas=MAX_BATCH_GAS):
+    gas_used = gas_used or {}
+    batches = []
+    batch, batch_gas = [], 0
+    for strategy in due(triggers):
+        gas = gas_used.get(strategy, HARVEST_GAS) + BATCH_OVERHEAD
+        if batch and batch_gas + gas > max_gas:
+            batches.append((batch, batch_gas))
+            batch, batch_gas = [], 0
+        batch.append(strategy)
+        batch_gas += gas
+    if batch:
+        batches.append((batch, batch_gas))
+    return batches
+
+
+def encode_harvest_due(strategies, call_cost, harvest_gas_limit):
+    data = HARVEST_DUE + encode_abi(
+        ["address[]", "uint256", "uint256"],
+        [
+            [to_checksum_address(strategy) for strategy in strategies],
+            call_cost,
+            harvest_gas_limit,
+        ],
+    )
+    return "0x" + data.hex()
+
+
+# unsigned transactions for our keeper to sign and send, one per batch. BatchHarvester stops at the first strategy it
+# can't give a full harvest_gas_limit, so we leave room for that on top of what we expect the batch to use.
+def harvest_transactions(harvester, triggers, call_cost, gas_used=None):
+    gas_used = gas_used or {}
+    transactions = []
+    for batch, batch_gas in build_batches(triggers, gas_used):
+        harvest_gas_limit = int(
+            max(gas_used.get(strategy, HARVEST_GAS) for strategy in batch) * GAS_MARGIN
+        )
+        transactions.append(
+            {
+                "to": to_checksum_address(harvester),
+                "data": encode_harvest_due(batch, call_cost, harvest_gas_limit),
+                "gas": int(batch_gas * GAS_MARGIN) + harvest_gas_limit,
+            }
+        )
+    return transactions
+
+
+def _bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+# gas each harvest used, from a BatchHarvester receipt's logs. failed harvests are included, so we don't keep
+# underestimating a strategy that runs out of gas.
+def harvest_gas(logs):
+    gas_used = {}
+    for log in logs:
+        topics = [_bytes(topic) for topic in log["topics"]]
+        if not topics or topics[0] not in (STRATEGY_HARVESTED, HARVEST_FAILED):
+            continue
+        strategy = to_checksum_address(topics[1][-20:])
+        types = ["uint256"] if topics[0] == STRATEGY_HARVESTED else ["uint256", "bytes"]
+        gas_used[strategy] = decode_abi(types, _bytes(log["data"]))[0]
+    return gas_used
@@ -0,0 +1,205 @@
+import asyncio
+import itertools
+from collections import OrderedDict
+
+import aiohttp
+from eth_abi import decode_abi, encode_abi
+from eth_utils import function_signature_to_4byte_selector, keccak, to_checksum_address
+
+# Checks harvestTrigger and tendTrigger for every strategy in our fleet at once. Clones are found from the Cloned events
+# of our original strategies, and all triggers are read in one Multicall2 tryBlockAndAggregate eth_call. Each scan pins
+# "latest" to a block number first, then sends our new-clone log query and that eth_call for that block together as one
+# JSON-RPC batch. Results are cached by block number, so a fleet of any size costs one round trip per block, plus an
+# eth_blockNumber per poll.
+#
+#   scanner = FleetScanner(RPC(url), multicall_address, [original_strategy], from_block=deploy_block)
+#   await scanner.discover()
+#   block, triggers = await scanner.scan()  # {strategy: {"harvest": True, "tend": False}}
+
+CLONED_TOPIC = "0x" + keccak(text="Cloned(address)").hex()
+TRY_BLOCK_AND_AGGREGATE = function_signature_to_4byte_selector(
+    "tryBlockAndAggregate(bool,(address,bytes)[])"
+)
+TRIGGERS = {
+    "harvest": function_signature_to_4byte_selector("harvestTrigger(uint256)"),
+    "tend": function_signature_to_4byte_selector("tendTrigger(uint256)"),
+}
+LOG_CHUNK = 10_000  # blocks per eth_getLogs when we first look for clones
+CACHE_BLOCKS = 16
+
+
+class RPCError(Exception):
+    pass
+
+
+class RPC:
+    def __init__(self, url, session=None):
+        self.url = url
+        self.session = session
+        self.requests = 0  # round trips we've made, so tests can check our batching
+        self._ids = itertools.count()
+
+    def _payload(self, method, params):
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params,
+        }
+
+    async def _post(self, payload):
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+        self.requests += 1
+        async with self.session.post(self.url, json=payload) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    @staticmethod
+    def _result(response):
+        if "error" in response:
+            raise RPCError(response["error"])
+        return response["result"]
+
+    async def request(self, method, *params):
+        return self._result(await self._post(self._payload(method, list(params))))
+
+    # several requests in one round trip, results in the same order
+    async def batch(self, *requests):
+        payloads = [self._payload(method, list(params)) for method, *params in requests]
+        responses = {
+            response["id"]: response for response in await self._post(payloads)
+        }
+        return [self._result(responses[payload["id"]]) for payload in payloads]
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+
+class FleetScanner:
+    def __init__(self, rpc, multicall, originals, from_block=0, call_cost=0):
+        self.rpc = rpc
+        self.multicall = to_checksum_address(multicall)
+        self.originals = [to_checksum_address(original) for original in originals]
+        self.strategies = list(self.originals)
+        self.call_cost = call_cost  # passed to harvestTrigger and tendTrigger, in wei
+        self._next_block = from_block
+        self._cache = OrderedDict()
+
+    def _add_clones(self, logs):
+        for log in logs:
+            clone = to_checksum_address("0x" + log["topics"][1][-40:])
+            if clone not in self.strategies:
+                self.strategies.append(clone)
+
+    def _logs_request(self, to_block):
+        return (
+            "eth_getLogs",
+            {
+                "address": self.originals,
+                "topics": [CLONED_TOPIC],
+                "fromBlock": hex(self._next_block),
+                "toBlock": hex(to_block),
+            },
+        )
+
+    # find every clone up to to_block, in chunks so no single log query is too big
+    async def discover(self, to_block=None):
+        if to_block is None:
+            to_block = int(await self.rpc.request("eth_blockNumber"), 16)
+        chunks = range(self._next_block, to_block + 1, LOG_CHUNK)
+        results = await asyncio.gather(
+            *(
+                self.rpc.request(
+                    "eth_getLogs",
+                    {
+                        "address": self.originals,
+                        "topics": [CLONED_TOPIC],
+                        "fromBlock": hex(start),
+                        "toBlock": hex(min(start + LOG_CHUNK - 1, to_block)),
+                    },
+                )
+                for start in chunks
+            )
+        )
+        for logs in results:
+            self._add_clones(logs)
+        self._next_block = max(self._next_block, to_block + 1)
+        return self.strategies
+
+    def _call_request(self, strategies, block):
+        calls = [
+            (strategy, selector + encode_abi(["uint256"], [self.call_cost]))
+            for strategy in strategies
+            for selector in TRIGGERS.values()
+        ]
+        data = TRY_BLOCK_AND_AGGREGATE + encode_abi(
+            ["bool", "(address,bytes)[]"], [False, calls]
+        )
+        return (
+            "eth_call",
+            {"to": self.multicall, "data": "0x" + data.hex()},
+            hex(block),
+        )
+
+    def _decode(self, strategies, result):
+        block, _, results = decode_abi(
+            ["uint256", "bytes32", "(bool,bytes)[]"], bytes.fromhex(result[2:])
+        )
+        triggers = {}
+        for i, strategy in enumerate(strategies):
+            triggers[strategy] = {}
+            for j, name in enumerate(TRIGGERS):
+                success, data = results[i * len(TRIGGERS) + j]
+                # a strategy that reverts (or isn't one of ours) reads as None
+                triggers[strategy][name] = (
+                    decode_abi(["bool"], data)[0]
+                    if success and len(data) == 32
+                    else None
+                )
+        return block, triggers
+
+    # triggers for every strategy we know of at block (a number, or "latest" by default). returns (block number,
+    # triggers).
+    async def scan(self, block="latest"):
+        # so our cache, logs and eth_call all agree on which block "latest" is
+        if block == "latest":
+            block = int(await self.rpc.request("eth_blockNumber"), 16)
+        if block in self._cache:
+            return block, self._cache[block]
+
+        strategies = list(self.strategies)
+        if block < self._next_block:
+            # we've already looked for clones this far
+            logs = []
+            result = await self.rpc.request(*self._call_request(strategies, block))
+        else:
+            logs, result = await self.rpc.batch(
+                self._logs_request(block), self._call_request(strategies, block)
+            )
+        number, triggers = self._decode(strategies, result)
+        self._add_clones(logs)
+        new = self.strategies[len(strategies) :]
+        if new:
+            # a clone made in this block, which is rare enough for a second round trip
+            _, new_triggers = self._decode(
+                new, await self.rpc.request(*self._call_request(new, number))
+            )
+            triggers.update(new_triggers)
+        self._next_block = max(self._next_block, number + 1)
+
+        self._cache[number] = triggers
+        while len(self._cache) > CACHE_BLOCKS:
+            self._cache.popitem(last=False)
+        return number, triggers
+
+    # scan every new block, forever. yields (block number, triggers).
+    async def watch(self, poll_interval=1.0):
+        last = None
+        while True:
+            number, triggers = await self.scan()
+            if number != last:
+                last = number
+                yield number, triggers
+            await asyncio.sleep(poll_interval)
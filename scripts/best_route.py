@@ -0,0 +1,156 @@
+import sys
+from pathlib import Path
+
+import click
+from brownie import Contract, StrategyCurve3CrvRewardsClonable, chain
+from brownie.exceptions import VirtualMachineError
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sim.accounting import StrategyModel
+from sim.routes import ROUTES, best_route, quote_routes, uni_path, uniswap_quotes
+from sim.stableswap import Metapool3Crv
+from sim.swaps import NoSwaps
+from sim.univ3 import UniswapV3Pool
+
+# Find the best targetStable and uniStableFee for a strategy's next harvest. We size the harvest by running its claimable
+# CRV and rewards through our accounting model, with the same keepCRV and sell thresholds as the strategy, then quote
+# every uniswap route in one Multicall2 call (or offline from uni_snapshot's files with sim/univ3.py), and then every
+# zap deposit at once with sim/stableswap.py. Run with `brownie run best_route --network mainnet` before harvesting.
+
+VOTER = "0xF147b8125d2ef93FB6965Db97D6746952a133934"
+CRVETH = "0x8301AE4fc9c624d1D396cbDAa1ed877821D7C511"
+QUOTER = "0xb27308f9F90D607463bb33eA1BeBb41C27CE5AB6"  # uniswap v3
+SUSHISWAP = "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"
+BASE_FEE_ORACLE = "0xb5e1CAcB567d98faaDB60a1fD4820720141f064F"
+MULTICALL2 = "0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696"
+THREE_POOL = "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7"
+THREE_CRV = "0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+STABLES = (
+    ("DAI", "0x6B175474E89094C44Da98b954EedeAC495271d0F"),
+    ("USDC", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"),
+    ("USDT", "0xdAC17F958D2ee523a2206206994597C13D831ec7"),
+)
+
+
+# quotes our CRV and rewards sales on-chain, and keeps the WETH our model would swap for our target stable
+class HarvestQuotes(NoSwaps):
+    def __init__(self, rewards_token):
+        self.crveth = Contract(CRVETH)
+        self.sushiswap = Contract(SUSHISWAP)
+        self.rewards_token = rewards_token
+        self.weth_in = 0
+
+    def crv_to_weth(self, amount):
+        return self.crveth.get_dy(1, 0, amount)
+
+    def crv_price_oracle(self):
+        return self.crveth.price_oracle()
+
+    # our rewards token might not have a sushi pair, then it's worth nothing to us
+    def rewards_to_weth(self, amount):
+        try:
+            return self.sushiswap.getAmountsOut(amount, [self.rewards_token, WETH])[1]
+        except (ValueError, VirtualMachineError):
+            return 0
+
+    def weth_to_stable(self, amount, stable, fee):
+        self.weth_in = amount
+        return 0
+
+
+# like our strategy's _currentBaseFee(), a provider we can't read means we always sell
+def current_base_fee():
+    try:
+        return Contract(Contract(BASE_FEE_ORACLE).baseFeeProvider()).basefee_global()
+    except ValueError:
+        return 0
+
+
+# a route through a uniswap pool that doesn't exist reverts, and quotes as 0
+def live_quotes(weth_in):
+    quoter = Contract(QUOTER)
+    calls = [
+        (
+            quoter.address,
+            quoter.quoteExactInput.encode_input(
+                uni_path(WETH, fee, STABLES[stable][1]), weth_in
+            ),
+        )
+        for stable, fee in ROUTES
+    ]
+    results = Contract(MULTICALL2).tryAggregate.call(False, calls)
+    return [
+        quoter.quoteExactInput.decode_output(data) if success else 0
+        for success, data in results
+    ]
+
+
+def main():
+    strategy = StrategyCurve3CrvRewardsClonable.at(click.prompt("Strategy"))
+    snapshots = click.prompt(
+        "Uniswap snapshots from uni_snapshot (blank to use the live quoter)",
+        default="",
+        show_default=False,
+    )
+    crv = Contract(strategy.crv())
+    weth = Contract(WETH)
+    gauge = Contract(strategy.gauge())
+
+    # what our next harvest sells: keepCRV only comes out of what we claim, and small sales wait for a later harvest
+    has_rewards = strategy.hasRewards()
+    rewards_token = strategy.rewardsToken()
+    swaps = HarvestQuotes(rewards_token)
+    model = StrategyModel(
+        staked_balance=strategy.stakedBalance(),
+        crv_balance=crv.balanceOf(strategy),
+        weth_balance=weth.balanceOf(strategy),
+        claimable_crv=gauge.claimable_tokens.call(VOTER),
+        keep_crv=strategy.keepCRV(),
+        has_rewards=has_rewards,
+        base_fee=current_base_fee(),
+        crv_sell_gas=strategy.crvSellGas(),
+        weth_sell_gas=strategy.wethSellGas(),
+        swaps=swaps,
+    )
+    if has_rewards:
+        model.rewards_balance = Contract(rewards_token).balanceOf(strategy)
+        model.claimable_rewards = gauge.claimable_reward(VOTER, rewards_token)
+    crv_before = model.crv_balance + model.claimable_crv
+    model.prepare_return(0, model.estimated_total_assets())
+    crv_to_sell = crv_before - model.sent_to_voter - model.crv_balance
+    weth_in = swaps.weth_in
+    if weth_in == 0:
+        print("Not enough to sell yet, our strategy would skip the swap")
+        return
+
+    if snapshots:
+        pools = {}
+        for stable, fee in ROUTES:
+            path = Path(snapshots) / f"{STABLES[stable][0].lower()}_{fee}.json"
+            if path.exists():
+                pools[(stable, fee)] = UniswapV3Pool.load(path)
+        stable_out = uniswap_quotes(pools, WETH, weth_in)
+    else:
+        stable_out = live_quotes(weth_in)
+
+    metapool = Metapool3Crv.from_contracts(
+        Contract(strategy.curve()),
+        Contract(THREE_POOL),
+        Contract(THREE_CRV),
+        chain[-1].timestamp,
+    )
+    want_out = quote_routes(metapool, stable_out)
+
+    current_stable = [address for _, address in STABLES].index(strategy.targetStable())
+    current = (current_stable, strategy.uniStableFee())
+    print(f"\nSelling {crv_to_sell / 1e18:.2f} CRV for {weth_in / 1e18:.4f} WETH\n")
+    for (stable, fee), amount in zip(ROUTES, want_out):
+        marker = " <- current" if (stable, fee) == current else ""
+        print(f"{STABLES[stable][0]:>4} {fee:>5}  {amount / 1e18:>16.6f}{marker}")
+
+    best = best_route(want_out, current)
+    print(f"\nBest route gets {best['gain'] / 1e18:.6f} more want than our current one")
+    if best["gain"] > 0:
+        print(f"strategy.setOptimal({best['target_stable']})")
+        print(f"strategy.setUniFees({best['uni_stable_fee']})")
@@ -0,0 +1,158 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import yaml
+from brownie import StrategyCurve3CrvRewardsClonable, accounts, chain, network, web3
+from web3.exceptions import TransactionNotFound
+
+# Roll out clones of our strategy from a manifest, with no prompts. Every clone is sent right away with its own nonce,
+# and then we wait for all of the receipts together, so 50 clones take about as long as one. Each step goes into a
+# journal next to the manifest, and running the same manifest again picks up where we left off: finished clones are
+# skipped, pending ones are waited for, and failed or dropped ones are sent again.
+#
+#   brownie run deploy_clones main clones.yaml <original strategy> <account id> --network mainnet
+#
+# The manifest is a YAML list of entries with vault, gauge, pool, name, keeper and rewards, and optionally strategist
+# (our deployer by default). Entries are known by their names, so each needs its own. Set DEPLOYER_PASSWORD to unlock our account without a prompt.
+
+FIELDS = ("vault", "gauge", "pool", "name", "keeper", "rewards")
+CONFIRMATIONS = 1
+MAX_WAITING = 16  # receipts we wait on at once
+
+
+def load_manifest(path):
+    with open(path) as f:
+        entries = yaml.safe_load(f)
+    for entry in entries:
+        missing = [field for field in FIELDS if not entry.get(field)]
+        if missing:
+            raise ValueError(f"Manifest entry {entry} is missing {', '.join(missing)}")
+    keys = [entry_key(entry) for entry in entries]
+    if len(set(keys)) != len(keys):
+        raise ValueError("Every manifest entry needs its own name")
+    return entries
+
+
+def entry_key(entry):
+    return entry["name"]
+
+
+# the latest record for each entry
+def load_journal(path):
+    journal = {}
+    if Path(path).exists():
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    journal[record["key"]] = record
+    return journal
+
+
+def write_journal(path, record):
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+# what happened to a clone we sent on an earlier run: a receipt to wait on, or None if we need to send it again
+def _resume(record):
+    try:
+        receipt = web3.eth.get_transaction_receipt(record["tx"])
+    except TransactionNotFound:
+        receipt = None
+    if receipt is None:
+        try:
+            web3.eth.get_transaction(record["tx"])
+        except TransactionNotFound:
+            return None  # dropped
+    elif receipt["status"] == 0:
+        return None
+    return chain.get_transaction(record["tx"])
+
+
+def _wait(tx, confirmations):
+    tx.wait(confirmations)
+    return tx
+
+
+def deploy(manifest, journal_path, original, deployer, confirmations=CONFIRMATIONS):
+    entries = load_manifest(manifest)
+    journal = load_journal(journal_path)
+    pending = []
+    to_send = []
+    for entry in entries:
+        record = journal.get(entry_key(entry))
+        if record is None or record["status"] == "failed":
+            to_send.append(entry)
+        elif record["status"] == "sent":
+            tx = _resume(record)
+            if tx is None:
+                to_send.append(entry)
+            else:
+                pending.append((entry, tx))
+
+    # send everything at once, counting our nonces ourselves instead of waiting for each receipt
+    nonce = web3.eth.get_transaction_count(deployer.address, "pending")
+    for entry in to_send:
+        tx = original.cloneCurve3CrvRewards(
+            entry["vault"],
+            entry.get("strategist") or deployer,
+            entry["rewards"],
+            entry["keeper"],
+            entry["gauge"],
+            entry["pool"],
+            entry["name"],
+            {"from": deployer, "nonce": nonce, "required_confs": 0},
+        )
+        write_journal(
+            journal_path,
+            {"key": entry_key(entry), "status": "sent", "tx": tx.txid, "nonce": nonce},
+        )
+        pending.append((entry, tx))
+        nonce += 1
+
+    with ThreadPoolExecutor(max_workers=MAX_WAITING) as executor:
+        receipts = list(
+            executor.map(lambda item: _wait(item[1], confirmations), pending)
+        )
+
+    clones = {}
+    for (entry, _), tx in zip(pending, receipts):
+        if tx.status == 1:
+            clone = tx.events["Cloned"]["clone"]
+            clones[entry_key(entry)] = clone
+            record = {"key": entry_key(entry), "status": "done", "clone": clone}
+        else:
+            record = {
+                "key": entry_key(entry),
+                "status": "failed",
+                "error": tx.revert_msg,
+            }
+        write_journal(journal_path, {**record, "tx": tx.txid})
+        journal[entry_key(entry)] = record
+
+    return {
+        entry_key(entry): journal.get(entry_key(entry), {}).get("clone")
+        for entry in entries
+    }
+
+
+def main(manifest, original, account, journal=None):
+    print(f"You are using the '{network.show_active()}' network")
+    deployer = accounts.load(account, password=os.environ.get("DEPLOYER_PASSWORD"))
+    journal = journal or str(Path(manifest).with_suffix(".journal.jsonl"))
+    original = StrategyCurve3CrvRewardsClonable.at(original)
+
+    clones = deploy(manifest, journal, original, deployer)
+    failed = [key for key, clone in clones.items() if clone is None]
+    for key, clone in clones.items():
+        print(f"{key} -> {clone or 'FAILED'}")
+    print(
+        f"\n{len(clones) - len(failed)} of {len(clones)} clones deployed, journal at {journal}"
+    )
+    if failed:
+        print("Run the same command again to retry the failed ones")
@@ -0,0 +1,69 @@
+import click
+from brownie import Contract, StrategyCurve3CrvRewardsClonable, accounts, chain
+
+# Measure whether our strategies should deposit through curve's zap or to 3pool and then their metapool directly, and
+# print the setDepositThroughZap() calls to make. We deposit each strategy's targetStable both ways from a test account
+# and compare gas, so run this on a fork: `brownie run deposit_path --network mainnet-fork`.
+
+ZAP = "0xA79828DF1850E8a3A3064576f380D90aECDD3359"
+THREE_POOL = "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7"
+THREE_CRV = "0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490"
+STABLES = (
+    "0x6B175474E89094C44Da98b954EedeAC495271d0F",  # DAI
+    "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",  # USDC
+    "0xdAC17F958D2ee523a2206206994597C13D831ec7",  # USDT
+)
+TX_BASE_GAS = 21_000  # our strategy makes these calls inside of harvest, so don't count each transaction's base cost
+
+
+# gas for each path, after approvals. we roll the chain back after each one so they both start from the same state.
+def measure(pool, stable, amount, depositor):
+    index = STABLES.index(stable.address)
+    three_pool = Contract(THREE_POOL)
+    three_crv = Contract(THREE_CRV)
+
+    chain.snapshot()
+    stable.approve(ZAP, amount, {"from": depositor})
+    zap_amounts = [0, 0, 0, 0]
+    zap_amounts[index + 1] = amount
+    tx = Contract(ZAP).add_liquidity(pool, zap_amounts, 0, {"from": depositor})
+    zap_gas = tx.gas_used - TX_BASE_GAS
+    chain.revert()
+
+    stable.approve(three_pool, amount, {"from": depositor})
+    three_crv.approve(pool, 2 ** 256 - 1, {"from": depositor})
+    amounts = [0, 0, 0]
+    amounts[index] = amount
+    tx = three_pool.add_liquidity(amounts, 0, {"from": depositor})
+    direct_gas = tx.gas_used - TX_BASE_GAS
+    tx = pool.add_liquidity([0, three_crv.balanceOf(depositor)], 0, {"from": depositor})
+    direct_gas += tx.gas_used - TX_BASE_GAS
+    chain.revert()
+    return zap_gas, direct_gas
+
+
+def main():
+    addresses = click.prompt("Strategies, separated by commas")
+    size = click.prompt("Deposit size in USD", type=int, default=10_000)
+    depositor = accounts[0]
+
+    # 3pool holds plenty of every stable, so borrow ours from there
+    whale = accounts.at(THREE_POOL, force=True)
+    for address in STABLES:
+        stable = Contract(address)
+        stable.transfer(depositor, size * 10 ** stable.decimals(), {"from": whale})
+
+    for address in addresses.split(","):
+        strategy = StrategyCurve3CrvRewardsClonable.at(address.strip())
+        stable = Contract(strategy.targetStable())
+        amount = size * 10 ** stable.decimals()
+        zap_gas, direct_gas = measure(
+            Contract(strategy.curve()), stable, amount, depositor
+        )
+        through_zap = zap_gas <= direct_gas
+        print(
+            f"{strategy.name()} [{strategy.address}]: zap {zap_gas:,} gas, direct {direct_gas:,} gas, "
+            f"depositThroughZap now {strategy.depositThroughZap()}"
+        )
+        if through_zap != strategy.depositThroughZap():
+            print(f"    strategy.setDepositThroughZap({through_zap})")
@@ -0,0 +1,74 @@
+import csv
+import sys
+from pathlib import Path
+
+import click
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sim.cadence import make_grid, rank, simulate
+
+# Find the best harvestTrigger settings for one of our strategies from historical data, without touching the chain.
+# Takes a CSV with a base_fee column (gwei) and optionally a flow column (want deposited into the vault, negative for
+# withdrawals), one row per step. Run with `brownie run harvest_cadence`.
+
+DAY = 86400
+MIN_DELAYS = [d * DAY for d in (1, 3, 5, 7, 14, 21)]
+MAX_DELAYS = [d * DAY for d in (7, 14, 21, 30, 60, 100)]
+CREDIT_THRESHOLDS = [1e4, 1e5, 1e6, 1e7]
+MAX_BASE_FEES = [20, 40, 60, 80, 120, 200]  # gwei
+HARVEST_ON_PROFIT = [False, True]
+
+
+def main():
+    path = click.prompt(
+        "CSV of base fees (and vault flows)", type=click.Path(exists=True)
+    )
+    step = click.prompt("Seconds per row", default=3600)
+    assets = click.prompt("Assets in our strategy (want)", default=1e6)
+    crv_per_want = click.prompt("CRV per second per want staked", default=1e-9)
+    crv_price = click.prompt("CRV price in want", default=1.0)
+    eth_price = click.prompt("ETH price in want", default=2000.0)
+    keep_crv = click.prompt("keepCRV", default=0.1)
+    profit_factor = click.prompt("profitFactor", default=100)
+
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    base_fees = np.array([float(row["base_fee"]) for row in rows])
+    flows = np.array([float(row.get("flow") or 0) for row in rows])
+
+    grid = make_grid(
+        MIN_DELAYS, MAX_DELAYS, CREDIT_THRESHOLDS, MAX_BASE_FEES, HARVEST_ON_PROFIT
+    )
+    # maxReportDelay below minReportDelay just means we harvest on maxReportDelay, so those settings are fine to keep
+    results = simulate(
+        grid,
+        base_fees,
+        step,
+        crv_per_want,
+        crv_price,
+        eth_price,
+        flows=flows,
+        starting_assets=assets,
+        keep_crv=keep_crv,
+        profit_factor=profit_factor,
+    )
+
+    print(f"\nTried {len(grid['min_report_delay'])} settings over {len(rows)} steps\n")
+    for result in rank(results):
+        print(
+            f"min {result['min_report_delay'] / DAY:>4.0f}d  max {result['max_report_delay'] / DAY:>4.0f}d  "
+            f"credit {result['credit_threshold']:>10.0f}  base fee {result['max_base_fee']:>4.0f} gwei  "
+            f"on profit {str(result['harvest_on_profit']):>5}  "
+            f"harvests {result['harvests']:>4}  net {result['net_yield']:>12.2f}  gas {result['gas_spent']:>10.2f}"
+        )
+
+    best = rank(results, top=1)[0]
+    print("\nTo use our best setting:")
+    print(f"strategy.setMinReportDelay({best['min_report_delay']:.0f})")
+    print(f"strategy.setMaxReportDelay({best['max_report_delay']:.0f})")
+    print(
+        f"strategy.setCreditThreshold({best['credit_threshold']:.0f} * 10 ** decimals)"
+    )
+    print(f"gasOracle.setMaxAcceptableBaseFee({best['max_base_fee']:.0f} * 1e9)")
+    print(f"strategy.setHarvestOnProfit({best['harvest_on_profit']})")
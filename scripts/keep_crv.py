@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+
+import click
+import numpy as np
+from brownie import Contract, StrategyCurve3CrvRewardsClonable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sim.keep_crv import recommend, simulate
+
+# Recommend keepCRV for each of our strategies from their gauges' current state. Run with
+# `brownie run keep_crv --network mainnet` and paste in the strategies you want to check.
+
+VOTER = "0xF147b8125d2ef93FB6965Db97D6746952a133934"
+VECRV = "0x5f3b5DfEb7B28CDbD7FAba78963EE202a494e2A2"
+GAUGE_CONTROLLER = "0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB"
+KEEP_GRID = list(range(0, 10_001, 250))
+
+
+def main():
+    addresses = click.prompt("Strategies, separated by commas")
+    crv_price = click.prompt("CRV price in USD", type=float)
+    strategies = [
+        StrategyCurve3CrvRewardsClonable.at(address.strip())
+        for address in addresses.split(",")
+    ]
+
+    controller = Contract(GAUGE_CONTROLLER)
+    vecrv = Contract(VECRV)
+    gauges = {
+        "balance": [],
+        "total_supply": [],
+        "working_supply": [],
+        "inflation_rate": [],
+        "tvl": [],
+        "keep_crv": [],
+    }
+    for strategy in strategies:
+        gauge = Contract(strategy.gauge())
+        balance = gauge.balanceOf(VOTER)
+        gauges["balance"].append(balance)
+        gauges["total_supply"].append(gauge.totalSupply())
+        gauges["working_supply"].append(gauge.working_supply())
+        gauges["inflation_rate"].append(
+            gauge.inflation_rate() * controller.gauge_relative_weight(gauge) / 1e36
+        )
+        virtual_price = Contract(strategy.curve()).get_virtual_price()
+        gauges["tvl"].append(balance * virtual_price / 1e36)
+        gauges["keep_crv"].append(strategy.keepCRV())
+
+    ve_balance = vecrv.balanceOf(VOTER) / 1e18
+    ve_total = vecrv.totalSupply() / 1e18
+    gauges["balance"] = np.array(gauges["balance"]) / 1e18
+    gauges["total_supply"] = np.array(gauges["total_supply"]) / 1e18
+    gauges["working_supply"] = np.array(gauges["working_supply"]) / 1e18
+
+    current = simulate(gauges, ve_balance, ve_total, KEEP_GRID, crv_price)
+    best = recommend(gauges, ve_balance, ve_total, KEEP_GRID, crv_price)
+    column = KEEP_GRID.index(1000)
+    for i, strategy in enumerate(strategies):
+        print(
+            f"{strategy.name()} [{strategy.address}]: boost {current['boost'][i, column]:.2f}x at 10%, "
+            f"keepCRV now {gauges['keep_crv'][i]}, recommended {best['keep_crv'][i]}"
+        )
+    uniform = KEEP_GRID[int(np.argmax(current["fleet_net_yield"]))]
+    print(f"\nBest single keepCRV for all of these strategies: {uniform}")
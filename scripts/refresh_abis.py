@@ -0,0 +1,35 @@
+import re
+import sys
+from pathlib import Path
+
+from brownie import Contract
+
+tests_path = Path(__file__).parent.parent.joinpath("tests")
+sys.path.insert(0, str(tests_path))
+from abi_store import ABI_DIR, save_abi
+
+# Fill our test ABI store ahead of time, so the tests never have to go to Etherscan. We fetch every address already in
+# the store (in case any were upgraded) plus every address written in conftest and pools.yaml (vaults, whales, rewards
+# tokens), including the commented-out ones. Addresses we can only find on-chain (gauge, pool, LP token, etc.) get added
+# the first time the tests use them.
+
+SOURCES = ("conftest.py", "pools.yaml")
+
+
+def main():
+    addresses = {path.stem for path in ABI_DIR.glob("*.json")}
+    for source in SOURCES:
+        text = tests_path.joinpath(source).read_text()
+        addresses.update(
+            address.lower() for address in re.findall(r"0x[0-9a-fA-F]{40}", text)
+        )
+
+    for address in sorted(addresses):
+        try:
+            contract = Contract.from_explorer(address)
+        except ValueError:
+            # our whales and multisigs don't have source to fetch
+            print(f"Skipping {address}, no verified source")
+            continue
+        save_abi(contract)
+        print(f"Saved {contract._name} [{contract.address}]")
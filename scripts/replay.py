@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sim.replay import Scenario, replay
+from sim.routes import ROUTES
+from sim.swaps import DAI, USDC, USDT
+
+# Replay our exported harvest history with other settings and compare what each would have made us. Files are JSON
+# lines, CSV or Parquet in the format described in sim/replay.py. Run with `brownie run replay`.
+
+DAY = 86400
+STABLE_NAMES = {DAI: "dai", USDC: "usdc", USDT: "usdt"}
+
+
+def scenarios():
+    yield "as run", Scenario()
+    for keep_crv in (0, 500, 1000, 2000, 5000):
+        yield f"keepCRV {keep_crv}", Scenario(keep_crv=keep_crv)
+    for stable, fee in ROUTES:
+        yield f"{STABLE_NAMES[stable]} {fee}", Scenario(
+            target_stable=stable, uni_stable_fee=fee
+        )
+    for days in (7, 14, 21, 30):
+        yield f"min delay {days}d", Scenario(min_report_delay=days * DAY)
+
+
+def main():
+    paths = click.prompt("History files, separated by commas")
+    paths = [path.strip() for path in paths.split(",")]
+    results = replay(paths, dict(scenarios()))
+
+    totals = {}
+    for (_, name), result in results.items():
+        total = totals.setdefault(name, {"harvests": 0, "net": 0, "actual_net": 0})
+        for key in total:
+            total[key] += result[key]
+
+    actual = totals["as run"]["actual_net"]
+    print(f"\nActual net profit: {actual / 1e18:,.2f} want\n")
+    for name, total in sorted(totals.items(), key=lambda item: -item[1]["net"]):
+        print(
+            f"{name:<16} harvests {total['harvests']:>6}  net {total['net'] / 1e18:>16,.2f}  "
+            f"vs actual {(total['net'] - actual) / 1e18:>+14,.2f}"
+        )
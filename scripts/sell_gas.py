@@ -0,0 +1,91 @@
+import click
+from brownie import Contract, StrategyCurve3CrvRewardsClonable, accounts, chain
+
+# Measure the gas for each leg of our strategies' sales, and print the setSellGas() calls to make. Our strategies skip a
+# leg until it's worth more than this gas at the current base fee. We buy CRV with a test account, then sell it to WETH
+# on crveth, sell WETH for each strategy's targetStable on uniswap, and deposit to Curve the way the strategy does. Run
+# this on a fork: `brownie run sell_gas --network mainnet-fork`.
+
+CRVETH = "0x8301AE4fc9c624d1D396cbDAa1ed877821D7C511"
+UNISWAPV3 = "0xE592427A0AEce92De3Edee1F18E0157C05861564"
+ZAP = "0xA79828DF1850E8a3A3064576f380D90aECDD3359"
+THREE_POOL = "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7"
+THREE_CRV = "0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490"
+CRV = "0xD533a949740bb3306d119CC777fa900bA034cd52"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+STABLES = (
+    "0x6B175474E89094C44Da98b954EedeAC495271d0F",  # DAI
+    "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",  # USDC
+    "0xdAC17F958D2ee523a2206206994597C13D831ec7",  # USDT
+)
+TX_BASE_GAS = 21_000  # our strategy makes these calls inside of harvest, so don't count each transaction's base cost
+TOLERANCE = 0.1  # only suggest a change if we're off by more than 10%
+
+
+# gas for each leg, after approvals. we roll the chain back afterwards so every strategy starts from the same state.
+def measure(strategy, eth_amount, depositor):
+    crveth = Contract(CRVETH)
+    crv = Contract(CRV)
+    weth = Contract(WETH)
+    stable = Contract(strategy.targetStable())
+    index = STABLES.index(stable.address)
+
+    chain.snapshot()
+    crveth.exchange(0, 1, eth_amount, 0, True, {"from": depositor, "value": eth_amount})
+    crv.approve(crveth, 2 ** 256 - 1, {"from": depositor})
+    weth.approve(UNISWAPV3, 2 ** 256 - 1, {"from": depositor})
+    stable.approve(ZAP, 2 ** 256 - 1, {"from": depositor})
+    stable.approve(THREE_POOL, 2 ** 256 - 1, {"from": depositor})
+    Contract(THREE_CRV).approve(strategy.curve(), 2 ** 256 - 1, {"from": depositor})
+
+    # CRV -> WETH
+    tx = crveth.exchange(1, 0, crv.balanceOf(depositor), 0, False, {"from": depositor})
+    crv_gas = tx.gas_used - TX_BASE_GAS
+
+    # WETH -> stable, then our deposit
+    path = (
+        bytes.fromhex(WETH[2:])
+        + int(strategy.uniStableFee()).to_bytes(3, "big")
+        + bytes.fromhex(stable.address[2:])
+    )
+    params = (path, depositor, chain.time() + 3600, weth.balanceOf(depositor), 1)
+    tx = Contract(UNISWAPV3).exactInput(params, {"from": depositor})
+    weth_gas = tx.gas_used - TX_BASE_GAS
+    amount = stable.balanceOf(depositor)
+    pool = Contract(strategy.curve())
+    if strategy.depositThroughZap():
+        amounts = [0, 0, 0, 0]
+        amounts[index + 1] = amount
+        tx = Contract(ZAP).add_liquidity(pool, amounts, 0, {"from": depositor})
+        weth_gas += tx.gas_used - TX_BASE_GAS
+    else:
+        amounts = [0, 0, 0]
+        amounts[index] = amount
+        tx = Contract(THREE_POOL).add_liquidity(amounts, 0, {"from": depositor})
+        weth_gas += tx.gas_used - TX_BASE_GAS
+        three_crv = Contract(THREE_CRV).balanceOf(depositor)
+        tx = pool.add_liquidity([0, three_crv], 0, {"from": depositor})
+        weth_gas += tx.gas_used - TX_BASE_GAS
+    chain.revert()
+    return crv_gas, weth_gas
+
+
+def main():
+    addresses = click.prompt("Strategies, separated by commas")
+    size = click.prompt("Sale size in ETH", type=float, default=1.0)
+    depositor = accounts[0]
+
+    for address in addresses.split(","):
+        strategy = StrategyCurve3CrvRewardsClonable.at(address.strip())
+        crv_gas, weth_gas = measure(strategy, int(size * 1e18), depositor)
+        current = (strategy.crvSellGas(), strategy.wethSellGas())
+        print(
+            f"{strategy.name()} [{strategy.address}]: CRV -> WETH {crv_gas:,} gas, WETH -> deposit {weth_gas:,} gas, "
+            f"now {current[0]:,} and {current[1]:,}"
+        )
+        off = [
+            abs(measured - now) > TOLERANCE * measured
+            for measured, now in zip((crv_gas, weth_gas), current)
+        ]
+        if any(off):
+            print(f"    strategy.setSellGas({crv_gas}, {weth_gas})")
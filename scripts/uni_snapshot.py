@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+
+import click
+from brownie import Contract, chain
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sim.routes import ROUTES
+from sim.univ3 import UniswapV3Pool
+
+# Save the uniswap v3 pools for every WETH -> stable route our strategies can take, so sim/univ3.py can quote them
+# offline. Ticks are read a word of the tick bitmap at a time through Multicall2. Run with
+# `brownie run uni_snapshot --network mainnet`, and pass the directory to `brownie run best_route`.
+
+FACTORY = "0x1F98431c8aD98523631AE4a59f267346ea31F984"
+MULTICALL2 = "0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+STABLES = (
+    ("dai", "0x6B175474E89094C44Da98b954EedeAC495271d0F"),
+    ("usdc", "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"),
+    ("usdt", "0xdAC17F958D2ee523a2206206994597C13D831ec7"),
+)
+BATCH_SIZE = 500
+
+
+def batch(multicall, method, args_list, block):
+    results = []
+    for start in range(0, len(args_list), BATCH_SIZE):
+        calls = [
+            (method._address, method.encode_input(*args))
+            for args in args_list[start : start + BATCH_SIZE]
+        ]
+        for success, data in multicall.tryAggregate.call(
+            True, calls, block_identifier=block
+        ):
+            results.append(method.decode_output(data))
+    return results
+
+
+def snapshot(pool, multicall, words, block):
+    tick_spacing = pool.tickSpacing()
+    slot0 = pool.slot0(block_identifier=block)
+    current_word = (slot0[1] // tick_spacing) >> 8
+    positions = list(range(current_word - words, current_word + words + 1))
+    bitmaps = batch(multicall, pool.tickBitmap, [[word] for word in positions], block)
+
+    ticks = [
+        ((word << 8) + bit) * tick_spacing
+        for word, bitmap in zip(positions, bitmaps)
+        for bit in range(256)
+        if bitmap >> bit & 1
+    ]
+    infos = batch(multicall, pool.ticks, [[tick] for tick in ticks], block)
+    return UniswapV3Pool(
+        pool.token0(),
+        pool.token1(),
+        pool.fee(),
+        tick_spacing,
+        slot0[0],
+        slot0[1],
+        pool.liquidity(block_identifier=block),
+        {tick: info[1] for tick, info in zip(ticks, infos)},
+    )
+
+
+def main():
+    directory = Path(click.prompt("Save snapshots to", default="build/uni"))
+    # each word is 256 initialized-tick slots, so 20 words is +-51,200 ticks for a 10 spacing pool
+    words = click.prompt("Bitmap words on each side of the current price", default=20)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    factory = Contract(FACTORY)
+    multicall = Contract(MULTICALL2)
+    block = chain.height
+    for stable, fee in ROUTES:
+        name, address = STABLES[stable]
+        pool_address = factory.getPool(WETH, address, fee)
+        if int(pool_address, 16) == 0:
+            continue
+        pool = snapshot(Contract(pool_address), multicall, words, block)
+        pool.save(directory / f"{name}_{fee}.json")
+        print(f"{name} {fee}: {len(pool.ticks)} initialized ticks")
+    print(f"\nSaved at block {block}")
@@ -0,0 +1 @@
+# Off-chain models of our strategy and the pools it trades through. Nothing in here needs a chain or brownie.
@@ -0,0 +1,194 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from sim.swaps import NoSwaps, SwapModel, USDT
+
+# A Python copy of StrategyCurve3CrvRewardsClonable's accounting, so we can run huge numbers of harvest scenarios without
+# a chain. Each method follows the contract function of the same name line by line, with integer math and the same
+# dust thresholds. Gauges, the vault and swaps are reduced to the numbers the strategy sees: what's claimable, our debt,
+# and what a swap model says each trade returns. tests/test_accounting_model.py checks us against the real contract.
+
+FEE_DENOMINATOR = 10_000
+CRV_DUST = 10 ** 17  # _sell() skips CRV at or below this
+WETH_DUST = 10 ** 15  # and WETH at or below this
+CRV_SELL_GAS = 150_000  # _initializeStrat()'s default crvSellGas
+WETH_SELL_GAS = 350_000  # and wethSellGas
+
+
+@dataclass
+class HarvestResult:
+    profit: int
+    loss: int
+    debt_payment: int
+
+
+@dataclass
+class StrategyModel:
+    # balances held by our strategy, in wei
+    want_balance: int = 0
+    staked_balance: int = 0
+    crv_balance: int = 0
+    weth_balance: int = 0
+    stable_balances: List[int] = field(default_factory=lambda: [0, 0, 0])
+    rewards_balance: int = 0
+
+    # waiting for us in the gauge, claimed on our next harvest
+    claimable_crv: int = 0
+    claimable_rewards: int = 0
+
+    # settings, defaults are from _initializeStrat()
+    keep_crv: int = 1000
+    has_rewards: bool = False
+    target_stable: int = USDT
+    uni_stable_fee: int = 500
+    emergency_exit: bool = False
+    min_report_delay: int = 21 * 86400
+    max_report_delay: int = 100 * 86400
+    credit_threshold: int = 10 ** 24
+    force_harvest_trigger_once: bool = False
+    base_fee: int = 0  # from our base fee oracle's provider, in wei
+    crv_sell_gas: int = CRV_SELL_GAS  # we skip anything worth less than the gas to sell it at our base fee
+    weth_sell_gas: int = WETH_SELL_GAS
+    harvest_on_profit: bool = False
+    profit_factor: int = 100
+
+    swaps: SwapModel = field(default_factory=NoSwaps)
+
+    # how much CRV we've sent to our voter, just for reporting
+    sent_to_voter: int = 0
+
+    def estimated_total_assets(self):
+        return self.want_balance + self.staked_balance
+
+    def adjust_position(self, debt_outstanding):
+        if self.emergency_exit:
+            return
+        self.staked_balance += self.want_balance
+        self.want_balance = 0
+
+    def liquidate_position(self, amount_needed):
+        want_balance = self.want_balance
+        if amount_needed > want_balance:
+            if self.staked_balance > 0:
+                self._withdraw(min(self.staked_balance, amount_needed - want_balance))
+            liquidated_amount = min(amount_needed, self.want_balance)
+            return liquidated_amount, amount_needed - liquidated_amount
+        return amount_needed, 0
+
+    def liquidate_all_positions(self):
+        if self.staked_balance > 0:
+            self._withdraw(self.staked_balance)
+        return self.want_balance
+
+    def prepare_return(self, debt_outstanding, total_debt):
+        profit = loss = debt_payment = 0
+
+        staked_balance = self.staked_balance
+        crv_balance = self.crv_balance
+        if staked_balance > 0:
+            # we only keep some of what we claim, unsold CRV already had keepCRV taken out
+            send_to_voter = self.claimable_crv * self.keep_crv // FEE_DENOMINATOR
+            self.crv_balance += self.claimable_crv - send_to_voter
+            self.sent_to_voter += send_to_voter
+            self.claimable_crv = 0
+            crv_balance = self.crv_balance
+
+        if self.has_rewards:
+            self.rewards_balance += self.claimable_rewards
+            self.claimable_rewards = 0
+            if self.rewards_balance > 0:
+                self.weth_balance += self.swaps.rewards_to_weth(self.rewards_balance)
+                self.rewards_balance = 0
+
+        self._sell(crv_balance)
+
+        # only our target stable is deposited, anything else waits to be swept
+        if self.stable_balances[self.target_stable] > 0:
+            amounts = [0, 0, 0]
+            amounts[self.target_stable] = self.stable_balances[self.target_stable]
+            self.want_balance += self.swaps.stables_to_want(amounts)
+            self.stable_balances[self.target_stable] = 0
+
+        if debt_outstanding > 0:
+            if staked_balance > 0:
+                self._withdraw(min(staked_balance, debt_outstanding))
+            debt_payment = min(debt_outstanding, self.want_balance)
+
+        assets = self.estimated_total_assets()
+        if assets > total_debt:
+            profit = assets - total_debt
+            if profit + debt_payment > self.want_balance:
+                # this should only be hit following donations to strategy
+                self.liquidate_all_positions()
+        else:
+            loss = total_debt - assets
+
+        self.force_harvest_trigger_once = False
+        return HarvestResult(profit, loss, debt_payment)
+
+    # BaseStrategy.harvest(), with the vault's side of report() reduced to the credit it sends us (or takes back)
+    def harvest(self, debt_outstanding, total_debt, credit=0):
+        if self.emergency_exit:
+            amount_freed = self.liquidate_all_positions()
+            loss = profit = 0
+            if amount_freed < debt_outstanding:
+                loss = debt_outstanding - amount_freed
+            elif amount_freed > debt_outstanding:
+                profit = amount_freed - debt_outstanding
+            result = HarvestResult(profit, loss, debt_outstanding - loss)
+        else:
+            result = self.prepare_return(debt_outstanding, total_debt)
+
+        # the vault pulls our profit and debt payment, minus any credit it has for us
+        total_available = result.profit + result.debt_payment
+        if total_available > self.want_balance + credit:
+            raise ValueError("Strategy can't pay the vault what it reported")
+        self.want_balance += credit - total_available
+
+        self.adjust_position(debt_outstanding)
+        return result
+
+    # claimable_profit and call_cost are in want, like claimableProfitInWant() and ethToWant(callCostinEth)
+    def harvest_trigger(
+        self,
+        seconds_since_report,
+        credit_available=0,
+        base_fee_acceptable=True,
+        debt_ratio=1,
+        claimable_profit=0,
+        call_cost=0,
+    ):
+        # isActive() from BaseStrategy
+        if debt_ratio == 0 and self.estimated_total_assets() == 0:
+            return False
+        if seconds_since_report > self.max_report_delay:
+            return True
+        if not base_fee_acceptable:
+            return False
+        if self.force_harvest_trigger_once:
+            return True
+        if self.harvest_on_profit:
+            if claimable_profit > self.profit_factor * call_cost:
+                return True
+        elif seconds_since_report > self.min_report_delay:
+            return True
+        return credit_available > self.credit_threshold
+
+    def _withdraw(self, amount):
+        self.staked_balance -= amount
+        self.want_balance += amount
+
+    def _sell(self, crv_amount):
+        if (
+            crv_amount > CRV_DUST
+            and crv_amount * self.swaps.crv_price_oracle() // 10 ** 18
+            > self.base_fee * self.crv_sell_gas
+        ):
+            self.crv_balance -= crv_amount
+            self.weth_balance += self.swaps.crv_to_weth(crv_amount)
+
+        if self.weth_balance > max(WETH_DUST, self.base_fee * self.weth_sell_gas):
+            self.stable_balances[self.target_stable] += self.swaps.weth_to_stable(
+                self.weth_balance, self.target_stable, self.uni_stable_fee
+            )
+            self.weth_balance = 0
@@ -0,0 +1,147 @@
+import numpy as np
+
+# Tunes our harvestTrigger settings from data. We replay a base fee time series, our CRV emissions and the vault's
+# deposits and withdrawals against every (minReportDelay, maxReportDelay, creditThreshold, maxAcceptableBaseFee,
+# harvestOnProfit) setting in a grid at once. Time is stepped in a loop since each harvest changes what comes next, but
+# every setting in the grid is handled together with NumPy, so one pass prices thousands of settings. Amounts are in
+# want, as floats.
+
+# a rough harvest, with CRV sold through crveth, uniswap and the zap
+HARVEST_GAS = 1_500_000
+
+
+def make_grid(
+    min_delays, max_delays, credit_thresholds, max_base_fees, harvest_on_profit=(False,)
+):
+    grid = np.meshgrid(
+        np.asarray(min_delays, dtype=float),
+        np.asarray(max_delays, dtype=float),
+        np.asarray(credit_thresholds, dtype=float),
+        np.asarray(max_base_fees, dtype=float),
+        np.asarray(harvest_on_profit, dtype=bool),
+        indexing="ij",
+    )
+    names = (
+        "min_report_delay",
+        "max_report_delay",
+        "credit_threshold",
+        "max_base_fee",
+        "harvest_on_profit",
+    )
+    return {name: values.ravel() for name, values in zip(names, grid)}
+
+
+# same order of checks as harvestTrigger(). every argument can be an array, so we check a whole grid at once.
+# claimable_profit and call_cost are in want, like claimableProfitInWant() and ethToWant(callCostinEth).
+def harvest_trigger(
+    since_report,
+    credit,
+    base_fee,
+    min_report_delay,
+    max_report_delay,
+    credit_threshold,
+    max_base_fee,
+    harvest_on_profit=False,
+    claimable_profit=0.0,
+    call_cost=0.0,
+    profit_factor=100,
+):
+    fee_ok = base_fee <= max_base_fee
+    # with harvestOnProfit, we wait for a profitable harvest instead of minReportDelay
+    due = np.where(
+        harvest_on_profit,
+        claimable_profit > profit_factor * call_cost,
+        since_report > min_report_delay,
+    )
+    return (since_report > max_report_delay) | (
+        fee_ok & (due | (credit > credit_threshold))
+    )
+
+
+def simulate(
+    grid,
+    base_fees,
+    step,
+    crv_per_want,
+    crv_price,
+    eth_price,
+    flows=None,
+    starting_assets=0.0,
+    keep_crv=0.1,
+    harvest_gas=HARVEST_GAS,
+    profit_factor=100,
+):
+    # base_fees are in gwei, one for each step of step seconds. crv_per_want is CRV earned per second per want staked.
+    # crv_price and eth_price are in want, either one number or one for each step. flows are want deposited into the
+    # vault (or withdrawn, if negative) during each step. our keeper's call cost is one harvest at each step's base fee.
+    base_fees = np.asarray(base_fees, dtype=float)
+    steps = len(base_fees)
+    crv_price = np.broadcast_to(np.asarray(crv_price, dtype=float), (steps,))
+    eth_price = np.broadcast_to(np.asarray(eth_price, dtype=float), (steps,))
+    flows = np.zeros(steps) if flows is None else np.asarray(flows, dtype=float)
+
+    size = len(grid["min_report_delay"])
+    harvest_on_profit = grid.get("harvest_on_profit", np.zeros(size, dtype=bool))
+    staked = np.full(size, float(starting_assets))
+    credit = np.zeros(size)
+    claimable = np.zeros(size)  # CRV waiting in our gauge
+    last_report = np.zeros(size)
+    profit = np.zeros(size)
+    gas_spent = np.zeros(size)
+    harvests = np.zeros(size, dtype=int)
+
+    for i in range(steps):
+        now = (i + 1) * step
+        claimable += staked * crv_per_want * step
+
+        # deposits wait in the vault until we harvest, withdrawals come out of idle funds first
+        credit += flows[i]
+        short = np.minimum(credit, 0.0)
+        staked = np.maximum(staked + short, 0.0)
+        credit -= short
+
+        value = claimable * (1 - keep_crv) * crv_price[i]
+        call_cost = harvest_gas * base_fees[i] * 1e-9 * eth_price[i]
+        trigger = harvest_trigger(
+            now - last_report,
+            credit,
+            base_fees[i],
+            grid["min_report_delay"],
+            grid["max_report_delay"],
+            grid["credit_threshold"],
+            grid["max_base_fee"],
+            harvest_on_profit,
+            value,
+            call_cost,
+            profit_factor,
+        )
+        sold = np.where(trigger, value, 0.0)
+        cost = np.where(trigger, call_cost, 0.0)
+
+        # our profit goes back to the vault and comes right back to us as credit
+        staked += np.where(trigger, credit + sold, 0.0)
+        credit = np.where(trigger, 0.0, credit)
+        claimable = np.where(trigger, 0.0, claimable)
+        last_report = np.where(trigger, now, last_report)
+        profit += sold
+        gas_spent += cost
+        harvests += trigger
+
+    # CRV still in our gauge is ours too, so longer intervals aren't penalized for it. we count it as if we harvested
+    # once more at the end, and only if that harvest pays for its own gas.
+    unharvested = claimable * (1 - keep_crv) * crv_price[-1]
+    final_cost = harvest_gas * base_fees[-1] * 1e-9 * eth_price[-1]
+    return {
+        **grid,
+        "profit": profit,
+        "gas_spent": gas_spent,
+        "net_yield": profit - gas_spent + np.maximum(unharvested - final_cost, 0.0),
+        "harvests": harvests,
+        "unharvested": unharvested,
+    }
+
+
+# our best settings first, as a list of dicts
+def rank(results, top=10):
+    order = np.argsort(-results["net_yield"])[:top]
+    return [{name: values[i].item() for name, values in results.items()} for i in order]
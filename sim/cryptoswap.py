@@ -0,0 +1,247 @@
+import numpy as np
+
+# Curve's two-coin crypto invariant, following CurveCryptoSwap2ETH (our CRV-ETH pool) line by line so get_dy matches
+# on-chain to the wei. Like sim/stableswap.py, amounts can be a number or an array of Python ints (dtype=object), and
+# Newton's method keeps going until every element has converged. Coin 0 is WETH and coin 1 is CRV in crveth.
+
+PRECISION = 10 ** 18
+A_MULTIPLIER = 10_000
+N_COINS = 2
+FEE_DENOMINATOR = 10 ** 10
+EXP_PRECISION = 10 ** 10
+MAX_ITERATIONS = 255
+
+
+def _array(value):
+    return np.asarray(value, dtype=object)
+
+
+# np.where on plain ints would cast to int64, so keep everything as objects
+def _where(condition, a, b):
+    return np.where(condition, _array(a), _array(b))
+
+
+def _result(value):
+    return int(value) if np.ndim(value) == 0 else value
+
+
+def geometric_mean(x):
+    d = x[0]
+    for _ in range(MAX_ITERATIONS):
+        d_prev = d
+        d = (d + x[0] * x[1] // d) // N_COINS
+        if abs(d - d_prev) <= 1 or abs(d - d_prev) * 10 ** 18 < d:
+            return d
+    raise ValueError("geometric_mean didn't converge")
+
+
+# the pool's invariant D for balances x (in the pool's internal units), ann is A() and gamma is gamma()
+def newton_D(ann, gamma, x):
+    x = sorted(x, reverse=True)
+    d = N_COINS * geometric_mean(x)
+    s = x[0] + x[1]
+    for _ in range(MAX_ITERATIONS):
+        d_prev = d
+        k0 = (10 ** 18 * N_COINS ** 2) * x[0] // d * x[1] // d
+        g1k0 = gamma + 10 ** 18
+        g1k0 = g1k0 - k0 + 1 if g1k0 > k0 else k0 - g1k0 + 1
+        mul1 = 10 ** 18 * d // gamma * g1k0 // gamma * g1k0 * A_MULTIPLIER // ann
+        mul2 = (2 * 10 ** 18) * N_COINS * k0 // g1k0
+        neg_fprime = (
+            (s + s * mul2 // 10 ** 18) + mul1 * N_COINS // k0 - mul2 * d // 10 ** 18
+        )
+        d_plus = d * (neg_fprime + s) // neg_fprime
+        d_minus = d * d // neg_fprime
+        if 10 ** 18 > k0:
+            d_minus += d * (mul1 // neg_fprime) // 10 ** 18 * (10 ** 18 - k0) // k0
+        else:
+            d_minus -= d * (mul1 // neg_fprime) // 10 ** 18 * (k0 - 10 ** 18) // k0
+        d = d_plus - d_minus if d_plus > d_minus else (d_minus - d_plus) // 2
+        if abs(d - d_prev) * 10 ** 14 < max(10 ** 16, d):
+            return d
+    raise ValueError("newton_D didn't converge")
+
+
+# balance of coin i that keeps D, with the other coin at x[1 - i]. x[1 - i] can be an array.
+def newton_y(ann, gamma, x, d, i):
+    x_j = _array(x[1 - i])
+    y = d ** 2 // (x_j * N_COINS ** 2)
+    k0_i = (10 ** 18 * N_COINS) * x_j // d
+    limit = np.maximum(np.maximum(x_j // 10 ** 14, _array(d // 10 ** 14)), _array(100))
+    done = np.zeros(np.shape(y), dtype=bool)
+    for _ in range(MAX_ITERATIONS):
+        if done.all():
+            return _result(y)
+        y_prev = y
+        k0 = k0_i * y * N_COINS // d
+        s = x_j + y
+        g1k0 = gamma + 10 ** 18
+        g1k0 = _where(g1k0 > k0, g1k0 - k0 + 1, k0 - g1k0 + 1)
+        mul1 = 10 ** 18 * d // gamma * g1k0 // gamma * g1k0 * A_MULTIPLIER // ann
+        mul2 = 10 ** 18 + (2 * 10 ** 18) * k0 // g1k0
+        yfprime = 10 ** 18 * y + s * mul2 + mul1
+        dyfprime = d * mul2
+        # curve halves y and tries again when it overshoots
+        overshot = np.asarray(yfprime < dyfprime, dtype=bool)
+        yfprime = _where(overshot, yfprime, yfprime - dyfprime)
+        fprime = yfprime // y
+        y_minus = mul1 // fprime
+        y_plus = (yfprime + 10 ** 18 * d) // fprime + y_minus * 10 ** 18 // k0
+        y_minus = y_minus + 10 ** 18 * s // fprime
+        halve = overshot | np.asarray(y_plus < y_minus, dtype=bool)
+        new_y = _where(halve, y_prev // 2, y_plus - y_minus)
+        diff = _where(new_y > y_prev, new_y - y_prev, y_prev - new_y)
+        y = _where(done, y, new_y)
+        limit_y = np.maximum(limit, y // 10 ** 14)
+        done = done | (~overshot & np.asarray(diff < limit_y, dtype=bool))
+    raise ValueError("newton_y didn't converge")
+
+
+# 2 ** -(power / 1e18), for the price oracle's moving average
+def halfpow(power):
+    intpow = power // 10 ** 18
+    otherpow = power - intpow * 10 ** 18
+    if intpow > 59:
+        return 0
+    result = 10 ** 18 // 2 ** intpow
+    if otherpow == 0:
+        return result
+    term = 10 ** 18
+    x = 5 * 10 ** 17
+    s = 10 ** 18
+    neg = False
+    for i in range(1, 256):
+        k = i * 10 ** 18
+        c = k - 10 ** 18
+        if otherpow > c:
+            c = otherpow - c
+            neg = not neg
+        else:
+            c -= otherpow
+        term = term * (c * x // 10 ** 18) // k
+        s = s - term if neg else s + term
+        if term < EXP_PRECISION:
+            return result * s // 10 ** 18
+    raise ValueError("halfpow didn't converge")
+
+
+class CryptoSwap:
+    # a snapshot of the pool's storage. precisions are 10 ** (18 - decimals) for each coin, so (1, 1) for crveth.
+    def __init__(
+        self,
+        balances,
+        d,
+        ann,
+        gamma,
+        mid_fee,
+        out_fee,
+        fee_gamma,
+        price_scale,
+        price_oracle,
+        last_prices,
+        last_prices_timestamp,
+        ma_half_time,
+        future_a_gamma_time=0,
+        precisions=(1, 1),
+        price_oracle_timestamp=None,
+    ):
+        self.balances = list(balances)
+        self.d = d
+        self.ann = ann
+        self.gamma = gamma
+        self.mid_fee = mid_fee
+        self.out_fee = out_fee
+        self.fee_gamma = fee_gamma
+        self.price_scale = price_scale
+        self._price_oracle = price_oracle
+        self.last_prices = last_prices
+        self.last_prices_timestamp = last_prices_timestamp
+        self.ma_half_time = ma_half_time
+        self.future_a_gamma_time = future_a_gamma_time
+        self.precisions = precisions
+        # when price_oracle was taken. the pool stores it as of last_prices_timestamp, but its public price_oracle() has
+        # already moved it toward last_prices up to the block we read it at, so we only move it from there.
+        self.price_oracle_timestamp = (
+            last_prices_timestamp
+            if price_oracle_timestamp is None
+            else price_oracle_timestamp
+        )
+
+    # read the pool's current state from its contract (brownie or web3 style), as of the timestamp of the block we read
+    @classmethod
+    def from_contract(cls, pool, timestamp):
+        return cls(
+            [pool.balances(0), pool.balances(1)],
+            pool.D(),
+            pool.A(),
+            pool.gamma(),
+            pool.mid_fee(),
+            pool.out_fee(),
+            pool.fee_gamma(),
+            pool.price_scale(),
+            pool.price_oracle(),
+            pool.last_prices(),
+            pool.last_prices_timestamp(),
+            pool.ma_half_time(),
+            pool.future_A_gamma_time(),
+            price_oracle_timestamp=timestamp,
+        )
+
+    def xp(self, balances=None):
+        balances = self.balances if balances is None else balances
+        return [
+            balances[0] * self.precisions[0],
+            balances[1] * self.precisions[1] * self.price_scale // PRECISION,
+        ]
+
+    # our fee in 1e10 units, from mid_fee when the pool is balanced up to out_fee when it isn't
+    def fee(self, xp):
+        f = xp[0] + xp[1]
+        f = (
+            self.fee_gamma
+            * 10 ** 18
+            // (
+                self.fee_gamma
+                + 10 ** 18
+                - (10 ** 18 * N_COINS ** N_COINS) * xp[0] // f * xp[1] // f
+            )
+        )
+        return (self.mid_fee * f + self.out_fee * (10 ** 18 - f)) // 10 ** 18
+
+    # what exchange(i, j, dx) gets us, after fees. dx can be an array of sizes.
+    def get_dy(self, i, j, dx):
+        d = self.d
+        if self.future_a_gamma_time > 0:
+            d = newton_D(self.ann, self.gamma, self.xp())
+        balances = list(self.balances)
+        balances[i] = balances[i] + _array(dx)
+        xp = self.xp(balances)
+        y = newton_y(self.ann, self.gamma, xp, d, j)
+        dy = xp[j] - y - 1
+        xp[j] = y
+        if j > 0:
+            dy = dy * PRECISION // (self.price_scale * self.precisions[1])
+        else:
+            dy = dy // self.precisions[0]
+        return _result(dy - self.fee(xp) * dy // FEE_DENOMINATOR)
+
+    # the pool's moving average price of coin 1 in coin 0, as of timestamp
+    def price_oracle(self, timestamp):
+        if self.price_oracle_timestamp < timestamp:
+            alpha = halfpow(
+                (timestamp - self.price_oracle_timestamp)
+                * 10 ** 18
+                // self.ma_half_time
+            )
+            return (
+                self.last_prices * (10 ** 18 - alpha) + self._price_oracle * alpha
+            ) // 10 ** 18
+        return self._price_oracle
+
+    # how much worse than the price oracle each size of our sale does, fees included (0.01 = 1%)
+    def price_impact(self, i, j, dx, timestamp):
+        price = self.price_oracle(timestamp)
+        dx = _array(dx)
+        dy = _array(self.get_dy(i, j, dx))
+        fair = dx * price // PRECISION if i == 1 else dx * PRECISION // price
+        return 1 - np.asarray(dy / fair, dtype=float)
@@ -0,0 +1,98 @@
+import numpy as np
+
+# Picks keepCRV for each of our strategies. CRV we keep is locked as veCRV by Yearn's voter, which boosts every one of our
+# gauges, while CRV we sell is yield today. For each keepCRV in a grid we work out our new veCRV, our boost and CRV
+# earned in every gauge, and the net APR after what we keep. Everything is arrays over (strategy, keepCRV, gauge), so
+# hundreds of gauges take well under a second.
+#
+# gauges is a dict of arrays with one entry per gauge:
+#   balance: our voter's deposit in the gauge, total_supply: everyone's deposits
+#   working_supply: the gauge's current working supply, including us
+#   inflation_rate: CRV per second going to the gauge (its weight times Curve's rate)
+#   tvl: our deposit's value in the same units as crv_price
+#   keep_crv: what each strategy uses now, in basis points
+
+TOKENLESS_PRODUCTION = 0.4  # curve counts 40% of our deposit with no veCRV at all
+YEAR = 365 * 86400
+
+
+# same formula as LiquidityGauge._update_liquidity_limit
+def working_balance(balance, total_supply, ve_balance, ve_total):
+    limit = TOKENLESS_PRODUCTION * balance + (1 - TOKENLESS_PRODUCTION) * np.where(
+        ve_total > 0, total_supply * ve_balance / ve_total, 0.0
+    )
+    return np.minimum(limit, balance)
+
+
+def boost(balance, total_supply, ve_balance, ve_total):
+    return working_balance(balance, total_supply, ve_balance, ve_total) / (
+        TOKENLESS_PRODUCTION * balance
+    )
+
+
+# our CRV per second in each gauge, and our boost there, for a given amount of veCRV held by our voter
+def crv_earned(gauges, ve_balance, ve_total):
+    balance = gauges["balance"]
+    current = working_balance(
+        balance, gauges["total_supply"], gauges["ve_balance"], gauges["ve_total"]
+    )
+    ours = working_balance(balance, gauges["total_supply"], ve_balance, ve_total)
+    working_supply = gauges["working_supply"] - current + ours
+    return gauges["inflation_rate"] * ours / working_supply, ours / (
+        TOKENLESS_PRODUCTION * balance
+    )
+
+
+def _prepare(gauges, ve_balance, ve_total):
+    gauges = {name: np.asarray(values, dtype=float) for name, values in gauges.items()}
+    gauges["ve_balance"] = float(ve_balance)
+    gauges["ve_total"] = float(ve_total)
+    return gauges
+
+
+# veCRV we'll have, on average, over our horizon if we keep these fractions of what we earn now (k is broadcast
+# against rates). kept CRV is locked for the max time, so 1 CRV is about 1 veCRV.
+def _added_ve(rates, k, horizon):
+    return (rates * k).sum(axis=-1) * horizon / 2
+
+
+# every strategy uses the same keepCRV (in basis points) from keep_grid. returns boost, CRV APR and net APR after what we
+# keep, each shaped (gauge, keepCRV), plus our fleet's total net yield per year for each keepCRV.
+def simulate(gauges, ve_balance, ve_total, keep_grid, crv_price, horizon=YEAR):
+    gauges = _prepare(gauges, ve_balance, ve_total)
+    k = np.asarray(keep_grid, dtype=float)[:, None] / 10_000
+    rates, _ = crv_earned(gauges, gauges["ve_balance"], gauges["ve_total"])
+
+    added = _added_ve(rates[None, :], k, horizon)[:, None]
+    earned, boosts = crv_earned(gauges, ve_balance + added, ve_total + added)
+    gross = earned * YEAR * crv_price
+    net = gross * (1 - k)
+    return {
+        "keep_crv": np.asarray(keep_grid),
+        "boost": boosts.T,
+        "apr": (gross / gauges["tvl"]).T,
+        "net_apr": (net / gauges["tvl"]).T,
+        "fleet_net_yield": net.sum(axis=1),
+    }
+
+
+# try each keepCRV in keep_grid for one strategy at a time, with the rest of our fleet on their current keep_crv. since
+# veCRV boosts all of our gauges, we score each choice by our whole fleet's net yield. returns the best keepCRV for each
+# strategy in basis points, and our fleet's net yield for every (strategy, keepCRV).
+def recommend(gauges, ve_balance, ve_total, keep_grid, crv_price, horizon=YEAR):
+    gauges = _prepare(gauges, ve_balance, ve_total)
+    size = len(gauges["balance"])
+    grid = np.asarray(keep_grid, dtype=float) / 10_000
+    current = gauges["keep_crv"] / 10_000
+    rates, _ = crv_earned(gauges, gauges["ve_balance"], gauges["ve_total"])
+
+    # keep[i, j, g] is what gauge g keeps when strategy i tries keep_grid[j]
+    keep = np.broadcast_to(current, (size, len(grid), size)).copy()
+    diagonal = np.arange(size)
+    keep[diagonal, :, diagonal] = grid
+
+    added = _added_ve(rates, keep, horizon)[..., None]
+    earned, _ = crv_earned(gauges, ve_balance + added, ve_total + added)
+    fleet = (earned * YEAR * crv_price * (1 - keep)).sum(axis=-1)
+    best = np.asarray(keep_grid)[np.argmax(fleet, axis=1)]
+    return {"keep_crv": best, "fleet_net_yield": fleet}
@@ -0,0 +1,203 @@
+import csv
+import heapq
+import json
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from itertools import groupby
+from pathlib import Path
+from typing import Optional
+
+from sim.accounting import StrategyModel
+from sim.swaps import DAI, STABLE_DECIMALS, FixedRateSwaps
+
+# Replays our real harvest history through the accounting model in sim/accounting.py with different settings, to see
+# what another keepCRV, targetStable, uniStableFee or harvest cadence would have made us. Input is exported history,
+# one record per row in JSON lines, CSV or Parquet, sorted by timestamp. We only ever hold one timestamp's records and
+# one model per (strategy, scenario), so years of history for a whole fleet stream through in constant memory.
+#
+# Every record has event, strategy and timestamp, plus:
+#   Harvested: profit, loss, debtPayment, debtOutstanding (the event's args), and optionally gas_used and gas_price
+#   StrategyReported: the vault event's args (gain, loss, debtPaid, totalDebt, ...)
+#   Swap: what one harvest claimed and the prices it got. crv_claimed is all CRV claimed before keepCRV, crv_price is
+#       WETH per CRV, weth_price_dai/usdc/usdt are stables per WETH before uniswap's fee (in each stable's decimals),
+#       virtual_price is stables (18 decimals) per want, and keep_crv, target_stable and uni_stable_fee are the
+#       settings the strategy had. all prices are 1e18 based, and any stable without a price uses another's.
+#
+# Uniswap fee tiers only differ by their fee here, since we only know the depth of the pool we actually used.
+
+
+@dataclass
+class Scenario:
+    # None means whatever the strategy actually used at the time
+    keep_crv: Optional[int] = None
+    target_stable: Optional[int] = None
+    uni_stable_fee: Optional[int] = None
+    # harvest only at our real harvests where the model's harvestTrigger would have fired
+    min_report_delay: Optional[int] = None
+    max_report_delay: Optional[int] = None
+
+
+# exports often write big numbers as strings, so read anything that looks like a number as an int
+def _number(value):
+    if not isinstance(value, str):
+        return value
+    if value == "":
+        return None
+    try:
+        return int(Decimal(value))
+    except InvalidOperation:
+        return value
+
+
+def _read_file(path):
+    path = Path(path)
+    if path.suffix == ".csv":
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                yield {name: _number(value) for name, value in row.items()}
+    elif path.suffix == ".parquet":
+        import pyarrow.parquet as pq  # only needed for parquet
+
+        for batch in pq.ParquetFile(path).iter_batches():
+            yield from batch.to_pylist()
+    else:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield {
+                        name: _number(value) for name, value in json.loads(line).items()
+                    }
+
+
+# every record from all of our files, merged by timestamp
+def read_records(*paths):
+    return heapq.merge(
+        *(_read_file(path) for path in paths), key=lambda record: record["timestamp"]
+    )
+
+
+class HistoricalSwaps(FixedRateSwaps):
+    # prices from one of our Swap records
+    def __init__(self, swap):
+        prices = [swap.get(f"weth_price_{name}") for name in ("dai", "usdc", "usdt")]
+        known = next((i for i, price in enumerate(prices) if price), None)
+        if known is None:
+            raise ValueError(f"Swap record has no WETH price: {swap}")
+        # stables are all worth about a dollar, so fill in any we don't have from one we do
+        for i, price in enumerate(prices):
+            if not price:
+                prices[i] = (
+                    prices[known]
+                    * 10 ** STABLE_DECIMALS[i]
+                    // 10 ** STABLE_DECIMALS[known]
+                )
+        super().__init__(
+            crv_price=swap["crv_price"],
+            weth_prices=tuple(prices),
+            rewards_price=swap.get("rewards_price") or 0,
+            virtual_price=swap["virtual_price"],
+        )
+
+    # want per WETH, for pricing our gas
+    def eth_to_want(self, amount):
+        stable = self.weth_prices[DAI] * amount // 10 ** 18
+        return stable * 10 ** 18 // self.virtual_price
+
+
+class Replay:
+    def __init__(self, scenarios):
+        self.scenarios = scenarios
+        self.models = {}
+        self.last_harvest = {}
+        self.results = {}
+
+    def _model(self, strategy, name):
+        key = (strategy, name)
+        if key not in self.models:
+            self.models[key] = StrategyModel()
+            self.results[key] = {
+                "harvests": 0,
+                "profit": 0,
+                "gas": 0,
+                "kept_crv": 0,
+                "actual_harvests": 0,
+                "actual_profit": 0,
+                "actual_gas": 0,
+            }
+        return self.models[key], self.results[key]
+
+    # everything one strategy did at one timestamp, which is one harvest for us
+    def _harvest(self, strategy, timestamp, records):
+        events = {record["event"]: record for record in records}
+        harvested = events.get("Harvested")
+        if harvested is None:
+            return
+        swap = events.get("Swap", {})
+        reported = events.get("StrategyReported", {})
+        swaps = HistoricalSwaps(swap) if swap else None
+        gas = (harvested.get("gas_used") or 0) * (harvested.get("gas_price") or 0)
+        gas = swaps.eth_to_want(gas) if swaps else 0
+
+        for name, scenario in self.scenarios.items():
+            model, result = self._model(strategy, name)
+            result["actual_harvests"] += 1
+            result["actual_profit"] += harvested["profit"]
+            result["actual_gas"] += gas
+            model.claimable_crv += swap.get("crv_claimed") or 0
+
+            for setting in ("keep_crv", "target_stable", "uni_stable_fee"):
+                value = getattr(scenario, setting)
+                value = swap.get(setting) if value is None else value
+                if value is not None:
+                    setattr(model, setting, value)
+            if scenario.min_report_delay is not None:
+                model.min_report_delay = scenario.min_report_delay
+            if scenario.max_report_delay is not None:
+                model.max_report_delay = scenario.max_report_delay
+
+            # with our real cadence we harvest every time, otherwise only when our trigger would have
+            last = self.last_harvest.get((strategy, name))
+            if (
+                scenario.min_report_delay is not None
+                or scenario.max_report_delay is not None
+            ) and last is not None:
+                model.staked_balance = reported.get("totalDebt") or 0
+                if not model.harvest_trigger(timestamp - last):
+                    continue
+            if swaps is None:
+                continue
+
+            # the vault takes our profit, and everything else stays staked
+            total_debt = reported.get("totalDebt") or 0
+            model.swaps = swaps
+            model.staked_balance = total_debt
+            model.want_balance = 0
+            sent_to_voter = model.sent_to_voter
+            harvest = model.prepare_return(0, total_debt)
+            model.want_balance = 0
+
+            self.last_harvest[(strategy, name)] = timestamp
+            result["harvests"] += 1
+            result["profit"] += harvest.profit
+            result["gas"] += gas
+            result["kept_crv"] += model.sent_to_voter - sent_to_voter
+
+    # replay our records, and return our totals for each (strategy, scenario)
+    def run(self, records):
+        for timestamp, at_time in groupby(
+            records, key=lambda record: record["timestamp"]
+        ):
+            at_time = sorted(at_time, key=lambda record: record["strategy"])
+            for strategy, records_for in groupby(
+                at_time, key=lambda record: record["strategy"]
+            ):
+                self._harvest(strategy, timestamp, list(records_for))
+
+        for result in self.results.values():
+            result["net"] = result["profit"] - result["gas"]
+            result["actual_net"] = result["actual_profit"] - result["actual_gas"]
+        return self.results
+
+
+def replay(paths, scenarios):
+    return Replay(scenarios).run(read_records(*paths))
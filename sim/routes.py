@@ -0,0 +1,48 @@
+import numpy as np
+from sim.swaps import DAI, USDC, USDT
+
+# Picks targetStable and uniStableFee for our next harvest. Our WETH can go to any of our three stables through any
+# uniswap v3 fee tier, and each choice then goes through the zap into our metapool. We quote every route's zap deposit in
+# one batched call to sim/stableswap.py, so each is priced with the slippage and imbalance fees of our actual harvest.
+
+UNI_FEES = (100, 500, 3000, 10000)
+ROUTES = [(stable, fee) for stable in (DAI, USDC, USDT) for fee in UNI_FEES]
+
+
+# uniswap v3 path for exactInput, the same as the one our strategy builds in _sell()
+def uni_path(weth, fee, stable):
+    return bytes.fromhex(weth[2:]) + fee.to_bytes(3, "big") + bytes.fromhex(stable[2:])
+
+
+# stable_out[r] is what routes[r] gets us from uniswap (0 if the pool doesn't exist). returns the LP we'd get for each.
+def quote_routes(metapool, stable_out, routes=ROUTES):
+    stables = np.array([stable for stable, _ in routes])
+    amounts = [np.zeros(len(routes), dtype=object)]
+    for stable in (DAI, USDC, USDT):
+        deposit = np.zeros(len(routes), dtype=object)
+        deposit[stables == stable] = [
+            int(amount) for amount, s in zip(stable_out, stables) if s == stable
+        ]
+        amounts.append(deposit)
+    return metapool.add_liquidity(amounts)
+
+
+# what uniswap gets us on each route, from our snapshots in sim/univ3.py. pools maps (stable, fee) to a pool, and any
+# route without one quotes as 0.
+def uniswap_quotes(pools, weth, weth_in, routes=ROUTES):
+    return [
+        pools[route].quote_exact_input(weth, weth_in) if route in pools else 0
+        for route in routes
+    ]
+
+
+# our best route, and how much more it gets us than the one we use now
+def best_route(want_out, current, routes=ROUTES):
+    best = int(np.argmax(want_out))
+    stable, fee = routes[best]
+    return {
+        "target_stable": stable,
+        "uni_stable_fee": fee,
+        "want": int(want_out[best]),
+        "gain": int(want_out[best] - want_out[routes.index(current)]),
+    }
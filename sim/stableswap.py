@@ -0,0 +1,235 @@
+import numpy as np
+
+# Curve StableSwap math, following the vyper pools line by line so we match on-chain results to the wei. Every amount
+# can be a number or an array, and arrays are quoted all at once. We keep arrays as Python ints (dtype=object) since
+# uint256 math doesn't fit in int64. Newton's method runs until every element has converged.
+#
+# StableSwap is one pool (3pool, or a metapool's own [coin, 3Crv] pair), and Metapool3Crv puts a metapool on top of 3pool
+# the way curve's zap does, taking [coin, dai, usdc, usdt] like our strategy's add_liquidity call.
+
+PRECISION = 10 ** 18
+FEE_DENOMINATOR = 10 ** 10
+MAX_ITERATIONS = 255
+
+
+def _array(value):
+    return np.asarray(value, dtype=object)
+
+
+# np.where on plain ints would cast to int64, so keep everything as objects
+def _where(condition, a, b):
+    return np.where(condition, _array(a), _array(b))
+
+
+def _abs(value):
+    return _where(value > 0, value, -value)
+
+
+def _converged(a, b):
+    return np.asarray(_abs(a - b) <= 1, dtype=bool)
+
+
+# give back a plain int when we were only asked about one amount
+def _result(value):
+    return int(value) if np.ndim(value) == 0 else value
+
+
+class StableSwap:
+    # rates are curve's RATES (10 ** 18 for an 18 decimal coin, 10 ** 30 for 6 decimals). amp is A_precise() with an
+    # a_precision of 100 for newer pools (factory metapools), or A() with an a_precision of 1 for older ones (3pool).
+    def __init__(self, balances, rates, amp, fee, total_supply, a_precision=100):
+        self.balances = [_array(balance) for balance in balances]
+        self.rates = [_array(rate) for rate in rates]
+        self.amp = amp
+        self.fee = fee
+        self.total_supply = _array(total_supply)
+        self.a_precision = a_precision
+        self.n_coins = len(self.balances)
+
+    def xp(self, balances=None, rates=None):
+        balances = self.balances if balances is None else balances
+        rates = self.rates if rates is None else rates
+        return [rate * balance // PRECISION for rate, balance in zip(rates, balances)]
+
+    def get_D(self, xp):
+        n = self.n_coins
+        s = sum(xp)
+        ann = self.amp * n
+        d = _array(s)
+        done = np.broadcast_to(np.asarray(s == 0, dtype=bool), np.shape(d)).copy()
+        for _ in range(MAX_ITERATIONS):
+            if done.all():
+                return _result(d)
+            d_p = d
+            for x in xp:
+                d_p = d_p * d // _where(done, 1, x * n)
+            d_prev = d
+            new_d = (
+                (ann * s // self.a_precision + d_p * n)
+                * d
+                // _where(
+                    done,
+                    1,
+                    (ann - self.a_precision) * d // self.a_precision + (n + 1) * d_p,
+                )
+            )
+            d = _where(done, d, new_d)
+            done = done | _converged(d, d_prev)
+        raise ValueError("get_D didn't converge")
+
+    def _solve_y(self, c, b, d):
+        y = d
+        done = np.zeros(np.shape(y), dtype=bool)
+        for _ in range(MAX_ITERATIONS):
+            if done.all():
+                return _result(y)
+            y_prev = y
+            y = _where(done, y, (y * y + c) // (2 * y + b - d))
+            done = done | _converged(y, y_prev)
+        raise ValueError("get_y didn't converge")
+
+    # balance of coin j that keeps D the same when coin i's balance is x (both in xp units)
+    def get_y(self, i, j, x, xp):
+        return self.get_y_D(i, xp, self.get_D(xp), skip=j, x=x)
+
+    # balance of coin i that gives us D, with every other coin at xp
+    def get_y_D(self, i, xp, d, skip=None, x=None):
+        n = self.n_coins
+        ann = self.amp * n
+        c = d
+        s = 0
+        for k in range(n):
+            if skip is not None and k == i:
+                value = x
+            elif k != (i if skip is None else skip):
+                value = xp[k]
+            else:
+                continue
+            s = s + value
+            c = c * d // (value * n)
+        c = c * d * self.a_precision // (ann * n)
+        b = s + d * self.a_precision // ann
+        return self._solve_y(c, b, d)
+
+    def get_virtual_price(self):
+        return _result(self.get_D(self.xp()) * PRECISION // self.total_supply)
+
+    # quote without fees, like calc_token_amount() on-chain
+    def calc_token_amount(self, amounts, is_deposit=True):
+        d0 = self.get_D(self.xp())
+        sign = 1 if is_deposit else -1
+        balances = [
+            balance + sign * _array(amount)
+            for balance, amount in zip(self.balances, amounts)
+        ]
+        d1 = self.get_D(self.xp(balances))
+        diff = d1 - d0 if is_deposit else d0 - d1
+        return _result(diff * self.total_supply // d0)
+
+    # LP minted by add_liquidity(), including imbalance fees. returns (minted, new balances after admin fees are taken)
+    def add_liquidity(self, amounts, admin_fee=5 * 10 ** 9):
+        old_balances = self.balances
+        d0 = self.get_D(self.xp(old_balances))
+        new_balances = [
+            balance + _array(amount) for balance, amount in zip(old_balances, amounts)
+        ]
+        d1 = self.get_D(self.xp(new_balances))
+
+        fee = self.fee * self.n_coins // (4 * (self.n_coins - 1))
+        stored_balances = []
+        for k in range(self.n_coins):
+            ideal_balance = d1 * old_balances[k] // d0
+            fees = fee * _abs(ideal_balance - new_balances[k]) // FEE_DENOMINATOR
+            stored_balances.append(
+                new_balances[k] - fees * admin_fee // FEE_DENOMINATOR
+            )
+            new_balances[k] = new_balances[k] - fees
+        d2 = self.get_D(self.xp(new_balances))
+        return _result(self.total_supply * (d2 - d0) // d0), stored_balances
+
+    def calc_withdraw_one_coin(self, token_amount, i):
+        xp = self.xp()
+        d0 = self.get_D(xp)
+        d1 = d0 - _array(token_amount) * d0 // self.total_supply
+        new_y = self.get_y_D(i, xp, d1)
+
+        fee = self.fee * self.n_coins // (4 * (self.n_coins - 1))
+        xp_reduced = []
+        for k in range(self.n_coins):
+            if k == i:
+                dx_expected = xp[k] * d1 // d0 - new_y
+            else:
+                dx_expected = xp[k] - xp[k] * d1 // d0
+            xp_reduced.append(xp[k] - fee * dx_expected // FEE_DENOMINATOR)
+        dy = xp_reduced[i] - self.get_y_D(i, xp_reduced, d1)
+        return _result((dy - 1) * PRECISION // self.rates[i])
+
+
+class Metapool3Crv:
+    # base_virtual_price is the metapool's cached 3pool virtual price. leave it as None if the cache is more than 10
+    # minutes old, and we use 3pool's live price after our deposit, like the pool does.
+    def __init__(self, meta, base, base_virtual_price=None):
+        self.meta = meta
+        self.base = base
+        self.base_virtual_price = base_virtual_price
+
+    def _meta_pool(self, base_after=None):
+        if self.base_virtual_price is not None:
+            rate = self.base_virtual_price
+        elif base_after is not None:
+            rate = base_after.get_virtual_price()
+        else:
+            rate = self.base.get_virtual_price()
+        return StableSwap(
+            self.meta.balances,
+            [self.meta.rates[0], rate],
+            self.meta.amp,
+            self.meta.fee,
+            self.meta.total_supply,
+            self.meta.a_precision,
+        )
+
+    def calc_token_amount(self, amounts, is_deposit=True):
+        base_amount = self.base.calc_token_amount(amounts[1:], is_deposit)
+        return self._meta_pool().calc_token_amount(
+            [amounts[0], base_amount], is_deposit
+        )
+
+    # what the zap's add_liquidity() mints us: deposit our stables to 3pool, then our coin and 3Crv to the metapool
+    def add_liquidity(self, amounts):
+        base_minted, base_balances = self.base.add_liquidity(amounts[1:])
+        base_after = StableSwap(
+            base_balances,
+            self.base.rates,
+            self.base.amp,
+            self.base.fee,
+            self.base.total_supply + base_minted,
+            self.base.a_precision,
+        )
+        minted, _ = self._meta_pool(base_after).add_liquidity([amounts[0], base_minted])
+        return minted
+
+    # read both pools' current state from their contracts (brownie or web3 style), as of a block's timestamp
+    @classmethod
+    def from_contracts(cls, pool, base_pool, base_token, timestamp):
+        # the metapool uses its cached 3pool price for 10 minutes
+        base_virtual_price = None
+        rate = base_pool.get_virtual_price()
+        if timestamp <= pool.base_cache_updated() + 600:
+            base_virtual_price = rate = pool.base_virtual_price()
+        meta = StableSwap(
+            [pool.balances(0), pool.balances(1)],
+            [10 ** 18, rate],
+            pool.A_precise(),
+            pool.fee(),
+            pool.totalSupply(),
+        )
+        base = StableSwap(
+            [base_pool.balances(i) for i in range(3)],
+            [10 ** 18, 10 ** 30, 10 ** 30],
+            base_pool.A(),
+            base_pool.fee(),
+            base_token.totalSupply(),
+            a_precision=1,
+        )
+        return cls(meta, base, base_virtual_price)
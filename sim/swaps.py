@@ -0,0 +1,93 @@
+from abc import ABC, abstractmethod
+
+# Swap models plug into our accounting model to price each trade our strategy makes. Amounts are always integer wei in
+# the token's own decimals, just like on-chain. Stables are indexed the way setOptimal() indexes them.
+
+DAI, USDC, USDT = 0, 1, 2
+STABLE_DECIMALS = (18, 6, 6)
+FEE_DENOMINATOR = 1_000_000  # uniswap v3 fees, 500 = 0.05%
+
+
+class SwapModel(ABC):
+    # CRV -> WETH through curve's CRV-ETH pool
+    @abstractmethod
+    def crv_to_weth(self, amount):
+        pass
+
+    # WETH per CRV (1e18 based) from crveth's price_oracle(), which we use to decide if our CRV is worth selling
+    @abstractmethod
+    def crv_price_oracle(self):
+        pass
+
+    # WETH -> our target stable on uniswap v3
+    @abstractmethod
+    def weth_to_stable(self, amount, stable, fee):
+        pass
+
+    # rewards token -> WETH on sushiswap
+    @abstractmethod
+    def rewards_to_weth(self, amount):
+        pass
+
+    # [dai, usdc, usdt] -> our curve LP through the 3Crv zap
+    @abstractmethod
+    def stables_to_want(self, amounts):
+        pass
+
+
+# Nothing we sell is worth anything. Useful when we only care about our debt and loss accounting.
+class NoSwaps(SwapModel):
+    def crv_to_weth(self, amount):
+        return 0
+
+    def crv_price_oracle(self):
+        return 0
+
+    def weth_to_stable(self, amount, stable, fee):
+        return 0
+
+    def rewards_to_weth(self, amount):
+        return 0
+
+    def stables_to_want(self, amounts):
+        return 0
+
+
+# Fixed prices, with the same rounding as our mocks in contracts/mocks, so we match a local chain to the wei.
+# crv_price and rewards_price are in WETH, and weth_prices is the amount of each stable we get for 1 WETH (all 1e18 based).
+class FixedRateSwaps(SwapModel):
+    def __init__(
+        self,
+        crv_price=int(5e14),
+        weth_prices=(2000 * 10 ** 18, 2000 * 10 ** 6, 2000 * 10 ** 6),
+        rewards_price=int(5e11),
+        virtual_price=10 ** 18,
+        sushi_fee=3000,
+    ):
+        self.crv_price = crv_price
+        self.weth_prices = weth_prices
+        self.rewards_price = rewards_price
+        self.virtual_price = virtual_price
+        self.sushi_fee = sushi_fee
+
+    def crv_to_weth(self, amount):
+        return amount * self.crv_price // 10 ** 18
+
+    # our mock's price_oracle() is the price it swaps at
+    def crv_price_oracle(self):
+        return self.crv_price
+
+    def weth_to_stable(self, amount, stable, fee):
+        out = amount * self.weth_prices[stable] // 10 ** 18
+        return out * (FEE_DENOMINATOR - fee) // FEE_DENOMINATOR
+
+    def rewards_to_weth(self, amount):
+        out = amount * self.rewards_price // 10 ** 18
+        return out * (FEE_DENOMINATOR - self.sushi_fee) // FEE_DENOMINATOR
+
+    def stables_to_want(self, amounts):
+        value = sum(
+            amount * 10 ** (18 - decimals)
+            for amount, decimals in zip(amounts, STABLE_DECIMALS)
+        )
+        return value * 10 ** 18 // self.virtual_price
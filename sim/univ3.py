@@ -0,0 +1,227 @@
+import json
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+# Uniswap V3 swaps, following TickMath, SqrtPriceMath, SwapMath and UniswapV3Pool.swap so we match the quoter to the wei.
+# A pool is loaded from a JSON snapshot (see scripts/uni_snapshot.py). To quote many amounts at once, we walk the pool's
+# ticks once, recording what it costs to fully cross each step, and then every amount only has to finish its last,
+# partial step. Amounts are arrays of Python ints (dtype=object) since they don't fit in int64.
+
+Q96 = 2 ** 96
+MAX_UINT256 = 2 ** 256 - 1
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+FEE_DENOMINATOR = 1_000_000
+
+# TickMath's 2 ** 128 / sqrt(1.0001) ** (2 ** bit) for each bit of a tick after the first
+TICK_RATIOS = (
+    0xFFF97272373D413259A46990580E213A,
+    0xFFF2E50F5F656932EF12357CF3C7FDCC,
+    0xFFE5CACA7E10E4E61C3624EAA0941CD0,
+    0xFFCB9843D60F6159C9DB58835C926644,
+    0xFF973B41FA98C081472E6896DFB254C0,
+    0xFF2EA16466C96A3843EC78B326B52861,
+    0xFE5DEE046A99A2A811C461F1969C3053,
+    0xFCBE86C7900A88AEDCFFC83B479AA3A4,
+    0xF987A7253AC413176F2B074CF7815E54,
+    0xF3392B0822B70005940C7A398E4B70F3,
+    0xE7159475A2C29B7443B29C7FA6E889D9,
+    0xD097F3BDFD2022B8845AD8F792AA5825,
+    0xA9F746462D870FDF8A65DC1F90E061E5,
+    0x70D869A156D2A1B890BB3DF62BAF32F7,
+    0x31BE135F97D08FD981231505542FCFA6,
+    0x9AA508B5B7A84E1C677DE54F3E99BC9,
+    0x5D6AF8DEDB81196699C329225EE604,
+    0x2216E584F5FA1EA926041BEDFE98,
+    0x48A170391F7DC42444E8FA2,
+)
+
+
+def _array(value):
+    return np.asarray(value, dtype=object)
+
+
+def _where(condition, a, b):
+    return np.where(condition, _array(a), _array(b))
+
+
+def _result(value):
+    return int(value) if np.ndim(value) == 0 else value
+
+
+def _div_up(a, b):
+    return -(-a // b)
+
+
+def get_sqrt_ratio_at_tick(tick):
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError("tick out of range")
+    ratio = 0xFFFCB933BD6FAD37AA2D162D1A594001 if abs_tick & 1 else 2 ** 128
+    for bit, constant in enumerate(TICK_RATIOS, start=1):
+        if abs_tick & (1 << bit):
+            ratio = (ratio * constant) >> 128
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_amount0_delta(sqrt_a, sqrt_b, liquidity, round_up):
+    sqrt_a, sqrt_b = _where(sqrt_a > sqrt_b, sqrt_b, sqrt_a), _where(
+        sqrt_a > sqrt_b, sqrt_a, sqrt_b
+    )
+    numerator = liquidity * Q96 * (sqrt_b - sqrt_a)
+    if round_up:
+        return _div_up(_div_up(numerator, sqrt_b), sqrt_a)
+    return numerator // sqrt_b // sqrt_a
+
+
+def get_amount1_delta(sqrt_a, sqrt_b, liquidity, round_up):
+    difference = _where(sqrt_a > sqrt_b, sqrt_a - sqrt_b, sqrt_b - sqrt_a)
+    if round_up:
+        return _div_up(liquidity * difference, Q96)
+    return liquidity * difference // Q96
+
+
+# where the price moves when amount_in goes in, with the same rounding (and overflow fallback) as SqrtPriceMath
+def get_next_sqrt_price_from_input(sqrt_price, liquidity, amount_in, zero_for_one):
+    if zero_for_one:
+        numerator = liquidity * Q96
+        product = amount_in * sqrt_price
+        denominator = numerator + product
+        fits = np.asarray((product <= MAX_UINT256) & (denominator <= MAX_UINT256))
+        exact = _div_up(numerator * sqrt_price, denominator)
+        fallback = _div_up(numerator, numerator // sqrt_price + amount_in)
+        return _where(amount_in == 0, sqrt_price, _where(fits, exact, fallback))
+    return sqrt_price + amount_in * Q96 // liquidity
+
+
+class UniswapV3Pool:
+    # ticks maps each initialized tick to its liquidityNet
+    def __init__(
+        self, token0, token1, fee, tick_spacing, sqrt_price, tick, liquidity, ticks
+    ):
+        self.token0 = token0
+        self.token1 = token1
+        self.fee = fee
+        self.tick_spacing = tick_spacing
+        self.sqrt_price = sqrt_price
+        self.tick = tick
+        self.liquidity = liquidity
+        self.ticks = {int(t): int(net) for t, net in ticks.items()}
+        self.initialized = sorted(self.ticks)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            snapshot = json.load(f)
+        return cls(
+            snapshot["token0"],
+            snapshot["token1"],
+            int(snapshot["fee"]),
+            int(snapshot["tick_spacing"]),
+            int(snapshot["sqrt_price_x96"]),
+            int(snapshot["tick"]),
+            int(snapshot["liquidity"]),
+            snapshot["ticks"],
+        )
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "token0": self.token0,
+                    "token1": self.token1,
+                    "fee": self.fee,
+                    "tick_spacing": self.tick_spacing,
+                    "sqrt_price_x96": str(self.sqrt_price),
+                    "tick": self.tick,
+                    "liquidity": str(self.liquidity),
+                    "ticks": {str(t): str(net) for t, net in self.ticks.items()},
+                },
+                f,
+                indent=2,
+            )
+
+    # same as TickBitmap.nextInitializedTickWithinOneWord, but from our list of initialized ticks
+    def _next_tick(self, tick, lte):
+        spacing = self.tick_spacing
+        compressed = tick // spacing
+        if lte:
+            word_start = (compressed - compressed % 256) * spacing
+            i = bisect_right(self.initialized, compressed * spacing) - 1
+            if i >= 0 and self.initialized[i] >= word_start:
+                return self.initialized[i], True
+            return word_start, False
+        compressed += 1
+        word_end = (compressed + 255 - compressed % 256) * spacing
+        i = bisect_left(self.initialized, compressed * spacing)
+        if i < len(self.initialized) and self.initialized[i] <= word_end:
+            return self.initialized[i], True
+        return word_end, False
+
+    # walk our ticks until we've taken in max_in, recording each full step: the price and liquidity we start it with,
+    # and how much we've put in and taken out before it
+    def _steps(self, max_in, zero_for_one):
+        limit = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        sqrt_price, tick, liquidity = self.sqrt_price, self.tick, self.liquidity
+        spent, out = 0, 0
+        steps = {"sqrt_price": [], "liquidity": [], "spent": [], "out": []}
+        while True:
+            steps["sqrt_price"].append(sqrt_price)
+            steps["liquidity"].append(liquidity)
+            steps["spent"].append(spent)
+            steps["out"].append(out)
+            if spent > max_in or sqrt_price == limit:
+                return {name: _array(values) for name, values in steps.items()}
+
+            tick_next, initialized = self._next_tick(tick, zero_for_one)
+            tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+            target = get_sqrt_ratio_at_tick(tick_next)
+            target = max(target, limit) if zero_for_one else min(target, limit)
+            if zero_for_one:
+                amount_in = get_amount0_delta(target, sqrt_price, liquidity, True)
+                amount_out = get_amount1_delta(target, sqrt_price, liquidity, False)
+            else:
+                amount_in = get_amount1_delta(sqrt_price, target, liquidity, True)
+                amount_out = get_amount0_delta(sqrt_price, target, liquidity, False)
+            fee = _div_up(amount_in * self.fee, FEE_DENOMINATOR - self.fee)
+            spent += int(amount_in) + fee
+            out += int(amount_out)
+            sqrt_price = target
+            if target == get_sqrt_ratio_at_tick(tick_next):
+                if initialized:
+                    net = self.ticks[tick_next]
+                    liquidity += -net if zero_for_one else net
+                tick = tick_next - 1 if zero_for_one else tick_next
+
+    # what exactInput gets us for each amount in, with no price limit
+    def quote(self, amounts_in, zero_for_one):
+        amounts_in = _array(amounts_in)
+        steps = self._steps(int(np.max(amounts_in)), zero_for_one)
+        # we fully cross every step that costs no more than what we have left
+        last = np.searchsorted(steps["spent"], amounts_in, side="right") - 1
+        sqrt_price = steps["sqrt_price"][last]
+        liquidity = steps["liquidity"][last]
+        remaining = amounts_in - steps["spent"][last]
+
+        less_fee = remaining * (FEE_DENOMINATOR - self.fee) // FEE_DENOMINATOR
+        usable = _where(liquidity > 0, liquidity, 1)
+        sqrt_next = get_next_sqrt_price_from_input(
+            sqrt_price, usable, less_fee, zero_for_one
+        )
+        if zero_for_one:
+            out = get_amount1_delta(sqrt_next, sqrt_price, usable, False)
+        else:
+            out = get_amount0_delta(sqrt_price, sqrt_next, usable, False)
+        # with no liquidity left, or at our price limit, the pool keeps whatever is left over
+        limit = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        out = _where((liquidity > 0) & (sqrt_price != limit), out, 0)
+        return _result(steps["out"][last] + out)
+
+    # quote by the token we put in
+    def quote_exact_input(self, token_in, amounts_in):
+        return self.quote(amounts_in, token_in.lower() == self.token0.lower())
@@ -0,0 +1,42 @@
+import json
+import os
+from pathlib import Path
+
+from brownie import Contract
+
+# Local store of the ABIs for the mainnet contracts our tests use, one JSON file per address. Loading from here means
+# conftest doesn't need Etherscan (or brownie's per-machine cache) to build its fixtures. Commit the files so CI can use
+# them, and run `brownie run refresh_abis --network mainnet` to re-fetch everything in the store. With
+# ABI_STORE_OFFLINE=1, an address missing from the store is an error instead of a trip to Etherscan.
+
+ABI_DIR = Path(__file__).parent.joinpath("abis")
+
+
+def abi_path(address):
+    return ABI_DIR.joinpath(f"{str(address).lower()}.json")
+
+
+def save_abi(contract):
+    ABI_DIR.mkdir(exist_ok=True)
+    stored = {"name": contract._name, "abi": contract.abi}
+    abi_path(contract.address).write_text(
+        json.dumps(stored, indent=2, sort_keys=True) + "\n"
+    )
+
+
+def load_contract(address):
+    path = abi_path(address)
+    if path.exists():
+        stored = json.loads(path.read_text())
+        return Contract.from_abi(stored["name"], str(address), stored["abi"])
+
+    if os.environ.get("ABI_STORE_OFFLINE") == "1":
+        raise FileNotFoundError(
+            f"No stored ABI for {address}, run `brownie run refresh_abis --network mainnet` and commit tests/abis"
+        )
+
+    # not in our store yet, so look it up the usual way (this may hit Etherscan) and keep it for next time
+    print(f"\nNo stored ABI for {address}, fetching it")
+    contract = Contract(address)
+    save_abi(contract)
+    return contract
@@ -1,6 +1,27 @@
 import pytest
-from brownie import config, Wei, Contract, chain, ZERO_ADDRESS
+from brownie import config, Wei, Contract, chain, network, web3, ZERO_ADDRESS
 import requests
+from abi_store import load_contract
+from state_cache import ChainStateCache
+from gas_benchmark import GasBenchmark
+from timing_profiler import TimingProfiler
+from pool_matrix import load_pools, pool_id, PoolScheduling
+from state_reader import MULTICALL2_ADDRESS
+import os
+
+# Set PROFILE_TESTS=1 to see where our suite spends its time, per test, per fixture, and per RPC method.
+def pytest_configure(config):
+    if os.environ.get("PROFILE_TESTS") == "1":
+        profiler = TimingProfiler()
+        profiler.start()
+        config.pluginmanager.register(profiler, "timing_profiler")
+
+
+# With -n, hand out our tests by pool and test file rather than just by file, so our pools are split across workers.
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    return PoolScheduling(config, log)
+
 
 # Snapshots the chain before each test and reverts after test completion.
 @pytest.fixture(autouse=True)
@@ -8,9 +29,39 @@ def isolation(fn_isolation):
     pass
 
 
+# Our strategy fixture is slow (deploy, migrate, harvest, sleep), so we only run it once per session and snapshot
+# the result. Include any session fixtures here that change chain state, or they'll be lost after the first module.
+@pytest.fixture(scope="session")
+def prepared_snapshot(strategy, whale, rewards_whale, other_vault_strategy, multicall):
+    chain.snapshot()
+    # brownie only tracks one snapshot, and fn_isolation overwrites it, so hold onto our own id
+    yield {"id": chain._snapshot_id}
+
+
+# This replaces brownie's module_isolation, which resets the chain (and our strategy) at the start of each module.
+# Instead we go back to our prepared snapshot. fn_isolation depends on this, so each test still starts from here too.
+@pytest.fixture(scope="module")
+def module_isolation(prepared_snapshot):
+    prepared_snapshot["id"] = chain._revert(prepared_snapshot["id"])
+    yield
+
+
+# Collects gas used in test_gas_benchmarks and checks it against tests/gas_baseline.json. With UPDATE_GAS_BASELINE=1,
+# we write the new numbers there at the end.
+@pytest.fixture(scope="session")
+def gas_benchmark():
+    benchmark = GasBenchmark(network.show_active())
+    yield benchmark
+    benchmark.save()
+
+
 # set this for if we want to use tenderly or not; mostly helpful because with brownie.reverts fails in tenderly forks.
 use_tenderly = False
 
+# set this to save our prepared fork state to disk (anvil only) and load it next session instead of rebuilding it.
+# pin your fork block in brownie-config.yml (fork_block under mainnet-fork's cmd_settings) or it can never be reused.
+use_state_cache = True
+
 
 ################################################## TENDERLY DEBUGGING ##################################################
 
@@ -37,29 +88,34 @@ def tests_using_tenderly():
     yield yes_or_no
 
 
-# use this to set what chain we use. 1 for ETH, 250 for fantom
+# use this to set what chain we use. 1 for ETH, 250 for fantom, 0 for a local dev chain using our mocks (no fork needed)
 chain_used = 1
 
+# Each pool we test has an entry in tests/pools.yaml, and everything below runs once per pool on our chain.
+# Add new pools there instead of editing these fixtures. Use POOLS=mim,frax to only test some of them.
+@pytest.fixture(scope="session", params=load_pools(chain_used), ids=pool_id)
+def pool_config(request):
+    yield request.param
+
+
 # put our pool's convex pid here
 @pytest.fixture(scope="session")
-def pid():
-    pid = 40  # mim 40, FRAX 32
-    yield pid
+def pid(pool_config):
+    yield pool_config["pid"]
 
 
 # this is the amount of funds we have our whale deposit. adjust this as needed based on their wallet balance
 @pytest.fixture(scope="session")
-def amount():
-    amount = 35_000e18  # use 35k for MIM, 140k for FRAX
+def amount(pool_config):
+    amount = pool_config["amount"] * 1e18
     yield amount
 
 
 @pytest.fixture(scope="session")
-def whale(accounts, amount, token):
+def whale(accounts, amount, token, pool_config):
     # Totally in it for the tech
     # Update this with a large holder of your want token (the largest EOA holder of LP)
-    # MIM 0xe896e539e557BC751860a7763C8dD589aF1698Ce, FRAX 0x839Bb033738510AA6B4f78Af20f066bdC824B189
-    whale = accounts.at("0xe896e539e557BC751860a7763C8dD589aF1698Ce", force=True)
+    whale = accounts.at(pool_config["whale"], force=True)
     if token.balanceOf(whale) < 2 * amount:
         raise ValueError(
             "Our whale needs more funds. Find another whale or reduce your amount variable."
@@ -69,25 +125,22 @@ def whale(accounts, amount, token):
 
 # use this if your vault is already deployed
 @pytest.fixture(scope="session")
-def vault_address():
-    vault_address = "0x2DfB14E32e2F8156ec15a2c21c3A6c053af52Be8"
-    # MIM 0x2DfB14E32e2F8156ec15a2c21c3A6c053af52Be8
-    # FRAX 0xB4AdA607B9d6b2c9Ee07A275e9616B84AC560139
+def vault_address(pool_config):
+    vault_address = pool_config["vault_address"] or ZERO_ADDRESS
     yield vault_address
 
 
 # curve deposit pool for old pools, set to ZERO_ADDRESS otherwise
 @pytest.fixture(scope="session")
-def old_pool():
-    old_pool = ZERO_ADDRESS
+def old_pool(pool_config):
+    old_pool = pool_config["old_pool"] or ZERO_ADDRESS
     yield old_pool
 
 
 # this is the name we want to give our strategy
 @pytest.fixture(scope="session")
-def strategy_name():
-    strategy_name = "StrategyCurveMIM"
-    yield strategy_name
+def strategy_name(pool_config):
+    yield pool_config["strategy_name"]
 
 
 # this is the name of our strategy in the .sol file
@@ -99,38 +152,37 @@ def contract_name(StrategyCurve3CrvRewardsClonable):
 
 # this is the address of our rewards token
 @pytest.fixture(scope="session")
-def rewards_token():  # OGN 0x8207c1FfC5B6804F6024322CcF34F29c3541Ae26, SPELL 0x090185f2135308BaD17527004364eBcC2D37e5F6
-    # SNX 0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F
-    yield Contract("0x090185f2135308BaD17527004364eBcC2D37e5F6")
+def rewards_token(pool_config):
+    if pool_config["rewards_token"] is None:
+        yield ZERO_ADDRESS
+    else:
+        yield load_contract(pool_config["rewards_token"])
 
 
 # sUSD gauge uses blocks instead of seconds to determine rewards, so this needs to be true for that to test if we're earning
 @pytest.fixture(scope="session")
-def try_blocks():
-    try_blocks = False  # True for sUSD
-    yield try_blocks
+def try_blocks(pool_config):
+    yield pool_config["try_blocks"]
 
 
 # whether or not we should try a test donation of our rewards token to make sure the strategy handles them correctly
 # if you want to bother with whale and amount below, this needs to be true
 @pytest.fixture(scope="session")
-def test_donation():
-    test_donation = True
-    yield test_donation
+def test_donation(pool_config):
+    yield pool_config["test_donation"]
 
 
 @pytest.fixture(scope="session")
-def rewards_whale(accounts):
-    # SNX whale: 0x8D6F396D210d385033b348bCae9e4f9Ea4e045bD, >600k SNX
-    # SPELL whale: 0x46f80018211D5cBBc988e853A8683501FCA4ee9b, >10b SPELL
-    yield accounts.at("0x46f80018211D5cBBc988e853A8683501FCA4ee9b", force=True)
+def rewards_whale(accounts, pool_config):
+    if pool_config["rewards_whale"] is None:
+        yield ZERO_ADDRESS
+    else:
+        yield accounts.at(pool_config["rewards_whale"], force=True)
 
 
 @pytest.fixture(scope="session")
-def rewards_amount():
-    rewards_amount = 1_000_000e18
-    # SNX 50_000e18
-    # SPELL 1_000_000e18
+def rewards_amount(pool_config):
+    rewards_amount = pool_config["rewards_amount"] * 1e18
     yield rewards_amount
 
 
@@ -143,37 +195,32 @@ def is_clonable():
 
 # whether or not a strategy has ever had rewards, even if they are zero currently. essentially checking if the infra is there for rewards.
 @pytest.fixture(scope="session")
-def rewards_template():
-    rewards_template = True  # MIM True, FRAX False
-    yield rewards_template
+def rewards_template(pool_config):
+    yield pool_config["rewards_template"]
 
 
 # this is whether our pool currently has extra reward emissions (SNX, SPELL, etc)
 @pytest.fixture(scope="session")
-def has_rewards():
-    has_rewards = False  # False for both
-    yield has_rewards
+def has_rewards(pool_config):
+    yield pool_config["has_rewards"]
 
 
 # this is whether our strategy is convex or not
 @pytest.fixture(scope="session")
-def is_convex():
-    is_convex = False
-    yield is_convex
+def is_convex(pool_config):
+    yield pool_config["is_convex"]
 
 
 # if our curve gauge deposits aren't tokenized (older pools), we can't as easily do some tests and we skip them
 @pytest.fixture(scope="session")
-def gauge_is_not_tokenized():
-    gauge_is_not_tokenized = False
-    yield gauge_is_not_tokenized
+def gauge_is_not_tokenized(pool_config):
+    yield pool_config["gauge_is_not_tokenized"]
 
 
 # use this to test our strategy in case there are no profits
 @pytest.fixture(scope="session")
-def no_profit():
-    no_profit = False
-    yield no_profit
+def no_profit(pool_config):
+    yield pool_config["no_profit"]
 
 
 # use this when we might lose a few wei on conversions between want and another deposit token
@@ -189,13 +236,9 @@ def is_slippery(no_profit):
 # use this to set the standard amount of time we sleep between harvests.
 # generally 1 day, but can be less if dealing with smaller windows (oracles) or longer if we need to trigger weekly earnings.
 @pytest.fixture(scope="session")
-def sleep_time():
+def sleep_time(pool_config):
     hour = 3600
-
-    # change this one right here
-    hours_to_sleep = 6  # 6 for MIM and FRAX
-
-    sleep_time = hour * hours_to_sleep
+    sleep_time = hour * pool_config["hours_to_sleep"]
     yield sleep_time
 
 
@@ -208,72 +251,72 @@ if chain_used == 1:  # mainnet
 
     @pytest.fixture(scope="session")
     def sushi_router():  # use this to check our allowances
-        yield Contract("0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F")
+        yield load_contract("0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F")
 
     # all contracts below should be able to stay static based on the pid
     @pytest.fixture(scope="session")
     def booster():  # this is the deposit contract
-        yield Contract("0xF403C135812408BFbE8713b5A23a04b3D48AAE31")
+        yield load_contract("0xF403C135812408BFbE8713b5A23a04b3D48AAE31")
 
     @pytest.fixture(scope="session")
     def voter():
-        yield Contract("0xF147b8125d2ef93FB6965Db97D6746952a133934")
+        yield load_contract("0xF147b8125d2ef93FB6965Db97D6746952a133934")
 
     @pytest.fixture(scope="session")
     def convexToken():
-        yield Contract("0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B")
+        yield load_contract("0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B")
 
     @pytest.fixture(scope="session")
     def crv():
-        yield Contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
+        yield load_contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
 
     @pytest.fixture(scope="session")
     def other_vault_strategy():
-        yield Contract("0x8423590CD0343c4E18d35aA780DF50a5751bebae")
+        yield load_contract("0x8423590CD0343c4E18d35aA780DF50a5751bebae")
 
     @pytest.fixture(scope="session")
     def proxy():
-        yield Contract("0xA420A63BbEFfbda3B147d0585F1852C358e2C152")
+        yield load_contract("0xA420A63BbEFfbda3B147d0585F1852C358e2C152")
 
     @pytest.fixture(scope="session")
     def curve_registry():
-        yield Contract("0x90E00ACe148ca3b23Ac1bC8C240C2a7Dd9c2d7f5")
+        yield load_contract("0x90E00ACe148ca3b23Ac1bC8C240C2a7Dd9c2d7f5")
 
     @pytest.fixture(scope="session")
     def curve_cryptoswap_registry():
-        yield Contract("0x4AacF35761d06Aa7142B9326612A42A2b9170E33")
+        yield load_contract("0x4AacF35761d06Aa7142B9326612A42A2b9170E33")
 
     @pytest.fixture(scope="session")
     def healthCheck():
-        yield Contract("0xDDCea799fF1699e98EDF118e0629A974Df7DF012")
+        yield load_contract("0xDDCea799fF1699e98EDF118e0629A974Df7DF012")
 
     @pytest.fixture(scope="session")
     def farmed():
         # this is the token that we are farming and selling for more of our want.
-        yield Contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
+        yield load_contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
 
     @pytest.fixture(scope="session")
     def token(pid, booster):
         # this should be the address of the ERC-20 used by the strategy/vault
         token_address = booster.poolInfo(pid)[0]
-        yield Contract(token_address)
+        yield load_contract(token_address)
 
     @pytest.fixture(scope="session")
     def cvxDeposit(booster, pid):
         # this should be the address of the convex deposit token
         cvx_address = booster.poolInfo(pid)[1]
-        yield Contract(cvx_address)
+        yield load_contract(cvx_address)
 
     @pytest.fixture(scope="session")
     def rewardsContract(pid, booster):
         rewardsContract = booster.poolInfo(pid)[3]
-        yield Contract(rewardsContract)
+        yield load_contract(rewardsContract)
 
     # gauge for the curve pool
     @pytest.fixture(scope="session")
     def gauge(pid, booster):
         gauge = booster.poolInfo(pid)[2]
-        yield Contract(gauge)
+        yield load_contract(gauge)
 
     # curve deposit pool
     @pytest.fixture(scope="session")
@@ -289,17 +332,25 @@ if chain_used == 1:  # mainnet
                     poolAddress = curve_cryptoswap_registry.get_pool_from_lp_token(
                         token
                     )
-                    poolContract = Contract(poolAddress)
+                    poolContract = load_contract(poolAddress)
             else:
                 poolAddress = curve_registry.get_pool_from_lp_token(token)
-                poolContract = Contract(poolAddress)
+                poolContract = load_contract(poolAddress)
         else:
-            poolContract = Contract(old_pool)
+            poolContract = load_contract(old_pool)
         yield poolContract
 
     @pytest.fixture(scope="session")
     def gasOracle():
-        yield Contract("0xb5e1CAcB567d98faaDB60a1fD4820720141f064F")
+        yield load_contract("0xb5e1CAcB567d98faaDB60a1fD4820720141f064F")
+
+    @pytest.fixture(scope="session")
+    def multicall():
+        yield load_contract(MULTICALL2_ADDRESS)
+
+    @pytest.fixture(scope="session")
+    def crveth():  # curve's CRV-ETH crypto pool, where we sell our CRV
+        yield load_contract("0x8301AE4fc9c624d1D396cbDAa1ed877821D7C511")
 
     # Define any accounts in this section
     # for live testing, governance is the strategist MS; we will update this before we endorse
@@ -334,9 +385,28 @@ if chain_used == 1:  # mainnet
     def strategist(accounts):
         yield accounts.at("0x16388463d60FFE0661Cf7F1f31a7D658aC790ff7", force=True)
 
-    @pytest.fixture(scope="module")
-    def vault(pm, gov, rewards, guardian, management, token, chain, vault_address):
-        if vault_address == ZERO_ADDRESS:
+    # on a cache hit, the state we load already has our strategy set up, so our fixtures just need its addresses
+    @pytest.fixture(scope="session")
+    def state_cache(pool_config, contract_name):
+        state_cache = ChainStateCache(
+            chain_used=chain_used,
+            pool=pool_config,
+            bytecode=contract_name.bytecode,
+        )
+        if use_state_cache and not use_tenderly:
+            state_cache.load()
+        yield state_cache
+        # only still locked if our setup failed before we could save
+        state_cache.release()
+
+    @pytest.fixture(scope="session")
+    def vault(
+        pm, gov, rewards, guardian, management, token, chain, vault_address, state_cache
+    ):
+        if vault_address == ZERO_ADDRESS and state_cache.loaded:
+            Vault = pm(config["dependencies"][0]).Vault
+            vault = Vault.at(state_cache.addresses["vault"])
+        elif vault_address == ZERO_ADDRESS:
             Vault = pm(config["dependencies"][0]).Vault
             vault = guardian.deploy(Vault)
             vault.initialize(token, gov, rewards, "", "", guardian)
@@ -345,11 +415,11 @@ if chain_used == 1:  # mainnet
             chain.sleep(1)
             chain.mine(1)
         else:
-            vault = Contract(vault_address)
+            vault = load_contract(vault_address)
         yield vault
 
     # replace the first value with the name of your strategy
-    @pytest.fixture(scope="module")
+    @pytest.fixture(scope="session")
     def strategy(
         contract_name,
         strategist,
@@ -373,7 +443,12 @@ if chain_used == 1:  # mainnet
         has_rewards,
         vault_address,
         try_blocks,
+        state_cache,
     ):
+        if state_cache.loaded:
+            yield contract_name.at(state_cache.addresses["strategy"])
+            return
+
         if is_convex:
             # make sure to include all constructor parameters needed here
             strategy = strategist.deploy(
@@ -420,12 +495,12 @@ if chain_used == 1:  # mainnet
                 chain.mine(1)
             else:
                 if vault.withdrawalQueue(1) == ZERO_ADDRESS:  # only has convex
-                    old_strategy = Contract(vault.withdrawalQueue(0))
+                    old_strategy = load_contract(vault.withdrawalQueue(0))
                     vault.migrateStrategy(old_strategy, strategy, {"from": gov})
                     vault.updateStrategyDebtRatio(strategy, 10000, {"from": gov})
                 else:
-                    old_strategy = Contract(vault.withdrawalQueue(1))
-                    other_strat = Contract(vault.withdrawalQueue(0))
+                    old_strategy = load_contract(vault.withdrawalQueue(1))
+                    other_strat = load_contract(vault.withdrawalQueue(0))
                     vault.migrateStrategy(old_strategy, strategy, {"from": gov})
                     vault.updateStrategyDebtRatio(other_strat, 0, {"from": gov})
                     vault.updateStrategyDebtRatio(strategy, 10000, {"from": gov})
@@ -445,7 +520,7 @@ if chain_used == 1:  # mainnet
                 chain.mine(1)
             else:
                 if vault.withdrawalQueue(1) == ZERO_ADDRESS:  # only has convex
-                    other_strat = Contract(vault.withdrawalQueue(0))
+                    other_strat = load_contract(vault.withdrawalQueue(0))
                     vault.updateStrategyDebtRatio(other_strat, 5000, {"from": gov})
                     vault.addStrategy(
                         strategy, 5000, 0, 2 ** 256 - 1, 1_000, {"from": gov}
@@ -464,7 +539,7 @@ if chain_used == 1:  # mainnet
                     chain.sleep(1)
                     chain.mine(1)
                 else:
-                    other_strat = Contract(vault.withdrawalQueue(1))
+                    other_strat = load_contract(vault.withdrawalQueue(1))
                     # remove 50% of funds from our convex strategy
                     vault.updateStrategyDebtRatio(other_strat, 5000, {"from": gov})
 
@@ -478,7 +553,7 @@ if chain_used == 1:  # mainnet
                     chain.mine(1)
 
                     # give our curve strategy 50% of our debt and migrate it
-                    old_strategy = Contract(vault.withdrawalQueue(0))
+                    old_strategy = load_contract(vault.withdrawalQueue(0))
                     vault.migrateStrategy(old_strategy, strategy, {"from": gov})
                     vault.updateStrategyDebtRatio(strategy, 5000, {"from": gov})
 
@@ -519,6 +594,9 @@ if chain_used == 1:  # mainnet
             print("Other strat assets:", other_strat.estimatedTotalAssets() / 1e18)
         print("Main strat assets:", strategy.estimatedTotalAssets() / 1e18)
 
+        if use_state_cache and not use_tenderly:
+            state_cache.save(strategy=strategy.address, vault=vault.address)
+
         yield strategy
 
 
@@ -526,28 +604,28 @@ elif chain_used == 250:  # only fantom so far and convex doesn't exist there
 
     @pytest.fixture(scope="session")
     def voter():
-        yield Contract("0xF147b8125d2ef93FB6965Db97D6746952a133934")
+        yield load_contract("0xF147b8125d2ef93FB6965Db97D6746952a133934")
 
     @pytest.fixture(scope="session")
     def crv():
-        yield Contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
+        yield load_contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
 
     @pytest.fixture(scope="session")
     def other_vault_strategy():
-        yield Contract("0x8423590CD0343c4E18d35aA780DF50a5751bebae")
+        yield load_contract("0x8423590CD0343c4E18d35aA780DF50a5751bebae")
 
     @pytest.fixture(scope="session")
     def curve_registry():
-        yield Contract("0x90E00ACe148ca3b23Ac1bC8C240C2a7Dd9c2d7f5")
+        yield load_contract("0x90E00ACe148ca3b23Ac1bC8C240C2a7Dd9c2d7f5")
 
     @pytest.fixture(scope="session")
     def healthCheck():
-        yield Contract("0xDDCea799fF1699e98EDF118e0629A974Df7DF012")
+        yield load_contract("0xDDCea799fF1699e98EDF118e0629A974Df7DF012")
 
     @pytest.fixture(scope="session")
     def farmed():
         # this is the token that we are farming and selling for more of our want.
-        yield Contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
+        yield load_contract("0xD533a949740bb3306d119CC777fa900bA034cd52")
 
     # curve deposit pool
     @pytest.fixture(scope="session")
@@ -556,12 +634,17 @@ elif chain_used == 250:  # only fantom so far and convex doesn't exist there
             poolAddress = token
         else:
             _poolAddress = curve_registry.get_pool_from_lp_token(token)
-            poolAddress = Contract(_poolAddress)
+            poolAddress = load_contract(_poolAddress)
         yield poolAddress
 
     @pytest.fixture(scope="session")
     def gasOracle():
-        yield Contract("0xb5e1CAcB567d98faaDB60a1fD4820720141f064F")
+        yield load_contract("0xb5e1CAcB567d98faaDB60a1fD4820720141f064F")
+
+    # no Multicall2 here, so use our mock
+    @pytest.fixture(scope="session")
+    def multicall(MockMulticall, gov):
+        yield gov.deploy(MockMulticall)
 
     # Define any accounts in this section
     # for live testing, governance is the strategist MS; we will update this before we endorse
@@ -596,6 +679,347 @@ elif chain_used == 250:  # only fantom so far and convex doesn't exist there
         yield accounts.at("0xBedf3Cf16ba1FcE6c3B751903Cf77E51d51E05b8", force=True)
 
 
+elif chain_used == 0:  # local dev chain using contracts/mocks, no fork needed
+
+    # our strategy hard-codes these, so our mocks need to live at the same addresses
+    crv_address = "0xD533a949740bb3306d119CC777fa900bA034cd52"
+    weth_address = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+    dai_address = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+    usdc_address = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+    usdt_address = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+    voter_address = "0xF147b8125d2ef93FB6965Db97D6746952a133934"
+    proxy_address = "0xA420A63BbEFfbda3B147d0585F1852C358e2C152"
+    sushiswap_address = "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"
+    uniswapv3_address = "0xE592427A0AEce92De3Edee1F18E0157C05861564"
+    crveth_address = "0x8301AE4fc9c624d1D396cbDAa1ed877821D7C511"
+    tricrypto_address = "0xD51a44d3FaE010294C616388b506AcdA1bfAAE46"
+    zap_address = "0xA79828DF1850E8a3A3064576f380D90aECDD3359"
+    three_pool_address = "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7"
+    three_crv_address = "0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490"
+    health_check_address = "0xDDCea799fF1699e98EDF118e0629A974Df7DF012"
+    base_fee_oracle_address = "0xb5e1CAcB567d98faaDB60a1fD4820720141f064F"
+    minter_address = "0xd061D61a4d941c39E5453435B6345Dc261C2fcE0"
+    gauge_controller_address = "0x2F50D538606Fa9EDD2B11E2446BEb18C9D5846bB"
+
+    # copy a mock's runtime code to a fixed address. anvil, hardhat, and ganache v7 each name this differently.
+    def deploy_at(contract_type, address):
+        code = "0x" + contract_type._build["deployedBytecode"]
+        for method in ("anvil_setCode", "hardhat_setCode", "evm_setAccountCode"):
+            if "error" not in web3.provider.make_request(method, [address, code]):
+                return contract_type.at(address)
+        raise ValueError(
+            "This network can't set account code. Use anvil, hardhat, or ganache v7 for local testing."
+        )
+
+    def deploy_token_at(MockERC20, address, name, symbol, decimals, deployer):
+        token = deploy_at(MockERC20, address)
+        token.initialize(name, symbol, decimals, {"from": deployer})
+        return token
+
+    @pytest.fixture(scope="session")
+    def crv(MockERC20, gov):
+        yield deploy_token_at(MockERC20, crv_address, "Curve DAO Token", "CRV", 18, gov)
+
+    @pytest.fixture(scope="session")
+    def weth(MockERC20, gov):
+        yield deploy_token_at(MockERC20, weth_address, "Wrapped Ether", "WETH", 18, gov)
+
+    @pytest.fixture(scope="session")
+    def stables(MockERC20, gov):
+        dai = deploy_token_at(MockERC20, dai_address, "Dai Stablecoin", "DAI", 18, gov)
+        usdc = deploy_token_at(MockERC20, usdc_address, "USD Coin", "USDC", 6, gov)
+        usdt = deploy_token_at(MockERC20, usdt_address, "Tether USD", "USDT", 6, gov)
+        yield [dai, usdc, usdt]
+
+    @pytest.fixture(scope="session")
+    def voter(MockVoter, gov):
+        voter = deploy_at(MockVoter, voter_address)
+        voter.initialize(proxy_address, gov, {"from": gov})
+        yield voter
+
+    @pytest.fixture(scope="session")
+    def proxy(MockStrategyProxy, voter, crv, gov):
+        proxy = deploy_at(MockStrategyProxy, proxy_address)
+        proxy.initialize(voter, gov, {"from": gov})
+        yield proxy
+
+    @pytest.fixture(scope="session")
+    def crveth(MockCurveCryptoPool, crv, weth, gov):
+        crveth = deploy_at(MockCurveCryptoPool, crveth_address)
+        crveth.setPrice(5e14, {"from": gov})  # 1 CRV = 0.0005 WETH
+        yield crveth
+
+    @pytest.fixture(scope="session")
+    def tricrypto(MockCurveTricrypto, gov):
+        tricrypto = deploy_at(MockCurveTricrypto, tricrypto_address)
+        tricrypto.setPrice(
+            1, 2000e18, {"from": gov}
+        )  # 1 WETH = 2000 USDT, like our uniswap mock
+        yield tricrypto
+
+    @pytest.fixture(scope="session")
+    def uniswap_router(MockUniV3Router, weth, stables, gov):
+        uniswap_router = deploy_at(MockUniV3Router, uniswapv3_address)
+        # 1 WETH = 2000 of each stable, in their own decimals
+        for stable in stables:
+            uniswap_router.setRate(
+                weth, stable, 2000 * 10 ** stable.decimals(), {"from": gov}
+            )
+        yield uniswap_router
+
+    @pytest.fixture(scope="session")
+    def sushi_router(MockSushiRouter, weth, rewards_token, gov):
+        sushi_router = deploy_at(MockSushiRouter, sushiswap_address)
+        sushi_router.setRate(rewards_token, weth, 5e11, {"from": gov})
+        yield sushi_router
+
+    @pytest.fixture(scope="session")
+    def zap(MockCurveZap, stables):
+        yield deploy_at(MockCurveZap, zap_address)
+
+    @pytest.fixture(scope="session")
+    def three_crv(MockERC20, gov):
+        yield deploy_token_at(
+            MockERC20, three_crv_address, "Curve.fi DAI/USDC/USDT", "3Crv", 18, gov
+        )
+
+    @pytest.fixture(scope="session")
+    def three_pool(MockCurve3Pool, stables, three_crv):
+        yield deploy_at(MockCurve3Pool, three_pool_address)
+
+    @pytest.fixture(scope="session")
+    def healthCheck(MockHealthCheck):
+        yield deploy_at(MockHealthCheck, health_check_address)
+
+    @pytest.fixture(scope="session")
+    def gasOracle(MockBaseFeeOracle, gov):
+        gasOracle = deploy_at(MockBaseFeeOracle, base_fee_oracle_address)
+        gasOracle.setBaseFee(10 * 1e9, {"from": gov})
+        yield gasOracle
+
+    @pytest.fixture(scope="session")
+    def crv_minter(MockMinter):
+        yield deploy_at(MockMinter, minter_address)
+
+    @pytest.fixture(scope="session")
+    def gauge_controller(MockGaugeController):
+        yield deploy_at(MockGaugeController, gauge_controller_address)
+
+    @pytest.fixture(scope="session")
+    def multicall(MockMulticall, gov):
+        yield gov.deploy(MockMulticall)
+
+    # everything our strategy calls out to needs to be in place before we deploy it
+    @pytest.fixture(scope="session")
+    def local_protocol(
+        crv,
+        weth,
+        stables,
+        voter,
+        proxy,
+        crveth,
+        tricrypto,
+        uniswap_router,
+        sushi_router,
+        zap,
+        three_pool,
+        healthCheck,
+        gasOracle,
+        crv_minter,
+        gauge_controller,
+    ):
+        pass
+
+    @pytest.fixture(scope="session")
+    def token(MockERC20, MockCurvePool, three_crv, gov):
+        # factory metapools are their own LP token
+        mim = gov.deploy(MockERC20)
+        mim.initialize("Magic Internet Money", "MIM", 18, {"from": gov})
+        yield gov.deploy(
+            MockCurvePool,
+            "Curve.fi Factory USD Metapool: Magic Internet Money 3Pool",
+            "MIM-3LP3CRV-f",
+            mim,
+            three_crv,
+        )
+
+    @pytest.fixture(scope="session")
+    def pool(token):
+        yield token
+
+    @pytest.fixture(scope="session")
+    def gauge(MockGauge, token, crv, rewards_token, gov):
+        gauge = gov.deploy(MockGauge, token, crv, 0.1e18)  # 0.1 CRV per second
+        gauge.setRewards(rewards_token, 1e18, {"from": gov})
+        yield gauge
+
+    @pytest.fixture(scope="session")
+    def farmed(crv):
+        # this is the token that we are farming and selling for more of our want.
+        yield crv
+
+    @pytest.fixture(scope="session")
+    def rewards_token(MockERC20, gov):
+        rewards_token = gov.deploy(MockERC20)
+        rewards_token.initialize("Spell Token", "SPELL", 18, {"from": gov})
+        yield rewards_token
+
+    @pytest.fixture(scope="session")
+    def whale(accounts, amount, token):
+        whale = accounts[5]
+        token.mint(whale, 10 * amount, {"from": whale})
+        yield whale
+
+    @pytest.fixture(scope="session")
+    def rewards_whale(accounts, rewards_token, rewards_amount):
+        rewards_whale = accounts[6]
+        rewards_token.mint(rewards_whale, 10 * rewards_amount, {"from": rewards_whale})
+        yield rewards_whale
+
+    # we always deploy a fresh vault locally
+    @pytest.fixture(scope="session")
+    def vault_address():
+        yield ZERO_ADDRESS
+
+    # convex doesn't exist locally, these are only used when is_convex is true
+    @pytest.fixture(scope="session")
+    def booster():
+        yield ZERO_ADDRESS
+
+    @pytest.fixture(scope="session")
+    def convexToken():
+        yield ZERO_ADDRESS
+
+    @pytest.fixture(scope="session")
+    def cvxDeposit():
+        yield ZERO_ADDRESS
+
+    @pytest.fixture(scope="session")
+    def rewardsContract():
+        yield ZERO_ADDRESS
+
+    # Define any accounts in this section
+    @pytest.fixture(scope="session")
+    def gov(accounts):
+        yield accounts[0]
+
+    @pytest.fixture(scope="session")
+    def strategist_ms(accounts):
+        yield accounts[1]
+
+    @pytest.fixture(scope="session")
+    def keeper(accounts):
+        yield accounts[1]
+
+    @pytest.fixture(scope="session")
+    def rewards(accounts):
+        yield accounts[1]
+
+    @pytest.fixture(scope="session")
+    def guardian(accounts):
+        yield accounts[1]
+
+    @pytest.fixture(scope="session")
+    def management(accounts):
+        yield accounts[1]
+
+    @pytest.fixture(scope="session")
+    def strategist(accounts):
+        yield accounts[1]
+
+    def deploy_vault(pm, token, gov, rewards, guardian, management):
+        Vault = pm(config["dependencies"][0]).Vault
+        vault = guardian.deploy(Vault)
+        vault.initialize(token, gov, rewards, "", "", guardian)
+        vault.setDepositLimit(2 ** 256 - 1, {"from": gov})
+        vault.setManagement(management, {"from": gov})
+        return vault
+
+    @pytest.fixture(scope="session")
+    def vault(pm, gov, rewards, guardian, management, token, chain):
+        vault = deploy_vault(pm, token, gov, rewards, guardian, management)
+        chain.sleep(1)
+        chain.mine(1)
+        yield vault
+
+    # a strategy on a different vault, so we can check that we can't migrate to it
+    @pytest.fixture(scope="session")
+    def other_vault_strategy(
+        pm,
+        contract_name,
+        strategist,
+        gov,
+        rewards,
+        guardian,
+        management,
+        token,
+        gauge,
+        pool,
+        local_protocol,
+    ):
+        other_vault = deploy_vault(pm, token, gov, rewards, guardian, management)
+        yield strategist.deploy(
+            contract_name, other_vault, gauge, pool, "StrategyCurveOther"
+        )
+
+    @pytest.fixture(scope="session")
+    def strategy(
+        contract_name,
+        strategist,
+        keeper,
+        vault,
+        gov,
+        healthCheck,
+        chain,
+        proxy,
+        pool,
+        strategy_name,
+        gasOracle,
+        strategist_ms,
+        gauge,
+        rewards_token,
+        has_rewards,
+        local_protocol,
+    ):
+        # make sure to include all constructor parameters needed here
+        strategy = strategist.deploy(
+            contract_name,
+            vault,
+            gauge,
+            pool,
+            strategy_name,
+        )
+        print("\nLocal Curve strategy")
+
+        strategy.setKeeper(keeper, {"from": gov})
+
+        # set our management fee to zero so it doesn't mess with our profit checking
+        vault.setManagementFee(0, {"from": gov})
+
+        vault.addStrategy(strategy, 10_000, 0, 2 ** 256 - 1, 1_000, {"from": gov})
+        chain.sleep(1)
+        chain.mine(1)
+
+        # approve our new strategy on the proxy
+        proxy.approveStrategy(strategy.gauge(), strategy, {"from": gov})
+
+        # make all harvests permissive unless we change the value lower
+        gasOracle.setMaxAcceptableBaseFee(2000 * 1e9, {"from": strategist_ms})
+        strategy.setHealthCheck(healthCheck, {"from": gov})
+
+        # add rewards token if needed
+        if has_rewards:
+            strategy.updateRewards(True, rewards_token, {"from": gov})
+
+        # set up custom params and setters
+        strategy.setMaxReportDelay(86400 * 21, {"from": gov})
+
+        chain.sleep(10 * 3600)  # normalize share price
+        chain.mine(1)
+
+        yield strategy
+
+
 # commented-out fixtures to be used with live testing
 
 # # list any existing strategies here
@@ -0,0 +1,60 @@
+import json
+import os
+import pytest
+from pathlib import Path
+
+# Records gas used by our strategy's entry points and compares it to a checked-in baseline. Gas on a mainnet fork and on
+# our local mocks is quite different, so the baseline keeps separate numbers for each network. On a network we've never
+# measured, our benchmarks only print their gas and skip. Once a network has numbers, a benchmark missing from them
+# fails. We only ever write the baseline when run with UPDATE_GAS_BASELINE=1 (and without -n, since every worker would
+# write the same file).
+
+BASELINE_PATH = Path(__file__).parent.joinpath("gas_baseline.json")
+GAS_TOLERANCE = 0.02  # fail if we use more than 2% more gas than our baseline
+
+
+class GasBenchmark:
+    def __init__(self, network_name, update=None):
+        self.network_name = network_name
+        self.update = (
+            os.environ.get("UPDATE_GAS_BASELINE") == "1" if update is None else update
+        )
+        if self.update and os.environ.get("PYTEST_XDIST_WORKER"):
+            raise RuntimeError("Update our gas baseline without -n")
+        self.baseline = {}
+        if BASELINE_PATH.exists():
+            self.baseline = json.loads(BASELINE_PATH.read_text()).get(network_name, {})
+        self.results = {}
+
+    def record(self, name, gas_used):
+        gas_used = int(gas_used)
+        self.results[name] = gas_used
+        expected = self.baseline.get(name)
+        if expected is None:
+            print(f"\n{name}: {gas_used} gas (no baseline yet)")
+            if self.update:
+                return
+            # nothing to compare against on this network yet, so don't fail every benchmark until someone measures it
+            if not self.baseline:
+                pytest.skip(
+                    f"no gas baselines for {self.network_name}, run with UPDATE_GAS_BASELINE=1 to add them"
+                )
+            pytest.fail(
+                f"{name} has no gas baseline for {self.network_name}, run with UPDATE_GAS_BASELINE=1 to add it"
+            )
+        change = (gas_used - expected) / expected
+        print(f"\n{name}: {gas_used} gas ({change:+.2%} vs baseline {expected})")
+        if not self.update:
+            assert gas_used <= expected * (
+                1 + GAS_TOLERANCE
+            ), f"{name} used {gas_used} gas, more than {GAS_TOLERANCE:.0%} over our baseline of {expected}"
+
+    def save(self):
+        # normal runs never touch our baseline
+        if not self.update or not self.results:
+            return
+        stored = {}
+        if BASELINE_PATH.exists():
+            stored = json.loads(BASELINE_PATH.read_text())
+        stored.setdefault(self.network_name, {}).update(self.results)
+        BASELINE_PATH.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,47 @@
+import os
+import re
+from pathlib import Path
+
+import yaml
+from xdist.scheduler import LoadScopeScheduling
+
+# Loads the pools we test from tests/pools.yaml. conftest parametrizes a session fixture over these, so pytest runs all of
+# one pool's tests before setting up the next, and each pool's prepared state gets its own entry in our state cache.
+
+POOLS_PATH = Path(__file__).parent.joinpath("pools.yaml")
+
+
+def load_pools(chain_used, selected=None):
+    if selected is None:
+        selected = os.environ.get("POOLS", "")
+    selected = [name.strip() for name in selected.split(",") if name.strip()]
+
+    all_pools = yaml.safe_load(POOLS_PATH.read_text())
+    unknown = set(selected) - set(all_pools)
+    if unknown:
+        raise ValueError(f"Unknown pools {sorted(unknown)}, check tests/pools.yaml")
+
+    pools = []
+    for name, settings in all_pools.items():
+        if settings["chain"] != chain_used or (selected and name not in selected):
+            continue
+        pools.append({"name": name, **settings})
+    if not pools:
+        raise ValueError(f"No pools to test on chain {chain_used}")
+    return pools
+
+
+# test ids look like test_simple_harvest[pool=mim] or test_harvest_gas[pool=mim-donation]
+def pool_id(pool):
+    return f"pool={pool['name']}"
+
+
+# Brownie gives each xdist worker whole test files. We split them up by pool as well, so a worker gets a test file for
+# one pool, and our pools are spread across all of our workers instead of each file running every pool on one worker.
+class PoolScheduling(LoadScopeScheduling):
+    def _split_scope(self, nodeid):
+        test_file = nodeid.split("::", 1)[0]
+        pool = re.search(r"pool=(\w+)", nodeid)
+        if pool is None:
+            return test_file
+        return f"{test_file}[{pool.group(1)}]"
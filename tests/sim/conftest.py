@@ -0,0 +1,6 @@
+import pytest
+
+# Our off-chain models don't touch the chain, so skip the snapshots and strategy setup from tests/conftest.py.
+@pytest.fixture(autouse=True)
+def isolation():
+    pass
@@ -0,0 +1,110 @@
+import numpy as np
+from sim.accounting import StrategyModel
+from sim.cadence import harvest_trigger, make_grid, rank, simulate
+
+DAY = 86400
+
+
+# our vectorized trigger has to agree with harvestTrigger() as written in our accounting model
+def test_trigger_matches_model():
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        min_delay, max_delay = sorted(rng.integers(0, 30 * DAY, 2))
+        threshold = int(rng.integers(0, 10 ** 6))
+        max_fee = int(rng.integers(1, 200))
+        since, credit, fee = (
+            int(rng.integers(0, 40 * DAY)),
+            int(rng.integers(0, 2 * 10 ** 6)),
+            int(rng.integers(1, 200)),
+        )
+        on_profit = bool(rng.integers(0, 2))
+        claimable_profit, call_cost = (
+            int(rng.integers(0, 10 ** 6)),
+            int(rng.integers(0, 10 ** 4)),
+        )
+        model = StrategyModel(
+            staked_balance=1,
+            min_report_delay=min_delay,
+            max_report_delay=max_delay,
+            credit_threshold=threshold,
+            harvest_on_profit=on_profit,
+        )
+        expected = model.harvest_trigger(
+            since,
+            credit,
+            fee <= max_fee,
+            claimable_profit=claimable_profit,
+            call_cost=call_cost,
+        )
+        assert (
+            harvest_trigger(
+                since,
+                credit,
+                fee,
+                min_delay,
+                max_delay,
+                threshold,
+                max_fee,
+                on_profit,
+                claimable_profit,
+                call_cost,
+            )
+            == expected
+        )
+
+
+def test_cheap_gas_harvests_on_min_delay():
+    grid = make_grid([DAY], [21 * DAY], [1e30], [100])
+    results = simulate(
+        grid, np.full(240, 10.0), 3600, 1e-7, 1.0, 2000.0, starting_assets=1e6
+    )
+    # we trigger the hour after each full day since our last harvest
+    assert results["harvests"][0] == 9
+
+
+def test_expensive_gas_waits_for_max_delay():
+    grid = make_grid([DAY], [5 * DAY], [1e30], [50])
+    results = simulate(
+        grid, np.full(240, 100.0), 3600, 1e-7, 1.0, 2000.0, starting_assets=1e6
+    )
+    assert results["harvests"][0] == 1
+
+
+def test_rank_prefers_fewer_harvests_when_gas_is_expensive():
+    grid = make_grid([DAY, 7 * DAY], [30 * DAY], [1e30], [200])
+    results = simulate(
+        grid, np.full(24 * 30, 100.0), 3600, 1e-9, 1.0, 2000.0, starting_assets=1e6
+    )
+    best = rank(results, top=1)[0]
+    assert best["min_report_delay"] == 7 * DAY
+    assert best["net_yield"] == results["net_yield"].max()
+
+
+def test_deposits_trigger_on_credit():
+    grid = make_grid([30 * DAY], [60 * DAY], [1_000, 10 ** 9], [100])
+    flows = np.zeros(48)
+    flows[10] = 5_000
+    results = simulate(grid, np.full(48, 10.0), 3600, 1e-7, 1.0, 2000.0, flows=flows)
+    assert list(results["harvests"]) == [1, 0]
+
+
+def test_unharvested_crv_counts_after_a_final_harvest():
+    grid = make_grid([DAY, 60 * DAY], [100 * DAY], [1e30], [100])
+    results = simulate(
+        grid, np.full(240, 10.0), 3600, 1e-7, 1.0, 2000.0, starting_assets=1e6
+    )
+    # our long delay never harvests, but still earns everything less one harvest's gas. it only misses compounding.
+    final_cost = 1_500_000 * 10.0 * 1e-9 * 2000.0
+    assert results["harvests"][1] == 0
+    assert np.isclose(results["net_yield"][1], results["unharvested"][1] - final_cost)
+    assert results["net_yield"][1] > 0.9 * results["net_yield"][0]
+
+
+def test_harvest_on_profit_waits_for_profit_factor():
+    grid = make_grid([DAY], [100 * DAY], [1e30], [100], [False, True])
+    results = simulate(
+        grid, np.full(12, 10.0), 3600, 1e-7, 1.0, 2000.0, starting_assets=1e6
+    )
+    # each harvest costs 30 want, and we earn 324 want of CRV an hour after keepCRV. so we harvest once we have 3,000
+    # want, in our tenth hour, instead of waiting a day.
+    assert list(results["harvests"]) == [0, 1]
@@ -0,0 +1,72 @@
+import numpy as np
+from sim.cryptoswap import CryptoSwap, halfpow, newton_D, newton_y
+
+SIZES = [10 ** 18, 10 ** 21, 10 ** 23, 10 ** 24]
+ANN = 400_000
+GAMMA = 145_000_000_000_000
+
+
+def make_crveth(price_scale=10 ** 15):
+    balances = [30_000 * 10 ** 18, 30_000_000 * 10 ** 18]
+    xp = [balances[0], balances[1] * price_scale // 10 ** 18]
+    return CryptoSwap(
+        balances,
+        newton_D(ANN, GAMMA, xp),
+        ANN,
+        GAMMA,
+        26_000_000,
+        45_000_000,
+        230_000_000_000_000,
+        price_scale,
+        price_scale,
+        price_scale,
+        0,
+        600,
+    )
+
+
+# quoting a whole array at once gives exactly what we'd get one by one
+def test_vectorized_matches_scalar():
+    pool = make_crveth()
+    batch = pool.get_dy(1, 0, np.array(SIZES, dtype=object))
+    assert list(batch) == [pool.get_dy(1, 0, size) for size in SIZES]
+
+
+def test_newton_y_keeps_D():
+    pool = make_crveth()
+    xp = pool.xp()
+    xp[1] += 10 ** 21
+    y = newton_y(ANN, GAMMA, xp, pool.d, 0)
+    assert abs(newton_D(ANN, GAMMA, [y, xp[1]]) - pool.d) * 10 ** 14 < pool.d
+
+
+def test_fees_and_price_impact():
+    pool = make_crveth()
+    # a balanced pool charges mid_fee on a small trade
+    impact = pool.price_impact(1, 0, np.array(SIZES, dtype=object), 0)
+    assert abs(impact[0] - 0.0026) < 1e-6
+    assert all(np.diff(impact) > 0)
+    # and we can't round trip for a profit
+    assert pool.get_dy(0, 1, pool.get_dy(1, 0, 10 ** 21)) < 10 ** 21
+
+
+def test_price_oracle():
+    assert halfpow(0) == 10 ** 18
+    assert halfpow(10 ** 18) == 5 * 10 ** 17
+    pool = make_crveth()
+    pool.last_prices = 2 * 10 ** 15
+    # after one half time we're halfway to our last price
+    assert pool.price_oracle(600) == 15 * 10 ** 14
+    assert pool.price_oracle(0) == 10 ** 15
+
+
+# a price oracle read from the pool after last_prices_timestamp has already moved, so we don't move it twice
+def test_price_oracle_from_a_later_read():
+    pool = make_crveth()
+    pool.last_prices = 2 * 10 ** 15
+    read = make_crveth()
+    read.last_prices = pool.last_prices
+    read._price_oracle = pool.price_oracle(600)
+    read.price_oracle_timestamp = 600
+    assert read.price_oracle(600) == pool.price_oracle(600)
+    assert read.price_oracle(1200) == 175 * 10 ** 13
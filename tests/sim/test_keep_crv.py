@@ -0,0 +1,50 @@
+import numpy as np
+from sim.keep_crv import boost, recommend, simulate
+
+KEEP_GRID = list(range(0, 10_001, 500))
+
+
+def make_gauges(size, balance, total_supply, keep_crv=1000):
+    working_supply = total_supply * 0.6
+    return {
+        "balance": np.full(size, balance),
+        "total_supply": np.full(size, total_supply),
+        "working_supply": np.full(size, working_supply),
+        "inflation_rate": np.full(size, 1.0),
+        "tvl": np.full(size, balance),
+        "keep_crv": np.full(size, keep_crv),
+    }
+
+
+def test_boost_limits():
+    assert boost(100.0, 1_000.0, 0.0, 1_000.0) == 1
+    assert boost(100.0, 1_000.0, 1_000.0, 1_000.0) == 2.5
+    # more veCRV never hurts
+    ve = np.linspace(0, 1_000, 50)
+    assert np.all(np.diff(boost(100.0, 1_000.0, ve, 1_000.0)) >= 0)
+
+
+def test_simulate_shapes():
+    gauges = make_gauges(300, 1e6, 1e7)
+    results = simulate(gauges, 1e5, 1e9, KEEP_GRID, 1.0)
+    assert results["boost"].shape == (300, len(KEEP_GRID))
+    assert results["net_apr"].shape == (300, len(KEEP_GRID))
+    assert np.all(results["net_apr"] <= results["apr"])
+    # keeping more CRV means more veCRV, so our boost goes up
+    assert np.all(np.diff(results["boost"], axis=1) >= 0)
+    assert np.all(results["boost"] <= 2.5 + 1e-9)
+
+
+# once we're at max boost, there's nothing to gain from keeping CRV
+def test_max_boost_keeps_nothing():
+    gauges = make_gauges(5, 1e6, 1e7)
+    results = recommend(gauges, 1e9, 1e9, KEEP_GRID, 1.0)
+    assert list(results["keep_crv"]) == [0] * 5
+
+
+# with almost no veCRV and a huge fleet, each bit of veCRV is worth a lot across all of our gauges
+def test_low_boost_keeps_some():
+    gauges = make_gauges(200, 1e6, 2e6, keep_crv=0)
+    results = recommend(gauges, 1.0, 1e8, KEEP_GRID, 1.0)
+    assert np.all(results["keep_crv"] > 0)
+    assert results["fleet_net_yield"].shape == (200, len(KEEP_GRID))
@@ -0,0 +1,115 @@
+import csv
+import json
+from sim.replay import Replay, Scenario, read_records, replay
+from sim.swaps import USDC
+
+DAY = 86400
+STRATEGIES = [
+    "0x1111111111111111111111111111111111111111",
+    "0x2222222222222222222222222222222222222222",
+]
+# 900 CRV sold at 0.0005 WETH, then 2000 USDT per WETH less uniswap's 0.05%
+PROFIT = 899_550_000 * 10 ** 12
+
+
+def history():
+    for day in range(1, 29, 7):
+        for strategy in STRATEGIES:
+            timestamp = day * DAY
+            yield {
+                "event": "Swap",
+                "strategy": strategy,
+                "timestamp": timestamp,
+                "crv_claimed": str(1000 * 10 ** 18),
+                "crv_price": 5 * 10 ** 14,
+                "weth_price_usdt": 2000 * 10 ** 6,
+                "virtual_price": 10 ** 18,
+                "keep_crv": 1000,
+                "target_stable": 2,
+                "uni_stable_fee": 500,
+            }
+            yield {
+                "event": "StrategyReported",
+                "strategy": strategy,
+                "timestamp": timestamp,
+                "totalDebt": 10 ** 24,
+            }
+            yield {
+                "event": "Harvested",
+                "strategy": strategy,
+                "timestamp": timestamp,
+                "profit": PROFIT,
+                "loss": 0,
+                "gas_used": 1_000_000,
+                "gas_price": 50 * 10 ** 9,
+            }
+
+
+def write_jsonl(path, records):
+    with open(path, "w") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def test_replay_matches_history(tmp_path):
+    write_jsonl(tmp_path / "history.jsonl", history())
+    results = replay([tmp_path / "history.jsonl"], {"as run": Scenario()})
+    for strategy in STRATEGIES:
+        result = results[(strategy, "as run")]
+        assert result["harvests"] == result["actual_harvests"] == 4
+        assert result["profit"] == result["actual_profit"] == 4 * PROFIT
+        assert result["kept_crv"] == 4 * 100 * 10 ** 18
+        # 0.05 ETH of gas at 2000 per ETH each time
+        assert result["gas"] == 4 * 100 * 10 ** 18
+
+
+def test_scenarios(tmp_path):
+    write_jsonl(tmp_path / "history.jsonl", history())
+    scenarios = {
+        "as run": Scenario(),
+        "no keep": Scenario(keep_crv=0),
+        "usdc 0.01%": Scenario(target_stable=USDC, uni_stable_fee=100),
+        "every 2 weeks": Scenario(min_report_delay=14 * DAY),
+    }
+    results = replay([tmp_path / "history.jsonl"], scenarios)
+    strategy = STRATEGIES[0]
+    as_run = results[(strategy, "as run")]
+    assert results[(strategy, "no keep")]["kept_crv"] == 0
+    assert results[(strategy, "no keep")]["profit"] > as_run["profit"]
+    assert results[(strategy, "usdc 0.01%")]["profit"] > as_run["profit"]
+
+    # we only harvest on days 1 and 22, but still sell all of our CRV
+    slower = results[(strategy, "every 2 weeks")]
+    assert slower["harvests"] == 2
+    assert slower["gas"] == as_run["gas"] // 2
+    assert slower["kept_crv"] == as_run["kept_crv"]
+    assert slower["profit"] == as_run["profit"]
+
+
+# our files are streamed and merged, so splitting history across formats doesn't change anything
+def test_streams_mixed_files(tmp_path):
+    records = list(history())
+    write_jsonl(tmp_path / "swaps.jsonl", [r for r in records if r["event"] == "Swap"])
+    with open(tmp_path / "events.csv", "w", newline="") as f:
+        names = [
+            "event",
+            "strategy",
+            "timestamp",
+            "totalDebt",
+            "profit",
+            "loss",
+            "gas_used",
+            "gas_price",
+        ]
+        writer = csv.DictWriter(f, names)
+        writer.writeheader()
+        writer.writerows(r for r in records if r["event"] != "Swap")
+
+    merged = read_records(tmp_path / "swaps.jsonl", tmp_path / "events.csv")
+    assert [r["timestamp"] for r in merged] == sorted(r["timestamp"] for r in records)
+
+    split = Replay({"as run": Scenario()}).run(
+        read_records(tmp_path / "swaps.jsonl", tmp_path / "events.csv")
+    )
+    write_jsonl(tmp_path / "history.jsonl", records)
+    assert split == replay([tmp_path / "history.jsonl"], {"as run": Scenario()})
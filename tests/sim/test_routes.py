@@ -0,0 +1,66 @@
+from sim.routes import ROUTES, best_route, quote_routes, uni_path
+from sim.stableswap import Metapool3Crv, StableSwap
+from sim.swaps import USDC, USDT
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDT_ADDRESS = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+
+
+def make_metapool(base_balances):
+    base = StableSwap(
+        base_balances,
+        [10 ** 18, 10 ** 30, 10 ** 30],
+        2000,
+        1_000_000,
+        880_000_000 * 10 ** 18,
+        a_precision=1,
+    )
+    meta = StableSwap(
+        [100_000_000 * 10 ** 18, 150_000_000 * 10 ** 18],
+        [10 ** 18, 1_022_722_405_123_896_711],
+        200_000,
+        4_000_000,
+        245_000_000 * 10 ** 18,
+    )
+    return Metapool3Crv(meta, base)
+
+
+def stable_out(per_stable):
+    return [per_stable[stable] * (10 ** 6 - fee) // 10 ** 6 for stable, fee in ROUTES]
+
+
+def test_uni_path():
+    path = uni_path(WETH, 500, USDT_ADDRESS)
+    assert len(path) == 43
+    assert path[20:23] == (500).to_bytes(3, "big")
+
+
+def test_quotes_match_zap():
+    metapool = make_metapool(
+        [300_000_000 * 10 ** 18, 350_000_000 * 10 ** 6, 250_000_000 * 10 ** 6]
+    )
+    out = stable_out([2_000_000 * 10 ** 18, 2_000_000 * 10 ** 6, 2_000_000 * 10 ** 6])
+    want = quote_routes(metapool, out)
+    for (stable, _), amount, quote in zip(ROUTES, out, want):
+        amounts = [0, 0, 0, 0]
+        amounts[stable + 1] = amount
+        assert quote == metapool.add_liquidity(amounts)
+
+
+def test_best_route():
+    # with the same prices everywhere, the stable 3pool is short of pays us a bonus
+    metapool = make_metapool(
+        [300_000_000 * 10 ** 18, 350_000_000 * 10 ** 6, 250_000_000 * 10 ** 6]
+    )
+    out = stable_out([2_000_000 * 10 ** 18, 2_000_000 * 10 ** 6, 2_000_000 * 10 ** 6])
+    best = best_route(quote_routes(metapool, out), (USDT, 500))
+    assert best["target_stable"] == USDT
+    assert best["uni_stable_fee"] == 100
+
+    # a much better uniswap price wins over 3pool's bonus, and a missing pool is never picked
+    out = stable_out([2_000_000 * 10 ** 18, 2_100_000 * 10 ** 6, 2_000_000 * 10 ** 6])
+    out[ROUTES.index((USDC, 100))] = 0
+    best = best_route(quote_routes(metapool, out), (USDT, 500))
+    assert (best["target_stable"], best["uni_stable_fee"]) == (USDC, 500)
+    assert best["gain"] > 0
+    assert best_route(quote_routes(metapool, out), (USDC, 500))["gain"] == 0
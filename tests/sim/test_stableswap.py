@@ -0,0 +1,64 @@
+import numpy as np
+from sim.stableswap import Metapool3Crv, StableSwap
+
+AMOUNTS = [10 ** 6, 10 ** 9, 10 ** 12, 10 ** 15]
+
+
+def make_3pool():
+    return StableSwap(
+        [300_000_000 * 10 ** 18, 350_000_000 * 10 ** 6, 250_000_000 * 10 ** 6],
+        [10 ** 18, 10 ** 30, 10 ** 30],
+        2000,
+        1_000_000,
+        880_000_000 * 10 ** 18,
+        a_precision=1,
+    )
+
+
+def make_metapool():
+    return StableSwap(
+        [100_000_000 * 10 ** 18, 150_000_000 * 10 ** 18],
+        [10 ** 18, 1_022_722_405_123_896_711],
+        200_000,
+        4_000_000,
+        245_000_000 * 10 ** 18,
+    )
+
+
+# quoting a whole array at once gives exactly what we'd get one by one
+def test_vectorized_matches_scalar():
+    pool = make_3pool()
+    zap = Metapool3Crv(make_metapool(), pool)
+    batch = zap.add_liquidity([0, 0, 0, np.array(AMOUNTS, dtype=object)])
+    assert list(batch) == [zap.add_liquidity([0, 0, 0, amount]) for amount in AMOUNTS]
+
+    batch = pool.calc_withdraw_one_coin(np.array(AMOUNTS, dtype=object) * 10 ** 12, 1)
+    assert list(batch) == [
+        pool.calc_withdraw_one_coin(amount * 10 ** 12, 1) for amount in AMOUNTS
+    ]
+
+
+def test_balanced_pool():
+    pool = StableSwap([10 ** 24] * 2, [10 ** 18] * 2, 20_000, 4_000_000, 2 * 10 ** 24)
+    assert pool.get_D(pool.xp()) == 2 * 10 ** 24
+    assert pool.get_virtual_price() == 10 ** 18
+    # a balanced deposit pays no fees
+    minted, _ = pool.add_liquidity([10 ** 18, 10 ** 18])
+    assert minted == pool.calc_token_amount([10 ** 18, 10 ** 18]) == 2 * 10 ** 18
+
+
+def test_fees():
+    pool = make_3pool()
+    # an imbalanced deposit pays fees, so we get less than calc_token_amount says
+    minted, _ = pool.add_liquidity([0, 0, 10 ** 12])
+    assert minted < pool.calc_token_amount([0, 0, 10 ** 12])
+    # and we can't get more back out than we put in
+    assert pool.calc_withdraw_one_coin(minted, 2) < 10 ** 12
+
+
+def test_get_y_keeps_D():
+    pool = make_metapool()
+    xp = pool.xp()
+    d = pool.get_D(xp)
+    y = pool.get_y(0, 1, xp[0] + 10 ** 21, xp)
+    assert abs(pool.get_D([xp[0] + 10 ** 21, y]) - d) <= 2
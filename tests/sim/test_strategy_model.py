@@ -0,0 +1,137 @@
+from sim.accounting import StrategyModel
+from sim.swaps import FixedRateSwaps, DAI
+
+# check our accounting model on its own. tests/test_accounting_model.py compares it to the real contract.
+
+
+def test_harvest_sells_crv_and_keeps_some():
+    swaps = FixedRateSwaps()
+    model = StrategyModel(
+        staked_balance=100 * 10 ** 18, claimable_crv=1_000 * 10 ** 18, swaps=swaps
+    )
+    result = model.harvest(0, 100 * 10 ** 18)
+
+    # 10% of our CRV goes to the voter, the rest becomes want
+    assert model.sent_to_voter == 100 * 10 ** 18
+    weth = swaps.crv_to_weth(900 * 10 ** 18)
+    expected = swaps.stables_to_want([0, 0, swaps.weth_to_stable(weth, 2, 500)])
+    assert result.profit == expected
+    assert result.loss == 0
+    # the vault takes our profit, so our staked balance stays the same
+    assert model.want_balance == 0
+    assert model.staked_balance == 100 * 10 ** 18
+
+
+def test_dust_is_not_sold():
+    model = StrategyModel(
+        staked_balance=10 ** 18, claimable_crv=10 ** 17, swaps=FixedRateSwaps()
+    )
+    model.harvest(0, 10 ** 18)
+    assert model.crv_balance == 9 * 10 ** 16
+    assert model.weth_balance == 0
+
+
+# at a high base fee our CRV isn't worth selling yet, so it waits for our next harvest without paying keepCRV twice
+def test_unprofitable_sales_wait():
+    swaps = FixedRateSwaps()
+    model = StrategyModel(
+        staked_balance=10 ** 18,
+        claimable_crv=10 * 10 ** 18,
+        base_fee=100 * 10 ** 9,
+        swaps=swaps,
+    )
+    model.harvest(0, 10 ** 18)
+    assert model.crv_balance == 9 * 10 ** 18
+    assert model.sent_to_voter == 10 ** 18
+
+    # 63 CRV is worth 0.0315 WETH, more than 150k gas at 100 gwei, but that WETH isn't worth 350k gas
+    model.claimable_crv = 60 * 10 ** 18
+    model.harvest(0, 10 ** 18)
+    assert model.sent_to_voter == 7 * 10 ** 18
+    assert model.crv_balance == 0
+    assert model.weth_balance == swaps.crv_to_weth(63 * 10 ** 18)
+
+    # once gas is cheap, we sell it all
+    model.base_fee = 10 * 10 ** 9
+    result = model.harvest(0, 10 ** 18)
+    assert model.weth_balance == 0
+    assert result.profit > 0
+
+
+def test_target_stable():
+    model = StrategyModel(
+        staked_balance=10 ** 18,
+        weth_balance=10 ** 18,
+        target_stable=DAI,
+        keep_crv=0,
+        swaps=FixedRateSwaps(),
+    )
+    model.prepare_return(0, 10 ** 18)
+    assert model.stable_balances == [0, 0, 0]
+    assert model.want_balance == 2000 * 10 ** 18 * 9995 // 10000
+
+
+def test_debt_payment():
+    model = StrategyModel(staked_balance=100 * 10 ** 18)
+    result = model.harvest(40 * 10 ** 18, 100 * 10 ** 18)
+    assert (result.profit, result.loss, result.debt_payment) == (0, 0, 40 * 10 ** 18)
+    assert model.staked_balance == 60 * 10 ** 18
+    assert model.want_balance == 0
+
+
+def test_loss():
+    model = StrategyModel(staked_balance=90 * 10 ** 18)
+    result = model.prepare_return(0, 100 * 10 ** 18)
+    assert result.loss == 10 * 10 ** 18
+
+
+# a donation that was already deposited to the gauge leaves us with more profit than loose want, so we pull everything out
+def test_donation_liquidates_all():
+    model = StrategyModel(staked_balance=150 * 10 ** 18)
+    result = model.prepare_return(0, 100 * 10 ** 18)
+    assert result.profit == 50 * 10 ** 18
+    assert model.staked_balance == 0
+    assert model.want_balance == 150 * 10 ** 18
+
+
+def test_emergency_exit():
+    model = StrategyModel(staked_balance=100 * 10 ** 18, emergency_exit=True)
+    result = model.harvest(100 * 10 ** 18, 100 * 10 ** 18)
+    assert (result.profit, result.loss, result.debt_payment) == (0, 0, 100 * 10 ** 18)
+    assert model.estimated_total_assets() == 0
+
+
+def test_liquidate_position():
+    model = StrategyModel(want_balance=10, staked_balance=100)
+    assert model.liquidate_position(5) == (5, 0)
+    assert model.liquidate_position(50) == (50, 0)
+    assert model.liquidate_position(200) == (110, 90)
+
+
+def test_harvest_trigger():
+    model = StrategyModel(staked_balance=10 ** 18)
+    assert not model.harvest_trigger(0)
+    assert model.harvest_trigger(model.max_report_delay + 1, base_fee_acceptable=False)
+    assert not model.harvest_trigger(
+        model.min_report_delay + 1, base_fee_acceptable=False
+    )
+    assert model.harvest_trigger(model.min_report_delay + 1)
+    assert model.harvest_trigger(0, credit_available=model.credit_threshold + 1)
+
+    model.force_harvest_trigger_once = True
+    assert model.harvest_trigger(0)
+    model.prepare_return(0, 10 ** 18)
+    assert not model.harvest_trigger(0)
+
+    # with harvestOnProfit, our profit has to beat profitFactor times our keeper's cost instead of waiting for minDelay
+    model.harvest_on_profit = True
+    assert not model.harvest_trigger(model.min_report_delay + 1)
+    assert model.harvest_trigger(0, claimable_profit=101, call_cost=1)
+    assert not model.harvest_trigger(0, claimable_profit=100, call_cost=1)
+    assert not model.harvest_trigger(
+        0, claimable_profit=101, call_cost=1, base_fee_acceptable=False
+    )
+
+    # inactive strategies never trigger
+    empty = StrategyModel()
+    assert not empty.harvest_trigger(model.max_report_delay + 1, debt_ratio=0)
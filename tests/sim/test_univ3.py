@@ -0,0 +1,126 @@
+import numpy as np
+from sim.univ3 import (
+    FEE_DENOMINATOR,
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    UniswapV3Pool,
+    get_amount0_delta,
+    get_amount1_delta,
+    get_next_sqrt_price_from_input,
+    get_sqrt_ratio_at_tick,
+)
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+AMOUNTS = [10 ** 12, 10 ** 18, 10 ** 20, 10 ** 21, 3 * 10 ** 21, 10 ** 23]
+
+
+# a WETH/USDT pool around 2000 USDT per WETH (tick -200311), with a few positions on each side
+def make_pool():
+    ticks = {}
+    for lower, upper, liquidity in (
+        (-201000, -199000, 2 * 10 ** 19),
+        (-200400, -200200, 5 * 10 ** 19),
+        (-203000, -200300, 10 ** 19),
+        (-210000, -190000, 10 ** 18),
+    ):
+        ticks[lower] = ticks.get(lower, 0) + liquidity
+        ticks[upper] = ticks.get(upper, 0) - liquidity
+    tick = -200311
+    liquidity = sum(net for t, net in ticks.items() if t <= tick)
+    return UniswapV3Pool(
+        WETH,
+        USDT,
+        500,
+        10,
+        get_sqrt_ratio_at_tick(tick) + 12345,
+        tick,
+        liquidity,
+        ticks,
+    )
+
+
+# UniswapV3Pool.swap for one exact input, one tick at a time, to check our batched quotes against
+def reference_swap(pool, amount, zero_for_one):
+    limit = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    sqrt_price, tick, liquidity = pool.sqrt_price, pool.tick, pool.liquidity
+    remaining, out = amount, 0
+    while remaining > 0 and sqrt_price != limit:
+        tick_next, initialized = pool._next_tick(tick, zero_for_one)
+        tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+        target = get_sqrt_ratio_at_tick(tick_next)
+        target = max(target, limit) if zero_for_one else min(target, limit)
+        less_fee = remaining * (FEE_DENOMINATOR - pool.fee) // FEE_DENOMINATOR
+        amount_in = (
+            int(get_amount0_delta(target, sqrt_price, liquidity, True))
+            if zero_for_one
+            else int(get_amount1_delta(sqrt_price, target, liquidity, True))
+        )
+        if less_fee >= amount_in:
+            next_price = target
+            fee = -(-amount_in * pool.fee // (FEE_DENOMINATOR - pool.fee))
+        else:
+            next_price = int(
+                get_next_sqrt_price_from_input(
+                    sqrt_price, liquidity, less_fee, zero_for_one
+                )
+            )
+            amount_in = (
+                int(get_amount0_delta(next_price, sqrt_price, liquidity, True))
+                if zero_for_one
+                else int(get_amount1_delta(sqrt_price, next_price, liquidity, True))
+            )
+            fee = remaining - amount_in
+        if zero_for_one:
+            out += int(get_amount1_delta(next_price, sqrt_price, liquidity, False))
+        else:
+            out += int(get_amount0_delta(sqrt_price, next_price, liquidity, False))
+        remaining -= amount_in + fee
+        sqrt_price = next_price
+        if next_price == target:
+            if initialized:
+                net = pool.ticks[tick_next]
+                liquidity += -net if zero_for_one else net
+            tick = tick_next - 1 if zero_for_one else tick_next
+        else:
+            break
+    return out
+
+
+def test_tick_math():
+    assert get_sqrt_ratio_at_tick(0) == Q96
+    assert get_sqrt_ratio_at_tick(-887272) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(887272) == MAX_SQRT_RATIO
+
+
+def test_quotes_match_swap():
+    pool = make_pool()
+    weth_out = pool.quote_exact_input(WETH, np.array(AMOUNTS, dtype=object))
+    assert list(weth_out) == [reference_swap(pool, amount, True) for amount in AMOUNTS]
+    usdt = [amount // 10 ** 9 for amount in AMOUNTS]
+    usdt_out = pool.quote_exact_input(USDT, np.array(usdt, dtype=object))
+    assert list(usdt_out) == [reference_swap(pool, amount, False) for amount in usdt]
+    assert pool.quote_exact_input(WETH, 10 ** 18) == weth_out[1]
+
+
+def test_price_and_fees():
+    pool = make_pool()
+    # about 2000 USDT for 1 WETH, less our 0.05%
+    out = pool.quote_exact_input(WETH, 10 ** 18)
+    assert 1990 * 10 ** 6 < out < 2000 * 10 ** 6
+    # bigger trades get worse prices
+    quotes = pool.quote_exact_input(WETH, np.array(AMOUNTS[1:], dtype=object))
+    prices = [q / a for q, a in zip(quotes, AMOUNTS[1:])]
+    assert all(a >= b for a, b in zip(prices, prices[1:]))
+
+
+def test_snapshot_round_trip(tmp_path):
+    pool = make_pool()
+    pool.save(tmp_path / "pool.json")
+    loaded = UniswapV3Pool.load(tmp_path / "pool.json")
+    assert loaded.quote_exact_input(WETH, 10 ** 20) == pool.quote_exact_input(
+        WETH, 10 ** 20
+    )
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import psutil
+from brownie import chain, config, web3
+
+# Saves our prepared fork state to disk, so the next session can load it instead of re-running the strategy setup.
+# Only anvil can dump and load its state, so on other clients this does nothing and we build from scratch.
+# When running with xdist (brownie test -n), each worker has its own node. The first worker to get here builds the state
+# while holding a lock, and the rest wait for it and load the same state.
+
+CACHE_DIR = Path(__file__).parent.parent.joinpath("build", "chain_state")
+LOCK_TIMEOUT = 30 * 60  # a cold mainnet fork can take a while to get through our setup
+
+
+def _request(method, params):
+    response = web3.provider.make_request(method, params)
+    return response.get("result")
+
+
+_session_start_block = None
+
+
+# the block our node forked from: a pinned fork block from our config, or from the node itself, or else the first block
+# we saw this session. never "latest", since that moves past our setup as soon as we've built our first pool.
+def fork_block_number():
+    global _session_start_block
+    settings = config["active_network"].get("cmd_settings") or {}
+    for key in ("fork_block", "fork_block_number"):
+        if settings.get(key) is not None:
+            return int(settings[key])
+    fork = settings.get("fork") or ""
+    if "@" in str(fork):  # ganache takes url@block
+        return int(str(fork).rsplit("@", 1)[1])
+
+    node_info = _request("anvil_nodeInfo", []) or {}
+    fork_config = node_info.get("forkConfig") or {}
+    if fork_config.get("forkBlockNumber") is not None:
+        return int(fork_config["forkBlockNumber"])
+    metadata = _request("hardhat_metadata", []) or {}
+    forked = metadata.get("forkedNetwork") or {}
+    if forked.get("forkBlockNumber") is not None:
+        return int(forked["forkBlockNumber"])
+
+    if _session_start_block is None:
+        _session_start_block = web3.eth.block_number
+    return _session_start_block
+
+
+# only anvil can dump and load its state
+def supports_state_dump():
+    return "anvil" in web3.clientVersion.lower()
+
+
+class ChainStateCache:
+    def __init__(self, **settings):
+        # key on the block we forked from too. if the fork isn't pinned this changes every run, so we never load stale state.
+        fork_block = web3.eth.get_block(fork_block_number())
+        settings["fork_block"] = [fork_block["number"], fork_block["hash"].hex()]
+        key = hashlib.sha256(
+            json.dumps(settings, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        self.path = CACHE_DIR.joinpath(f"{key[:16]}.json")
+        self.lock_path = self.path.with_suffix(".lock")
+        self.addresses = {}
+        self.loaded = False
+        self.locked = False
+
+    def load(self):
+        # without dump and load there's nothing to share, so don't make other workers wait on our setup
+        if not supports_state_dump():
+            return False
+        self._acquire_lock()
+        if not self.path.exists():
+            # hold onto our lock until we save, so other workers wait for our state instead of building their own
+            return False
+        cached = json.loads(self.path.read_text())
+        if not _request("anvil_loadState", [cached["state"]]):
+            self.release()
+            return False
+
+        # dumped state doesn't always carry the block time, and our setup sleeps, so catch back up
+        behind = cached["timestamp"] - web3.eth.get_block("latest")["timestamp"]
+        if behind > 0:
+            chain.sleep(behind)
+        chain.mine(1)
+
+        self.addresses = cached["addresses"]
+        self.loaded = True
+        self.release()
+        print(f"\nLoaded prepared chain state from {self.path.name}")
+        return True
+
+    def save(self, **addresses):
+        if not supports_state_dump():
+            return
+        try:
+            state = _request("anvil_dumpState", [])
+            if state is None:
+                return
+            cached = {
+                "state": state,
+                "timestamp": web3.eth.get_block("latest")["timestamp"],
+                "addresses": addresses,
+            }
+            # write then rename, so nobody reading the cache ever sees half a file
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(cached))
+            temp_path.replace(self.path)
+            self.addresses = addresses
+        finally:
+            self.release()
+
+    def release(self):
+        if self.locked:
+            self.lock_path.unlink()
+            self.locked = False
+
+    def _acquire_lock(self):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        deadline = time.time() + LOCK_TIMEOUT
+        while True:
+            try:
+                lock_file = os.open(
+                    self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY
+                )
+            except FileExistsError:
+                if self._lock_is_stale():
+                    self.lock_path.unlink(missing_ok=True)
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(
+                        f"Timed out waiting for {self.lock_path}. Delete it if no other tests are running."
+                    )
+                time.sleep(1)
+                continue
+            os.write(lock_file, str(os.getpid()).encode())
+            os.close(lock_file)
+            self.locked = True
+            return
+
+    # if whoever held the lock died without releasing it, don't wait on them forever
+    def _lock_is_stale(self):
+        try:
+            pid = int(self.lock_path.read_text())
+        except (OSError, ValueError):
+            return False
+        return not psutil.pid_exists(pid)
@@ -0,0 +1,111 @@
+from brownie import Contract, ZERO_ADDRESS
+from brownie.exceptions import VirtualMachineError
+from sim.accounting import StrategyModel
+from sim.swaps import NoSwaps
+
+# Reads a batch of view calls with a single eth_call through Multicall2 (or our MockMulticall on chains without it),
+# instead of one RPC round trip per call. Calls are (method, args) pairs, like (vault.strategies, [strategy]).
+# read_state builds a record of our vault and strategy that tests can compare before and after an action.
+
+MULTICALL2_ADDRESS = "0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696"  # mainnet
+WETH_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+STABLE_ADDRESSES = (  # in the same order as sim/swaps.py
+    "0x6B175474E89094C44Da98b954EedeAC495271d0F",  # DAI
+    "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",  # USDC
+    "0xdAC17F958D2ee523a2206206994597C13D831ec7",  # USDT
+)
+BASE_FEE_PROVIDER_ABI = [
+    {
+        "name": "basefee_global",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    }
+]
+
+
+def batch_call(multicall, calls, block=None):
+    encoded = [(method._address, method.encode_input(*args)) for method, args in calls]
+    kwargs = {} if block is None else {"block_identifier": block}
+    results = multicall.tryAggregate.call(False, encoded, **kwargs)
+
+    # a failed call returns None instead of reverting the whole batch
+    decoded = []
+    for (method, args), (success, data) in zip(calls, results):
+        decoded.append(method.decode_output(data) if success else None)
+    return decoded
+
+
+def read_state(multicall, vault, strategy, token, accounts=(), block=None):
+    reads = {
+        "vault_total_assets": (vault.totalAssets, []),
+        "vault_total_debt": (vault.totalDebt, []),
+        "vault_total_supply": (vault.totalSupply, []),
+        "price_per_share": (vault.pricePerShare, []),
+        "vault_idle": (token.balanceOf, [vault]),
+        "strategy_params": (vault.strategies, [strategy]),
+        "estimated_total_assets": (strategy.estimatedTotalAssets, []),
+        "strategy_want": (token.balanceOf, [strategy]),
+    }
+    # convex strategies don't have stakedBalance
+    if hasattr(strategy, "stakedBalance"):
+        reads["staked_balance"] = (strategy.stakedBalance, [])
+    for account in accounts:
+        if account in (None, ZERO_ADDRESS):
+            continue
+        reads[f"want_{account}"] = (token.balanceOf, [account])
+        reads[f"shares_{account}"] = (vault.balanceOf, [account])
+
+    values = batch_call(multicall, list(reads.values()), block)
+    return dict(zip(reads.keys(), values))
+
+
+# the base fee our strategy's _currentBaseFee() sees. like the strategy, an oracle we can't read means we always sell.
+def current_base_fee(gas_oracle):
+    try:
+        provider = Contract.from_abi(
+            "BaseFeeProvider", gas_oracle.baseFeeProvider(), BASE_FEE_PROVIDER_ABI
+        )
+        return provider.basefee_global()
+    except (AttributeError, ValueError, VirtualMachineError):
+        return 0
+
+
+# set up our accounting model from sim/accounting.py with what our strategy holds on-chain right now. our trades are
+# only checked if we're given a swap model that prices them, and a gauge to read what we'll claim on our next harvest.
+# claimable_tokens() isn't a view on most gauges, so we call it instead of sending a transaction.
+def model_from_chain(strategy, token, crv, gas_oracle=None, gauge=None, swaps=None):
+    weth = Contract.from_abi("WETH", WETH_ADDRESS, crv.abi)
+    has_rewards = strategy.hasRewards()
+    rewards_token = Contract.from_abi("Rewards", strategy.rewardsToken(), crv.abi)
+    claimable_crv = claimable_rewards = rewards_balance = 0
+    if has_rewards:
+        rewards_balance = rewards_token.balanceOf(strategy)
+    if gauge is not None:
+        claimable_crv = gauge.claimable_tokens.call(strategy.voter())
+        if has_rewards:
+            claimable_rewards = gauge.claimable_reward(strategy.voter(), rewards_token)
+
+    return StrategyModel(
+        want_balance=token.balanceOf(strategy),
+        staked_balance=strategy.stakedBalance(),
+        crv_balance=crv.balanceOf(strategy),
+        weth_balance=weth.balanceOf(strategy),
+        rewards_balance=rewards_balance,
+        claimable_crv=claimable_crv,
+        claimable_rewards=claimable_rewards,
+        keep_crv=strategy.keepCRV(),
+        has_rewards=has_rewards,
+        target_stable=STABLE_ADDRESSES.index(strategy.targetStable()),
+        uni_stable_fee=strategy.uniStableFee(),
+        min_report_delay=strategy.minReportDelay(),
+        max_report_delay=strategy.maxReportDelay(),
+        credit_threshold=strategy.creditThreshold(),
+        base_fee=0 if gas_oracle is None else current_base_fee(gas_oracle),
+        crv_sell_gas=strategy.crvSellGas(),
+        weth_sell_gas=strategy.wethSellGas(),
+        harvest_on_profit=strategy.harvestOnProfit(),
+        profit_factor=strategy.profitFactor(),
+        swaps=NoSwaps() if swaps is None else swaps,
+    )
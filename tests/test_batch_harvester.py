@@ -0,0 +1,104 @@
+import brownie
+from keeper.batch import encode_harvest_due, harvest_gas, harvest_transactions
+
+# harvest a batch through our BatchHarvester, built the way our keepers build it: one strategy that's due, an address
+# and a contract that aren't strategies, and one clone that's due but doesn't let our harvester harvest it. only our
+# strategy should be harvested, and the rest of the batch shouldn't care about the others. a harvest that runs out of
+# gas only uses its own gas limit, so it can't end the batch either.
+
+
+def test_batch_harvester(
+    BatchHarvester,
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+    strategist,
+    rewards,
+    keeper,
+    gauge,
+    pool,
+    strategy_name,
+    contract_name,
+    is_convex,
+    is_clonable,
+):
+    harvester = gov.deploy(BatchHarvester)
+    strategy.setKeeper(harvester, {"from": gov})
+
+    ## deposit to the vault after approving
+    token.approve(vault, 2 ** 256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+
+    batch = [strategy.address, whale.address, token.address]
+    clone = None
+    if is_clonable and not is_convex:
+        tx = strategy.cloneCurve3CrvRewards(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            gauge,
+            pool,
+            strategy_name,
+            {"from": gov},
+        )
+        clone = contract_name.at(tx.return_value)
+        # with some assets and no reports, its harvestTrigger is true
+        token.transfer(clone, amount / 100, {"from": whale})
+        assert clone.harvestTrigger(0)
+        batch.append(clone.address)
+
+    triggers = {address: {"harvest": True, "tend": False} for address in batch}
+    (params,) = harvest_transactions(harvester, triggers, 0)
+    tx = gov.transfer(harvester, 0, data=params["data"], gas_limit=params["gas"])
+
+    assert tx.events["StrategyHarvested"]["strategy"] == strategy
+    assert vault.strategies(strategy)["lastReport"] == tx.timestamp
+    assert strategy.harvestTrigger(0) == False
+    gas_used = harvest_gas(tx.logs)
+    assert gas_used[strategy.address] == tx.events["StrategyHarvested"]["gasUsed"]
+    assert 0 < gas_used[strategy.address] < tx.gas_used
+    if clone is not None:
+        assert tx.events["HarvestFailed"]["strategy"] == clone
+        assert clone.address in gas_used
+    assert whale.address not in gas_used
+    assert token.address not in gas_used
+
+    # a harvest that runs out of its gas limit fails alone, and leaves us the rest of our gas
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    limit = 100_000
+    tx = gov.transfer(
+        harvester,
+        0,
+        data=encode_harvest_due([strategy.address], 0, limit),
+        gas_limit=params["gas"],
+    )
+    assert tx.events["HarvestFailed"]["strategy"] == strategy
+    assert tx.events["HarvestFailed"]["gasUsed"] <= limit + 5_000
+    assert strategy.harvestTrigger(0)
+
+    # and we stop once we can't give a strategy its full limit
+    tx = gov.transfer(
+        harvester,
+        0,
+        data=encode_harvest_due([strategy.address], 0, 10 ** 8),
+        gas_limit=params["gas"],
+    )
+    assert tx.events["OutOfGas"]["strategy"] == strategy
+    assert "HarvestFailed" not in tx.events
+
+    # only our keepers can use our harvester
+    with brownie.reverts("!keeper"):
+        harvester.harvestDue([strategy], 0, 1_000_000, {"from": whale})
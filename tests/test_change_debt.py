@@ -2,6 +2,7 @@ import brownie
 from brownie import Contract
 from brownie import config
 import math
+from state_reader import read_state
 
 # test changing the debtRatio on a strategy and then harvesting it
 def test_change_debt(
@@ -16,6 +17,7 @@ def test_change_debt(
     sleep_time,
     is_slippery,
     no_profit,
+    multicall,
 ):
     ## deposit to the vault after approving
     startingWhale = token.balanceOf(whale)
@@ -25,18 +27,20 @@ def test_change_debt(
     strategy.harvest({"from": gov})
     chain.sleep(1)
 
-    # evaluate our current total assets
-    old_assets = vault.totalAssets()
-    startingStrategy = strategy.estimatedTotalAssets()
+    # evaluate our current total assets, reading all of our vault and strategy state in one call
+    before = read_state(multicall, vault, strategy, token)
+    old_assets = before["vault_total_assets"]
 
     # debtRatio is in BPS (aka, max is 10,000, which represents 100%), and is a fraction of the funds that can be in the strategy
-    currentDebt = vault.strategies(strategy)["debtRatio"]
+    currentDebt = before["strategy_params"]["debtRatio"]
     vault.updateStrategyDebtRatio(strategy, currentDebt / 2, {"from": gov})
     chain.sleep(sleep_time)
     strategy.harvest({"from": gov})
     chain.sleep(1)
 
-    assert strategy.estimatedTotalAssets() <= startingStrategy
+    after = read_state(multicall, vault, strategy, token)
+    assert after["estimated_total_assets"] <= before["estimated_total_assets"]
+    assert after["strategy_params"]["debtRatio"] == currentDebt // 2
 
     # simulate one day of earnings
     chain.sleep(sleep_time)
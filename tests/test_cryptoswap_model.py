@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from sim.cryptoswap import CryptoSwap
+
+# differential test of our crypto invariant in sim/cryptoswap.py against curve's forked CRV-ETH pool. every quote should
+# match get_dy to the wei.
+
+SIZES = [10 ** 18, 10 ** 20, 10 ** 22, 10 ** 24]
+
+
+def test_cryptoswap_model(crveth, chain):
+    # our local mock swaps at a fixed price
+    if not hasattr(crveth, "price_scale"):
+        pytest.skip("crveth is a mock")
+
+    model = CryptoSwap.from_contract(crveth, chain[-1].timestamp)
+    crv_sizes = np.array(SIZES, dtype=object)
+    assert list(model.get_dy(1, 0, crv_sizes)) == [
+        crveth.get_dy(1, 0, size) for size in SIZES
+    ]
+    weth_sizes = crv_sizes // 1000
+    assert list(model.get_dy(0, 1, weth_sizes)) == [
+        crveth.get_dy(0, 1, size) for size in weth_sizes
+    ]
+    assert model.price_oracle(chain[-1].timestamp) == crveth.price_oracle()
+
+    # and our oracle keeps moving toward last_prices like the pool's. each step can round a wei differently.
+    chain.sleep(3600)
+    chain.mine(1)
+    assert abs(model.price_oracle(chain[-1].timestamp) - crveth.price_oracle()) <= 1
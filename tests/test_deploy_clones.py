@@ -0,0 +1,52 @@
+import yaml
+from brownie import web3
+from scripts.deploy_clones import deploy, load_journal
+
+# roll out a few clones from a manifest, then add one more and run it again: only the new one should be sent
+
+
+def test_deploy_clones(
+    gov,
+    strategy,
+    vault,
+    rewards,
+    keeper,
+    gauge,
+    pool,
+    strategy_name,
+    contract_name,
+    is_convex,
+    is_clonable,
+    tmp_path,
+):
+    # our manifest has gauges
+    if not is_clonable or is_convex:
+        return
+
+    def entry(i):
+        return {
+            "vault": vault.address,
+            "gauge": gauge.address,
+            "pool": pool.address,
+            "name": f"{strategy_name} {i}",
+            "keeper": keeper.address,
+            "rewards": rewards.address,
+        }
+
+    manifest = tmp_path / "clones.yaml"
+    journal = tmp_path / "clones.journal.jsonl"
+    manifest.write_text(yaml.safe_dump([entry(i) for i in range(3)]))
+    clones = deploy(manifest, journal, strategy, gov)
+    assert len(set(clones.values())) == 3
+    for name, clone in clones.items():
+        clone = contract_name.at(clone)
+        assert clone.name() == name
+        assert clone.vault() == vault
+        assert clone.keeper() == keeper
+
+    nonce = web3.eth.get_transaction_count(gov.address)
+    manifest.write_text(yaml.safe_dump([entry(i) for i in range(4)]))
+    resumed = deploy(manifest, journal, strategy, gov)
+    assert web3.eth.get_transaction_count(gov.address) == nonce + 1
+    assert {name: resumed[name] for name in clones} == clones
+    assert all(record["status"] == "done" for record in load_journal(journal).values())
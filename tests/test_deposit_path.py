@@ -0,0 +1,64 @@
+import pytest
+from abi_store import load_contract
+
+# our strategy deposits its targetStable through curve's zap, or to 3pool and then its metapool itself. both paths should
+# get us the LP the zap quotes for our stables, within slippage. we donate our targetStable and harvest with all new CRV
+# going to our voter and rewards off, so the donation is all we deposit. any CRV or WETH left from an earlier harvest was
+# worth less than its gas, which is far below our tolerance on a deposit this size.
+
+ZAP = "0xA79828DF1850E8a3A3064576f380D90aECDD3359"
+THREE_POOL = "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7"
+STABLES = (
+    "0x6B175474E89094C44Da98b954EedeAC495271d0F",  # DAI
+    "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",  # USDC
+    "0xdAC17F958D2ee523a2206206994597C13D831ec7",  # USDT
+)
+SLIPPAGE = 0.001
+
+
+@pytest.mark.parametrize("through_zap", [True, False])
+def test_deposit_paths_match(
+    through_zap,
+    gov,
+    strategy,
+    gauge,
+    pool,
+    rewards_token,
+    accounts,
+    is_convex,
+    MockERC20,
+    MockCurveZap,
+):
+    # convex strategies deposit through the zap only
+    if is_convex:
+        return
+
+    strategy.setKeepCRV(10_000, {"from": gov})
+    if strategy.hasRewards():
+        strategy.updateRewards(False, rewards_token, {"from": gov})
+    strategy.setDoHealthCheck(False, {"from": gov})
+    strategy.setDepositThroughZap(through_zap, {"from": gov})
+
+    # 3pool holds plenty of every stable on a fork, and our local mocks can mint them
+    local = hasattr(gauge, "setCrvRate")
+    if local:
+        stable = MockERC20.at(strategy.targetStable())
+        zap = MockCurveZap.at(ZAP)
+    else:
+        stable = load_contract(strategy.targetStable())
+        zap = load_contract(ZAP)
+    size = 1_000_000 * 10 ** stable.decimals()
+    if local:
+        stable.mint(strategy, size, {"from": gov})
+    else:
+        stable.transfer(strategy, size, {"from": accounts.at(THREE_POOL, force=True)})
+
+    amounts = [0, 0, 0, 0]
+    amounts[STABLES.index(stable.address) + 1] = size
+    expected = zap.calc_token_amount(pool, amounts, True)
+
+    tx = strategy.harvest({"from": gov})
+    profit = tx.events["Harvested"]["profit"]
+    print("\nExpected LP:", expected / 1e18, "\nDeposited:", profit / 1e18)
+    assert profit == pytest.approx(expected, rel=SLIPPAGE)
+    assert stable.balanceOf(strategy) == 0
@@ -0,0 +1,88 @@
+import asyncio
+from brownie import web3
+from keeper.scanner import RPC, FleetScanner
+
+# our keeper's fleet scanner against our own node: it should find every clone from its Cloned event, and read every
+# trigger in one round trip per block (after pinning "latest" to a block number).
+
+
+def test_fleet_scanner(
+    gov,
+    strategy,
+    vault,
+    strategist,
+    rewards,
+    keeper,
+    gauge,
+    pool,
+    strategy_name,
+    contract_name,
+    multicall,
+    chain,
+    is_convex,
+    is_clonable,
+):
+    # our clones take a gauge here
+    if not is_clonable or is_convex:
+        return
+
+    start = chain.height
+    clones = []
+    for _ in range(3):
+        tx = strategy.cloneCurve3CrvRewards(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            gauge,
+            pool,
+            strategy_name,
+            {"from": gov},
+        )
+        clones.append(contract_name.at(tx.return_value))
+    call_cost = 10 ** 15
+
+    async def run():
+        rpc = RPC(web3.provider.endpoint_uri)
+        scanner = FleetScanner(
+            rpc, multicall.address, [strategy.address], start, call_cost
+        )
+        try:
+            await scanner.discover(chain.height - 1)
+            assert set(scanner.strategies) == {strategy.address} | {
+                clone.address for clone in clones
+            }
+
+            # a new clone shows up in our next scan
+            tx = strategy.cloneCurve3CrvRewards(
+                vault,
+                strategist,
+                rewards,
+                keeper,
+                gauge,
+                pool,
+                strategy_name,
+                {"from": gov},
+            )
+            requests = rpc.requests
+            block, triggers = await scanner.scan()
+            assert tx.return_value in triggers
+            # our block number, one batch, and one call for the clone we just found
+            assert rpc.requests - requests == 3
+            assert block == chain.height
+
+            for address, trigger in triggers.items():
+                checked = contract_name.at(address)
+                assert trigger["harvest"] == checked.harvestTrigger(call_cost)
+                assert trigger["tend"] == checked.tendTrigger(call_cost)
+
+            # and asking about the same block again is free, or only costs our block number when we ask for "latest"
+            requests = rpc.requests
+            assert (await scanner.scan(block))[1] == triggers
+            assert rpc.requests == requests
+            assert await scanner.scan() == (block, triggers)
+            assert rpc.requests == requests + 1
+        finally:
+            await rpc.close()
+
+    asyncio.run(run())
@@ -0,0 +1,269 @@
+import brownie
+from brownie import Contract
+from brownie import config
+import pytest
+
+# measure gas for our strategy's main entry points, and fail if any of them get more than 2% more expensive than our
+# baseline in tests/gas_baseline.json. run with UPDATE_GAS_BASELINE=1 to accept new numbers.
+
+# deposit and harvest so our funds are in the gauge, then wait so we have some profit to report
+def deposit_and_wait(gov, token, vault, strategy, whale, amount, sleep_time, chain):
+    token.approve(vault, 2 ** 256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+
+
+# check a normal harvest, and the harvests where prepareReturn has to go into liquidatePosition or liquidateAllPositions.
+# we sell into usdt by default, so also check each of our other targetStables. zap and direct are the same harvest without
+# rewards, deposited through curve's zap or to 3pool and then our metapool, so compare them to pick our pool's cheaper
+# deposit path.
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        "no_rewards",
+        "rewards",
+        "donation",
+        "debt_outstanding",
+        "dai",
+        "usdc",
+        "zap",
+        "direct",
+    ],
+)
+def test_harvest_gas(
+    gas_benchmark,
+    pool_config,
+    scenario,
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+    has_rewards,
+    is_convex,
+    rewards_token,
+):
+    # our rewards scenario only makes sense if our pool has rewards
+    if scenario == "rewards" and not has_rewards:
+        pytest.skip(f"{pool_config['name']} has no rewards token")
+
+    deposit_and_wait(gov, token, vault, strategy, whale, amount, sleep_time, chain)
+
+    if scenario in ("no_rewards", "zap", "direct") and has_rewards:
+        if is_convex:
+            strategy.updateRewards(False, 0, {"from": gov})
+        else:
+            strategy.updateRewards(False, rewards_token, {"from": gov})
+    elif scenario == "donation":
+        # send some funds to our strategy; it will have more assets than debt, so it can pay back from loose want
+        token.transfer(strategy, amount / 2, {"from": whale})
+        strategy.setDoHealthCheck(False, {"from": gov})
+    elif scenario == "debt_outstanding":
+        # we'll have to pull all of our funds back out of the gauge to pay the vault back
+        vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
+    elif scenario in ("dai", "usdc"):
+        strategy.setOptimal(0 if scenario == "dai" else 1, {"from": gov})
+
+    if scenario in ("zap", "direct"):
+        strategy.setDepositThroughZap(scenario == "zap", {"from": gov})
+
+    tx = strategy.harvest({"from": gov})
+    gas_benchmark.record(f"{pool_config['name']}_harvest_{scenario}", tx.gas_used)
+
+
+# a clone with little to sell. at a high base fee our sales aren't worth their gas, so we skip them and our CRV and WETH
+# wait for our next harvest. compare the two to see what that saves. we can only set the base fee on our local mocks.
+@pytest.mark.parametrize("base_fee", ["low", "high"])
+def test_low_yield_harvest_gas(
+    gas_benchmark,
+    pool_config,
+    base_fee,
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    crv,
+    gasOracle,
+):
+    if not hasattr(gasOracle, "setBaseFee"):
+        pytest.skip("we can only set the base fee on our local mocks")
+
+    # an hour of CRV on a tenth of our usual deposit
+    deposit_and_wait(gov, token, vault, strategy, whale, amount / 10, 3600, chain)
+    gasOracle.setBaseFee((10 if base_fee == "low" else 10_000) * 1e9, {"from": gov})
+    strategy.setDoHealthCheck(False, {"from": gov})
+
+    tx = strategy.harvest({"from": gov})
+    gas_benchmark.record(
+        f"{pool_config['name']}_harvest_low_yield_{base_fee}_base_fee", tx.gas_used
+    )
+    assert (crv.balanceOf(strategy) > 0) == (base_fee == "high")
+
+
+# withdrawing more than the vault has loose sends it to our strategy's liquidatePosition
+def test_withdraw_gas(
+    gas_benchmark,
+    pool_config,
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+):
+    deposit_and_wait(gov, token, vault, strategy, whale, amount, sleep_time, chain)
+    tx = vault.withdraw(amount / 2, {"from": whale})
+    gas_benchmark.record(
+        f"{pool_config['name']}_withdraw_liquidatePosition", tx.gas_used
+    )
+
+
+# harvesting in emergency exit goes through liquidateAllPositions
+def test_emergency_exit_gas(
+    gas_benchmark,
+    pool_config,
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+):
+    deposit_and_wait(gov, token, vault, strategy, whale, amount, sleep_time, chain)
+    strategy.setEmergencyExit({"from": gov})
+    strategy.setDoHealthCheck(False, {"from": gov})
+    tx = strategy.harvest({"from": gov})
+    gas_benchmark.record(
+        f"{pool_config['name']}_harvest_liquidateAllPositions", tx.gas_used
+    )
+
+
+# migrating calls prepareMigration on our old strategy
+def test_migration_gas(
+    gas_benchmark,
+    pool_config,
+    contract_name,
+    gov,
+    token,
+    vault,
+    strategist,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+    pid,
+    pool,
+    gauge,
+    strategy_name,
+    is_convex,
+):
+    deposit_and_wait(gov, token, vault, strategy, whale, amount, sleep_time, chain)
+    if is_convex:
+        new_strategy = strategist.deploy(
+            contract_name,
+            vault,
+            pid,
+            pool,
+            strategy_name,
+        )
+    else:
+        new_strategy = strategist.deploy(
+            contract_name,
+            vault,
+            gauge,
+            pool,
+            strategy_name,
+        )
+    tx = vault.migrateStrategy(strategy, new_strategy, {"from": gov})
+    gas_benchmark.record(f"{pool_config['name']}_migrate_prepareMigration", tx.gas_used)
+
+
+# cloning also runs initialize on our new strategy
+def test_clone_gas(
+    gas_benchmark,
+    pool_config,
+    gov,
+    vault,
+    strategist,
+    rewards,
+    keeper,
+    strategy,
+    pid,
+    pool,
+    gauge,
+    strategy_name,
+    is_convex,
+    is_clonable,
+):
+    if not is_clonable:
+        return
+
+    if is_convex:
+        tx = strategy.cloneCurve3CrvRewards(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            pid,
+            pool,
+            strategy_name,
+            {"from": gov},
+        )
+    else:
+        tx = strategy.cloneCurve3CrvRewards(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            gauge,
+            pool,
+            strategy_name,
+            {"from": gov},
+        )
+    gas_benchmark.record(f"{pool_config['name']}_clone_initialize", tx.gas_used)
+
+
+# keepers call this every block, so check it both right after a harvest and once we've got profit waiting
+def test_harvest_trigger_gas(
+    gas_benchmark,
+    pool_config,
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+):
+    token.approve(vault, 2 ** 256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.sleep(1)
+    chain.mine(1)
+    gas_benchmark.record(
+        f"{pool_config['name']}_harvestTrigger_after_harvest",
+        strategy.harvestTrigger.estimate_gas(0),
+    )
+
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    gas_benchmark.record(
+        f"{pool_config['name']}_harvestTrigger_with_profit",
+        strategy.harvestTrigger.estimate_gas(0),
+    )
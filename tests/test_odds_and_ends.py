@@ -723,3 +723,50 @@ def test_odds_and_ends_keep_cvx(
     strategy.harvest({"from": gov})
     treasury_after = convexToken.balanceOf(vault.rewards())
     assert treasury_after == treasury_before
+
+
+# a broken base fee provider can't block our harvests. we just sell everything, like we did before we checked gas.
+def test_odds_and_ends_broken_base_fee_provider(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    sleep_time,
+    crv,
+    gasOracle,
+):
+    # we can only swap out the provider on our local mocks
+    if not hasattr(gasOracle, "setBaseFeeProvider"):
+        return
+
+    token.approve(vault, 2 ** 256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    strategy.setDoHealthCheck(False, {"from": gov})
+
+    # at this base fee none of our CRV would be worth selling, but a provider that reverts reads as zero
+    gasOracle.setBaseFee(1e18, {"from": gov})
+    gasOracle.setBaseFeeProvider(crv, {"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    strategy.harvest({"from": gov})
+    assert crv.balanceOf(strategy) == 0
+
+    # and so does a provider without any code
+    gasOracle.setBaseFeeProvider(whale, {"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    tx = strategy.harvest({"from": gov})
+    assert crv.balanceOf(strategy) == 0
+    assert tx.events["Harvested"]["profit"] > 0
+
+    # with our provider back, we hold onto our CRV again
+    gasOracle.setBaseFeeProvider(gasOracle, {"from": gov})
+    chain.sleep(sleep_time)
+    chain.mine(1)
+    strategy.harvest({"from": gov})
+    assert crv.balanceOf(strategy) > 0
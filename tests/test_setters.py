@@ -74,6 +74,21 @@ def test_setters(
     except:
         print("\nThis strategy doesn't have Uniswap fees, most likely ETH-based")
 
+    if not is_convex:
+        # deposit to 3pool and then our metapool ourselves, then go back to the zap
+        strategy.setDepositThroughZap(False, {"from": gov})
+        assert strategy.depositThroughZap() == False
+        chain.sleep(86400)
+        strategy.harvest({"from": gov})
+        strategy.setDepositThroughZap(False, {"from": gov})
+        strategy.setDepositThroughZap(True, {"from": gov})
+        assert strategy.depositThroughZap() == True
+
+        # the gas our sales cost, which decides when they're worth making
+        strategy.setSellGas(120_000, 300_000, {"from": gov})
+        assert strategy.crvSellGas() == 120_000
+        assert strategy.wethSellGas() == 300_000
+
     strategy.setStrategist(strategist, {"from": gov})
     name = strategy.name()
     print("Strategy Name:", name)
@@ -111,6 +126,12 @@ def test_setters(
     else:
         with brownie.reverts():
             strategy.setKeepCRV(10_001, {"from": gov})
+        with brownie.reverts():
+            strategy.setDepositThroughZap(False, {"from": whale})
+        with brownie.reverts():
+            strategy.setHarvestOnProfit(True, {"from": whale})
+        with brownie.reverts():
+            strategy.setSellGas(0, 0, {"from": whale})
 
     # try a health check with zero address as health check
     strategy.setHealthCheck(zero, {"from": gov})
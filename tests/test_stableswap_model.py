@@ -0,0 +1,40 @@
+import pytest
+from abi_store import load_contract
+from sim.stableswap import Metapool3Crv
+
+# differential test of our StableSwap math in sim/stableswap.py against our forked metapool, 3pool and curve's zap. every
+# quote should match to the wei.
+
+ZAP = "0xA79828DF1850E8a3A3064576f380D90aECDD3359"
+THREE_POOL = "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7"
+THREE_CRV = "0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490"
+
+
+def test_stableswap_model(pool, chain):
+    # only 3Crv factory metapools cache 3pool's price, and our local mocks don't
+    if not hasattr(pool, "base_virtual_price") or pool.coins(1) != THREE_CRV:
+        pytest.skip("not a 3Crv factory metapool")
+
+    zap = load_contract(ZAP)
+    base_pool = load_contract(THREE_POOL)
+    model = Metapool3Crv.from_contracts(
+        pool, base_pool, load_contract(THREE_CRV), chain[-1].timestamp
+    )
+    assert model.base.get_virtual_price() == base_pool.get_virtual_price()
+    assert model.meta.get_virtual_price() == pool.get_virtual_price()
+
+    for stable, decimals in enumerate((18, 6, 6)):
+        for size in (100, 1_000_000, 100_000_000):
+            amounts = [0, 0, 0, 0]
+            amounts[stable + 1] = size * 10 ** decimals
+            assert model.calc_token_amount(amounts) == zap.calc_token_amount(
+                pool, amounts, True
+            )
+            assert base_pool.calc_withdraw_one_coin(
+                size * 10 ** 18, stable
+            ) == model.base.calc_withdraw_one_coin(size * 10 ** 18, stable)
+
+    for size in (100, 1_000_000):
+        assert pool.calc_withdraw_one_coin(
+            size * 10 ** 18, 0
+        ) == model.meta.calc_withdraw_one_coin(size * 10 ** 18, 0)
@@ -0,0 +1,190 @@
+import brownie
+from brownie import Contract
+from brownie import config
+from brownie.test import strategy as st
+import os
+from state_reader import model_from_chain
+from sim.swaps import FixedRateSwaps
+
+# Hypothesis stateful test: brownie runs long random sequences of deposits, donations, harvests, withdrawals, debtRatio
+# changes and migrations, checks our invariants after every step, and shrinks any failure to the shortest sequence.
+# Every harvest is also predicted by our accounting model in sim/accounting.py. This is much faster on our local mocks
+# (chain_used = 0), but runs on a fork too. Locally we also change keepCRV and turn rewards on and off, so our model
+# checks every trade. Set STATEFUL_EXAMPLES to run more (or fewer) sequences.
+
+STATEFUL_EXAMPLES = int(os.environ.get("STATEFUL_EXAMPLES", 25))
+
+
+class StrategyStateMachine:
+    percent = st("uint256", min_value=1, max_value=100)
+    debt_ratio = st("uint256", max_value=10_000)
+    seconds = st("uint256", min_value=1, max_value=7 * 86400)
+    keep_crv = st("uint256", max_value=10_000)
+    has_rewards = st("bool")
+
+    def __init__(cls, contracts):
+        # this runs once, everything here is reverted to before each new sequence
+        for name, value in contracts.items():
+            setattr(cls, name, value)
+        cls.token.approve(cls.vault, 2 ** 256 - 1, {"from": cls.whale})
+
+        # our mocks trade at fixed prices that FixedRateSwaps copies. the model can't price CRV from a fork, so there we
+        # send it all to our voter and turn off rewards. then only donations are profit.
+        cls.local = hasattr(cls.gauge, "setCrvRate")
+        if cls.local:
+            cls.swaps = FixedRateSwaps(virtual_price=cls.pool.get_virtual_price())
+        else:
+            cls.swaps = None
+            cls.original.setKeepCRV(10_000, {"from": cls.gov})
+            if cls.original.hasRewards():
+                cls.original.updateRewards(False, cls.rewards_token, {"from": cls.gov})
+        cls.original.setDoHealthCheck(False, {"from": cls.gov})
+
+    def setup(self):
+        self.strategy = self.original
+        self.price_per_share = self.vault.pricePerShare()
+
+    def rule_set_keep_crv(self, keep_crv):
+        if self.local:
+            self.strategy.setKeepCRV(keep_crv, {"from": self.gov})
+
+    def rule_toggle_rewards(self, has_rewards):
+        if self.local:
+            self.strategy.updateRewards(
+                has_rewards, self.rewards_token, {"from": self.gov}
+            )
+
+    def rule_deposit(self, percent):
+        to_deposit = self.token.balanceOf(self.whale) * percent // 200
+        self.vault.deposit(to_deposit, {"from": self.whale})
+
+    def rule_donate(self, percent):
+        donation = self.token.balanceOf(self.whale) * percent // 1000
+        self.token.transfer(self.strategy, donation, {"from": self.whale})
+
+    def rule_withdraw(self, percent):
+        shares = self.vault.balanceOf(self.whale) * percent // 100
+        if shares > 0:
+            self.vault.withdraw(shares, {"from": self.whale})
+
+    def rule_change_debt(self, debt_ratio):
+        # leave room for any other strategy in our vault
+        params = self.vault.strategies(self.strategy)
+        available = 10_000 - self.vault.debtRatio() + params["debtRatio"]
+        self.vault.updateStrategyDebtRatio(
+            self.strategy, debt_ratio * available // 10_000, {"from": self.gov}
+        )
+
+    def rule_sleep(self, seconds):
+        brownie.chain.sleep(seconds)
+        brownie.chain.mine(1)
+
+    def rule_harvest(self):
+        brownie.chain.sleep(1)
+        brownie.chain.mine(1)
+
+        # stop our gauge's emissions, so what we read as claimable is exactly what our harvest claims a block later
+        if self.local:
+            crv_rate = self.gauge.crvRate()
+            reward_rate = self.gauge.rewardRate()
+            self.gauge.setCrvRate(0, {"from": self.gov})
+            self.gauge.setRewards(self.rewards_token, 0, {"from": self.gov})
+
+        model = model_from_chain(
+            self.strategy,
+            self.token,
+            self.crv,
+            gas_oracle=self.gasOracle,
+            gauge=self.gauge if self.local else None,
+            swaps=self.swaps,
+        )
+        expected = model.prepare_return(
+            self.vault.debtOutstanding(self.strategy),
+            self.vault.strategies(self.strategy)["totalDebt"],
+        )
+
+        tx = self.strategy.harvest({"from": self.gov})
+        harvested = tx.events["Harvested"]
+        assert harvested["profit"] == expected.profit
+        assert harvested["loss"] == expected.loss == 0
+        assert harvested["debtPayment"] == expected.debt_payment
+        assert self.crv.balanceOf(self.strategy) == model.crv_balance
+
+        if self.local:
+            self.gauge.setCrvRate(crv_rate, {"from": self.gov})
+            self.gauge.setRewards(self.rewards_token, reward_rate, {"from": self.gov})
+
+        # we always deposit everything we have
+        assert self.strategy.balanceOfWant() == 0
+
+    def rule_migrate(self):
+        new_strategy = self.strategist.deploy(
+            self.contract_name,
+            self.vault,
+            self.gauge,
+            self.pool,
+            self.strategy_name,
+        )
+        self.vault.migrateStrategy(self.strategy, new_strategy, {"from": self.gov})
+        self.proxy.approveStrategy(self.gauge, new_strategy, {"from": self.gov})
+        new_strategy.setKeepCRV(self.strategy.keepCRV(), {"from": self.gov})
+        if self.strategy.hasRewards():
+            new_strategy.updateRewards(True, self.rewards_token, {"from": self.gov})
+        new_strategy.setDoHealthCheck(False, {"from": self.gov})
+        assert self.strategy.estimatedTotalAssets() == 0
+        self.strategy = new_strategy
+
+    def invariant_assets_cover_debt(self):
+        assets = self.strategy.estimatedTotalAssets()
+        assert assets >= self.vault.strategies(self.strategy)["totalDebt"]
+
+    def invariant_no_loss(self):
+        assert self.vault.strategies(self.strategy)["totalLoss"] == 0
+        price_per_share = self.vault.pricePerShare()
+        assert price_per_share >= self.price_per_share
+        self.price_per_share = price_per_share
+
+
+def test_stateful(
+    state_machine,
+    gov,
+    token,
+    vault,
+    strategist,
+    whale,
+    strategy,
+    contract_name,
+    gauge,
+    pool,
+    proxy,
+    crv,
+    strategy_name,
+    rewards_token,
+    gasOracle,
+    is_convex,
+):
+    # our migration rule deploys a curve strategy
+    if is_convex:
+        return
+
+    contracts = {
+        "gov": gov,
+        "token": token,
+        "vault": vault,
+        "strategist": strategist,
+        "whale": whale,
+        "original": strategy,
+        "contract_name": contract_name,
+        "gauge": gauge,
+        "pool": pool,
+        "proxy": proxy,
+        "crv": crv,
+        "strategy_name": strategy_name,
+        "rewards_token": rewards_token,
+        "gasOracle": gasOracle,
+    }
+    state_machine(
+        StrategyStateMachine,
+        contracts,
+        settings={"max_examples": STATEFUL_EXAMPLES, "stateful_step_count": 20},
+    )
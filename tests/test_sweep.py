@@ -1,6 +1,10 @@
 import brownie
 from brownie import Contract
 from brownie import config
+from abi_store import load_contract
+
+THREE_POOL = "0xbEbc44782C7dB0a1A60Cb6fe97d0b483032FF1C7"
+DAI = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
 
 # test sweeping out tokens
 def test_sweep(
@@ -35,3 +39,46 @@ def test_sweep(
     # Vault share token doesn't work
     with brownie.reverts("!shares"):
         strategy.sweep(vault.address, {"from": gov})
+
+
+# harvests only deposit our targetStable, so any other stable sent to us sits there until governance sweeps it
+def test_sweep_other_stable(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    chain,
+    amount,
+    accounts,
+    gauge,
+    is_convex,
+    MockERC20,
+):
+    # convex strategies deposit whatever stables they hold
+    if is_convex:
+        return
+
+    token.approve(vault, 2 ** 256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    # sell into usdt, then send ourselves some dai. 3pool holds plenty on a fork, and our local mocks can mint it.
+    strategy.setOptimal(2, {"from": gov})
+    if hasattr(gauge, "setCrvRate"):
+        dai = MockERC20.at(DAI)
+        dai.mint(strategy, 1_000e18, {"from": gov})
+    else:
+        dai = load_contract(DAI)
+        dai.transfer(strategy, 1_000e18, {"from": accounts.at(THREE_POOL, force=True)})
+
+    chain.sleep(1)
+    strategy.setDoHealthCheck(False, {"from": gov})
+    strategy.harvest({"from": gov})
+    assert dai.balanceOf(strategy) == 1_000e18
+
+    before = dai.balanceOf(gov)
+    strategy.sweep(dai, {"from": gov})
+    assert dai.balanceOf(strategy) == 0
+    assert dai.balanceOf(gov) == before + 1_000e18
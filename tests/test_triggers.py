@@ -3,6 +3,8 @@ from brownie import Contract
 from brownie import config
 import math
 
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
 # test our harvest triggers
 def test_triggers(
     gov,
@@ -121,6 +123,27 @@ def test_triggers(
         print("\nShould we harvest? Should be True.", tx)
         assert tx == True
 
+        # or we can harvest once our profit is worth profitFactor times our keeper's gas, instead of at minDelay
+        claimable = strategy.claimableProfitInWant()
+        print("\nClaimable profit in want:", claimable)
+        assert claimable > 0
+        strategy.setHarvestOnProfit(True, {"from": gov})
+        call_cost = 1e16  # 0.01 ETH
+        call_cost_in_want = strategy.ethToWant(call_cost)
+        assert call_cost_in_want > 0
+        strategy.setProfitFactor(claimable // call_cost_in_want // 2, {"from": gov})
+        tx = strategy.harvestTrigger(call_cost, {"from": gov})
+        print("\nShould we harvest? Should be True.", tx)
+        assert tx == True
+        strategy.setProfitFactor(
+            (claimable // call_cost_in_want + 1) * 2, {"from": gov}
+        )
+        tx = strategy.harvestTrigger(call_cost, {"from": gov})
+        print("\nShould we harvest? Should be False.", tx)
+        assert tx == False
+        strategy.setHarvestOnProfit(False, {"from": gov})
+        strategy.setProfitFactor(100, {"from": gov})
+
     # harvest, wait
     chain.sleep(1)
     tx = strategy.harvest({"from": gov})
@@ -143,3 +166,79 @@ def test_triggers(
         )
     else:
         assert token.balanceOf(whale) >= startingWhale
+
+
+# our trigger estimates claimable CRV itself, since mainnet gauges checkpoint in claimable_tokens() and can't be called
+# from a view. check our estimate against the gauge's own number, on mainnet and on our mock gauge, which works the same
+# way. locally we can also pull a sushi pair, to check a reward token without one is just worth nothing to our trigger.
+def test_claimable_profit(
+    gov,
+    token,
+    vault,
+    whale,
+    strategy,
+    gauge,
+    voter,
+    crv,
+    crveth,
+    sushi_router,
+    rewards_token,
+    chain,
+    amount,
+    is_convex,
+):
+    # convex claims through its booster, not our voter
+    if is_convex:
+        return
+
+    token.approve(vault, 2 ** 256 - 1, {"from": whale})
+    vault.deposit(amount, {"from": whale})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    strategy.setKeepCRV(0, {"from": gov})
+    if strategy.hasRewards():
+        strategy.updateRewards(False, rewards_token, {"from": gov})
+    chain.sleep(86400)
+    chain.mine(1)
+
+    weth = Contract.from_abi("WETH", WETH, crv.abi)
+
+    def expected_profit():
+        claimable = gauge.claimable_tokens.call(voter) + crv.balanceOf(strategy)
+        weth_balance = claimable * crveth.price_oracle() // 10 ** 18
+        return strategy.ethToWant(weth_balance + weth.balanceOf(strategy))
+
+    # our mock's rate never changes, but a mainnet gauge's weight can change at the start of each week, after our last
+    # checkpoint
+    local = hasattr(gauge, "setCrvRate")
+    tolerance = 1e-6 if local else 1e-2
+
+    # between checkpoints we add our current rate to what we've earned
+    claimable = strategy.claimableProfitInWant()
+    print("\nClaimable profit in want:", claimable)
+    assert claimable > 0
+    assert math.isclose(claimable, expected_profit(), rel_tol=tolerance)
+
+    # right after a checkpoint, nearly all of it is what we've already earned
+    gauge.claimable_tokens(voter, {"from": gov})
+    assert math.isclose(
+        strategy.claimableProfitInWant(), expected_profit(), rel_tol=tolerance
+    )
+
+    # only our mock router lets us pull a pair
+    if not local:
+        return
+
+    # with no sushi pair for our rewards, we just count them as 0
+    strategy.updateRewards(True, rewards_token, {"from": gov})
+    chain.sleep(3600)
+    chain.mine(1)
+    assert gauge.claimable_reward(voter, rewards_token) > 0
+    sushi_router.setRate(rewards_token, weth, 0, {"from": gov})
+    assert math.isclose(
+        strategy.claimableProfitInWant(), expected_profit(), rel_tol=tolerance
+    )
+    strategy.setHarvestOnProfit(True, {"from": gov})
+    strategy.harvestTrigger(0, {"from": gov})
+    sushi_router.setRate(rewards_token, weth, 5e11, {"from": gov})
+    strategy.setHarvestOnProfit(False, {"from": gov})
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from brownie import web3
+from abi_store import load_contract
+from scripts.uni_snapshot import FACTORY, WETH, snapshot
+
+# differential test of our uniswap v3 model in sim/univ3.py against the quoter on a fork, using the same snapshot our
+# scripts save for offline quotes.
+
+QUOTER = "0xb27308f9F90D607463bb33eA1BeBb41C27CE5AB6"
+USDT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+SIZES = [10 ** 15, 10 ** 18, 10 ** 20, 10 ** 22]
+
+
+def test_univ3_model(multicall, chain):
+    # our local mocks don't have uniswap
+    if len(web3.eth.get_code(FACTORY)) == 0:
+        pytest.skip("no uniswap v3 here")
+
+    pool = load_contract(load_contract(FACTORY).getPool(WETH, USDT, 500))
+    model = snapshot(pool, multicall, 20, chain.height)
+    quoter = load_contract(QUOTER)
+    quotes = model.quote_exact_input(WETH, np.array(SIZES, dtype=object))
+    assert list(quotes) == [
+        quoter.quoteExactInputSingle.call(WETH, USDT, 500, size, 0) for size in SIZES
+    ]
@@ -0,0 +1,131 @@
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from web3 import HTTPProvider, WebsocketProvider
+
+from brownie.network import contract as brownie_contract
+
+# Finds where our suite spends its time: wall time for each test and each fixture setup, plus the count and latency of
+# every JSON-RPC method we send (chain.sleep and chain.mine show up as evm_increaseTime and evm_mine). Contract() lookups
+# that go to Etherscan are counted too, as explorer:<action>.
+# Run with PROFILE_TESTS=1 to print a ranked report at the end and write everything to build/test_profile.json.
+# With -n, each worker writes its own file (test_profile_gw0.json, etc.) and the report isn't printed.
+
+PROFILE_DIR = Path(__file__).parent.parent.joinpath("build")
+REPORT_LENGTH = 15  # rows to print in each section of our report
+
+
+def _new_stats():
+    return {"count": 0, "total": 0.0, "max": 0.0}
+
+
+def _add(stats, elapsed):
+    stats["count"] += 1
+    stats["total"] += elapsed
+    stats["max"] = max(stats["max"], elapsed)
+
+
+class TimingProfiler:
+    def __init__(self):
+        self.tests = defaultdict(_new_stats)
+        self.fixtures = defaultdict(_new_stats)
+        self.rpc = defaultdict(_new_stats)
+        self.rpc_by_test = defaultdict(lambda: defaultdict(_new_stats))
+        self.current = "<collection>"
+        self._patched = []
+
+    # patch at the class level, so we still see calls if the provider is swapped (tenderly) or reconnected
+    def start(self):
+        for provider in (HTTPProvider, WebsocketProvider):
+            self._wrap(provider, "make_request", lambda args: args[1])
+        if hasattr(brownie_contract, "_fetch_from_explorer"):
+            self._wrap(
+                brownie_contract,
+                "_fetch_from_explorer",
+                lambda args: f"explorer:{args[1]}",
+            )
+
+    def stop(self):
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched = []
+
+    def _wrap(self, owner, name, method_name):
+        original = getattr(owner, name)
+        profiler = self
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                profiler.record_rpc(method_name(args), time.perf_counter() - start)
+
+        setattr(owner, name, timed)
+        self._patched.append((owner, name, original))
+
+    def record_rpc(self, method, elapsed):
+        _add(self.rpc[method], elapsed)
+        _add(self.rpc_by_test[self.current][method], elapsed)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.current = item.nodeid
+        start = time.perf_counter()
+        yield
+        _add(self.tests[item.nodeid], time.perf_counter() - start)
+        self.current = "<between tests>"
+
+    # pytest sets up a fixture's dependencies before calling this, so each fixture only gets its own time
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        start = time.perf_counter()
+        yield
+        name = f"{fixturedef.argname} ({fixturedef.scope})"
+        _add(self.fixtures[name], time.perf_counter() - start)
+
+    def results(self):
+        return {
+            "tests": self.tests,
+            "fixtures": self.fixtures,
+            "rpc": self.rpc,
+            "rpc_by_test": self.rpc_by_test,
+        }
+
+    def save(self):
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        file_name = f"test_profile_{worker}.json" if worker else "test_profile.json"
+        PROFILE_DIR.mkdir(exist_ok=True)
+        path = PROFILE_DIR.joinpath(file_name)
+        path.write_text(json.dumps(self.results(), indent=2, sort_keys=True) + "\n")
+        return path
+
+    def pytest_sessionfinish(self):
+        self.stop()
+        self.path = self.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if os.environ.get("PYTEST_XDIST_WORKER"):
+            return
+        write = terminalreporter.write_line
+        terminalreporter.section("timing profile")
+        for title, stats in (
+            ("Slowest tests", self.tests),
+            ("Slowest fixture setups", self.fixtures),
+            ("RPC methods by total time", self.rpc),
+        ):
+            write(f"\n{title}:")
+            write(
+                f"{'total (s)':>10} {'count':>7} {'avg (ms)':>9} {'max (ms)':>9}  name"
+            )
+            ranked = sorted(stats.items(), key=lambda x: x[1]["total"], reverse=True)
+            for name, stat in ranked[:REPORT_LENGTH]:
+                average = stat["total"] / stat["count"] * 1000
+                write(
+                    f"{stat['total']:>10.2f} {stat['count']:>7} {average:>9.1f} {stat['max'] * 1000:>9.1f}  {name}"
+                )
+        write(f"\nFull timing profile written to {self.path}")